@@ -5,19 +5,29 @@ Comprehensive data pipeline for MLB, NFL, NCAA, HS, NIL, and International leagu
 """
 
 import json
+import argparse
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 import hashlib
 import logging
 from pathlib import Path
 import time
 from dataclasses import dataclass, asdict
 import os
-from jsonschema import validate, ValidationError
+import sys
+from urllib.parse import urlsplit
 import numpy as np
 
+# Repository root for the shared ingestion package
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from ingestion.scoring_registry import registry
+from ingestion.rate_limiter import get_rate_limiter
+from ingestion.columnar_store import write_columnar, link_latest
+from ingestion.schema_validator import get_player_validator, format_error
+from ingestion.team_registry import team_index
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,10 +35,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger('blaze-ingestion')
 
-# Load unified schema for validation
+# Unified schema for validation (compiled once, see ingestion/schema_validator.py)
 SCHEMA_PATH = Path('./blaze-unified-schema.json')
-with open(SCHEMA_PATH, 'r') as f:
-    UNIFIED_SCHEMA = json.load(f)
+
+# Players are validated one at a time as they arrive; errors logged in the summary
+MAX_LOGGED_VALIDATION_ERRORS = 20
 
 # API Configuration
 API_CONFIG = {
@@ -41,9 +52,14 @@ API_CONFIG = {
             'roster': '/teams/{team_id}/roster',
             'player': '/people/{player_id}',
             'stats': '/people/{player_id}/stats?stats=season&group=hitting,pitching&season=2025',
+            'people': '/people',
             'injuries': '/injuries?sportId=1',
             'prospects': '/prospects?sportId=1&season=2025'
-        }
+        },
+        # Stats hydrated into /people responses, fetched people_batch_size at a time
+        'people_hydrate': 'stats(group=[hitting,pitching],type=[season],season=2025)',
+        'people_batch_size': 50,
+        'max_concurrency': 8
     },
     'NFL': {
         'base_url': 'https://api.sportsdata.io/v3/nfl',
@@ -121,38 +137,19 @@ class Player:
     recruiting: Optional[Dict] = None
     meta: Optional[Dict] = None
 
-class RateLimiter:
-    """Rate limiting for API calls"""
-    def __init__(self, calls: int, period: int):
-        self.calls = calls
-        self.period = period
-        self.timestamps = []
-    
-    async def wait(self):
-        """Wait if rate limit would be exceeded"""
-        now = time.time()
-        self.timestamps = [t for t in self.timestamps if now - t < self.period]
-        
-        if len(self.timestamps) >= self.calls:
-            sleep_time = self.period - (now - self.timestamps[0]) + 0.1
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-                await self.wait()
-        
-        self.timestamps.append(now)
-
 class BaseIngestionAgent:
     """Base class for league-specific ingestion agents"""
     
     def __init__(self, league: str, config: Dict):
         self.league = league
         self.config = config
-        self.rate_limiter = RateLimiter(
-            config['rate_limit']['calls'],
-            config['rate_limit']['period']
-        )
+        # Shared per-host token buckets; config limits apply to hosts without one
+        self.rate_limiter = get_rate_limiter()
+        self.rate = config['rate_limit']['calls'] / config['rate_limit']['period']
+        self.burst = config['rate_limit']['calls']
         self.session = None
         self.cache = {}
+        self.on_player: Optional[Callable[[Player], None]] = None  # Called as each player is built
         self.metrics = {
             'processed': 0,
             'errors': 0,
@@ -163,13 +160,16 @@ class BaseIngestionAgent:
         self.session = aiohttp.ClientSession()
         return self
     
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.__aclose__()
+    
     async def __aclose__(self):
         if self.session:
             await self.session.close()
     
     async def fetch(self, url: str, params: Optional[Dict] = None) -> Dict:
         """Fetch data from API with rate limiting"""
-        await self.rate_limiter.wait()
+        await self.rate_limiter.acquire_async(urlsplit(url).hostname or '', self.rate, self.burst)
         
         try:
             async with self.session.get(url, params=params) as response:
@@ -181,6 +181,13 @@ class BaseIngestionAgent:
             self.metrics['errors'] += 1
             raise
     
+    def collect(self, players: List[Player], player: Player):
+        """Add a finished player and hand it to the on_player listener"""
+        players.append(player)
+        self.metrics['processed'] += 1
+        if self.on_player:
+            self.on_player(player)
+    
     def generate_player_id(self, league: str, team: str, identifier: str) -> str:
         """Generate consistent player ID"""
         return f"{league}-{team}-{hashlib.md5(identifier.encode()).hexdigest()[:8].upper()}"
@@ -195,7 +202,8 @@ class MLBIngestionAgent(BaseIngestionAgent):
     async def ingest(self) -> List[Player]:
         """Ingest MLB data from Stats API and Baseball Savant"""
         logger.info("Starting MLB ingestion")
-        players = []
+        # Bounds in-flight requests; the rate limiter paces them
+        semaphore = asyncio.Semaphore(self.config['max_concurrency'])
         
         # Get all teams
         teams_url = f"{self.config['base_url']}{self.config['endpoints']['teams']}"
@@ -208,24 +216,27 @@ class MLBIngestionAgent(BaseIngestionAgent):
         # Sort to process priority teams first
         teams.sort(key=lambda t: t['abbreviation'] not in priority_teams)
         
-        for team in teams:  # Process ALL 30 MLB teams
+        # Get ALL 30 rosters concurrently
+        rosters = await asyncio.gather(*(self.fetch_roster(team, semaphore) for team in teams))
+        
+        # Get stats for every rostered player in hydrated batches
+        person_ids = [
+            entry['person']['id']
+            for roster in rosters
+            for entry in roster
+        ]
+        people = await self.fetch_people(person_ids, semaphore)
+        
+        players = []
+        for team, roster in zip(teams, rosters):
             team_abbr = team['abbreviation']
-            team_id = team['id']
             
-            # Get roster
-            roster_url = f"{self.config['base_url']}{self.config['endpoints']['roster'].format(team_id=team_id)}"
-            roster_data = await self.fetch(roster_url)
-            
-            for roster_entry in roster_data.get('roster', []):  # Process ALL players on roster
-                person = roster_entry.get('person', {})
+            for roster_entry in roster:  # Process ALL players on roster
+                person = dict(roster_entry.get('person', {}), **people.get(roster_entry['person']['id'], {}))
                 player_id = self.generate_player_id('MLB', team_abbr, str(person['id']))
                 
-                # Get player stats
-                stats_url = f"{self.config['base_url']}{self.config['endpoints']['stats'].format(player_id=person['id'])}"
-                stats_data = await self.fetch(stats_url)
-                
                 # Parse stats
-                mlb_stats = self.parse_mlb_stats(stats_data)
+                mlb_stats = self.parse_mlb_stats(person)
                 
                 # Calculate HAV-F
                 hav_f = await self.calculate_havf(mlb_stats, person, team)
@@ -235,7 +246,7 @@ class MLBIngestionAgent(BaseIngestionAgent):
                     name=person.get('fullName', ''),
                     sport='MLB',
                     league='MLB',
-                    team_id=f"MLB-{team_abbr}",
+                    team_id=team_index.team_id('MLB', team_abbr),
                     position=roster_entry.get('position', {}).get('abbreviation', ''),
                     jersey_number=roster_entry.get('jerseyNumber'),
                     bio={
@@ -253,14 +264,44 @@ class MLBIngestionAgent(BaseIngestionAgent):
                     }
                 )
                 
-                players.append(player)
-                self.metrics['processed'] += 1
+                self.collect(players, player)
                 
-                if self.metrics['processed'] % 10 == 0:
+                if self.metrics['processed'] % 100 == 0:
                     logger.info(f"Processed {self.metrics['processed']} MLB players")
         
         return players
     
+    async def fetch_roster(self, team: Dict, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Get one team's roster"""
+        roster_url = f"{self.config['base_url']}{self.config['endpoints']['roster'].format(team_id=team['id'])}"
+        async with semaphore:
+            roster_data = await self.fetch(roster_url)
+        return roster_data.get('roster', [])
+    
+    async def fetch_people(self, person_ids: List[int], semaphore: asyncio.Semaphore) -> Dict[int, Dict]:
+        """
+        Get bio and season stats for many players, one /people request per
+        batch of ids (stats hydrated into each person)
+        """
+        batch_size = self.config['people_batch_size']
+        batches = [person_ids[i:i + batch_size] for i in range(0, len(person_ids), batch_size)]
+        people_url = f"{self.config['base_url']}{self.config['endpoints']['people']}"
+        
+        async def fetch_batch(batch: List[int]) -> List[Dict]:
+            params = {
+                'personIds': ','.join(str(person_id) for person_id in batch),
+                'hydrate': self.config['people_hydrate']
+            }
+            async with semaphore:
+                try:
+                    data = await self.fetch(people_url, params=params)
+                except Exception:
+                    return []  # Players keep their roster details without stats
+            return data.get('people', [])
+        
+        results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        return {person['id']: person for people in results for person in people}
+    
     def parse_mlb_stats(self, stats_data: Dict) -> Dict:
         """Parse MLB stats from API response"""
         stats = {}
@@ -290,40 +331,14 @@ class MLBIngestionAgent(BaseIngestionAgent):
     
     async def calculate_havf(self, stats: Dict, player: Dict, team: Dict) -> Dict:
         """Calculate HAV-F metrics for MLB player"""
-        # Simplified HAV-F calculation
-        champion_readiness = 50.0
-        cognitive_leverage = 50.0
-        nil_trust_score = 30.0
-        
-        # Performance-based adjustments
-        if stats.get('ops'):
-            ops = float(stats['ops']) if stats['ops'] else 0
-            champion_readiness += min(20, (ops - 0.700) * 100)
-        
-        if stats.get('era'):
-            era = float(stats['era']) if stats['era'] else 4.0
-            champion_readiness += min(20, (4.0 - era) * 10)
-        
-        # Position-based cognitive leverage
-        position_cognitive = {
-            'C': 70, 'SS': 65, '2B': 60, 'CF': 55,
-            'P': 60, '3B': 50, '1B': 45, 'LF': 40, 'RF': 40
-        }
+        # Simplified HAV-F calculation (weights in ingestion/scoring_registry.py)
+        ops = float(stats['ops']) if stats.get('ops') else None
+        era = float(stats['era']) if stats.get('era') else None
         position = player.get('primaryPosition', {}).get('abbreviation', '')
-        cognitive_leverage = position_cognitive.get(position, 50)
-        
-        # Calculate composite
-        composite = (champion_readiness * 0.4 + 
-                    cognitive_leverage * 0.35 + 
-                    nil_trust_score * 0.25)
         
-        return {
-            'champion_readiness': round(champion_readiness, 1),
-            'cognitive_leverage': round(cognitive_leverage, 1),
-            'nil_trust_score': round(nil_trust_score, 1),
-            'composite_score': round(composite, 1),
-            'computed_at': datetime.now().isoformat()
-        }
+        scores = registry.score('MLB', {'ops': ops, 'era': era, 'position': position})
+        scores['computed_at'] = datetime.now().isoformat()
+        return scores
     
     def inches_to_cm(self, height_str: str) -> Optional[float]:
         """Convert height string to cm"""
@@ -384,7 +399,7 @@ class NFLIngestionAgent(BaseIngestionAgent):
                     name=athlete.get('fullName', ''),
                     sport='NFL',
                     league='NFL',
-                    team_id=f"NFL-{team_abbr}",
+                    team_id=team_index.team_id('NFL', team_abbr),
                     position=position,
                     jersey_number=athlete.get('jersey'),
                     bio={
@@ -401,8 +416,7 @@ class NFLIngestionAgent(BaseIngestionAgent):
                     }
                 )
                 
-                players.append(player)
-                self.metrics['processed'] += 1
+                self.collect(players, player)
         
         logger.info(f"Processed {self.metrics['processed']} NFL players")
         return players
@@ -418,26 +432,9 @@ class NFLIngestionAgent(BaseIngestionAgent):
     def calculate_nfl_havf(self, stats: Dict, position: str) -> Dict:
         """Calculate HAV-F for NFL player"""
         # Position-based baseline scores
-        position_baselines = {
-            'QB': {'cr': 70, 'cl': 85, 'nil': 80},
-            'RB': {'cr': 65, 'cl': 50, 'nil': 60},
-            'WR': {'cr': 60, 'cl': 55, 'nil': 70},
-            'TE': {'cr': 55, 'cl': 60, 'nil': 50},
-            'OL': {'cr': 60, 'cl': 70, 'nil': 30},
-            'DL': {'cr': 65, 'cl': 60, 'nil': 40},
-            'LB': {'cr': 65, 'cl': 70, 'nil': 50},
-            'DB': {'cr': 60, 'cl': 65, 'nil': 55}
-        }
-        
-        baseline = position_baselines.get(position, {'cr': 50, 'cl': 50, 'nil': 40})
-        
-        return {
-            'champion_readiness': baseline['cr'],
-            'cognitive_leverage': baseline['cl'],
-            'nil_trust_score': baseline['nil'],
-            'composite_score': round(baseline['cr'] * 0.4 + baseline['cl'] * 0.35 + baseline['nil'] * 0.25, 1),
-            'computed_at': datetime.now().isoformat()
-        }
+        scores = registry.score('NFL', {'position': position})
+        scores['computed_at'] = datetime.now().isoformat()
+        return scores
     
     def parse_height(self, height_str: str) -> Optional[float]:
         """Parse height string to cm"""
@@ -488,8 +485,11 @@ class NCAAIngestionAgent(BaseIngestionAgent):
             async with self.session.get(roster_url, headers=headers) as response:
                 roster_data = await response.json()
             
+            school = team_index.resolve(team['school'], 'NCAA')
+            team_code = school.code if school else team['school'][:3].upper()
+            
             for athlete in roster_data[:10]:  # Limit players per team
-                player_id = self.generate_player_id('NCAA-FB', team['school'][:3].upper(), str(athlete.get('id', athlete['first_name'])))
+                player_id = self.generate_player_id('NCAA-FB', team_code, str(athlete.get('id', athlete['first_name'])))
                 
                 # Calculate HAV-F with recruiting data
                 hav_f = self.calculate_ncaa_havf(athlete)
@@ -499,7 +499,7 @@ class NCAAIngestionAgent(BaseIngestionAgent):
                     name=f"{athlete.get('first_name', '')} {athlete.get('last_name', '')}",
                     sport='NCAA-FB',
                     league='NCAA',
-                    team_id=f"NCAA-{team['school'][:3].upper()}",
+                    team_id=f"NCAA-{team_code}",
                     position=athlete.get('position', ''),
                     jersey_number=athlete.get('jersey', ''),
                     bio={
@@ -519,51 +519,23 @@ class NCAAIngestionAgent(BaseIngestionAgent):
                     }
                 )
                 
-                players.append(player)
-                self.metrics['processed'] += 1
+                self.collect(players, player)
         
         logger.info(f"Processed {self.metrics['processed']} NCAA players")
         return players
     
     def calculate_ncaa_havf(self, athlete: Dict) -> Dict:
         """Calculate HAV-F for NCAA player"""
-        # Base scores
-        champion_readiness = 40.0
-        cognitive_leverage = 45.0
-        nil_trust_score = 20.0
-        
-        # Recruiting adjustments
-        stars = athlete.get('recruit_rating', {}).get('stars', 0)
-        if stars:
-            champion_readiness += stars * 8
-            nil_trust_score += stars * 10
-        
-        # Class year adjustments
-        year_multiplier = {
-            'Senior': 1.2,
-            'Junior': 1.0,
-            'Sophomore': 0.8,
-            'Freshman': 0.6
+        # Recruiting, class year and position adjustments
+        inputs = {
+            'stars': athlete.get('recruit_rating', {}).get('stars', 0),
+            'year': athlete.get('year', ''),
+            'position': athlete.get('position')
         }
-        multiplier = year_multiplier.get(athlete.get('year', ''), 1.0)
-        champion_readiness *= multiplier
         
-        # Position adjustments
-        if athlete.get('position') == 'QB':
-            cognitive_leverage += 15
-            nil_trust_score += 20
-        
-        composite = (champion_readiness * 0.4 + 
-                    cognitive_leverage * 0.35 + 
-                    nil_trust_score * 0.25)
-        
-        return {
-            'champion_readiness': round(champion_readiness, 1),
-            'cognitive_leverage': round(cognitive_leverage, 1),
-            'nil_trust_score': round(nil_trust_score, 1),
-            'composite_score': round(composite, 1),
-            'computed_at': datetime.now().isoformat()
-        }
+        scores = registry.score('NCAA-FB', inputs)
+        scores['computed_at'] = datetime.now().isoformat()
+        return scores
     
     def inches_to_cm(self, height_str: str) -> Optional[float]:
         """Convert height to cm"""
@@ -582,10 +554,15 @@ class NCAAIngestionAgent(BaseIngestionAgent):
         except:
             return None
 
+# Seconds before still-running leagues are cancelled
+INGESTION_DEADLINE_S = 1800
+
 class UnifiedIngestionPipeline:
     """Main pipeline orchestrating all league ingestions"""
     
-    def __init__(self):
+    def __init__(self, compact: bool = False):
+        # compact: columnar player table, rosters as player IDs (ingestion/columnar_store.py)
+        self.compact = compact
         self.agents = {
             'MLB': MLBIngestionAgent('MLB', API_CONFIG['MLB']),
             'NFL': NFLIngestionAgent('NFL', API_CONFIG['NFL']),
@@ -594,69 +571,92 @@ class UnifiedIngestionPipeline:
         self.output_dir = Path('./data/unified')
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    async def run(self, leagues: Optional[List[str]] = None):
-        """Run ingestion for specified leagues"""
+    async def run(self, leagues: Optional[List[str]] = None, deadline: Optional[float] = INGESTION_DEADLINE_S):
+        """
+        Run ingestion for specified leagues concurrently. A failing league is
+        logged and skipped; leagues still running after deadline seconds are
+        cancelled and keep the players gathered so far.
+        """
         if not leagues:
             leagues = list(self.agents.keys())
         
         all_players = []
+        player_records = []
         all_teams = {}
-        
+        league_metrics = {}
+        validation_errors = []
+        player_validator = get_player_validator(str(SCHEMA_PATH), definition='player')
+        
+        def add_player(player: Player):
+            record = asdict(player)
+            all_players.append(player)
+            player_records.append(record)
+            validation_errors.extend(player_validator.errors(record))
+            
+            # Group by team as players arrive
+            team_id = player.team_id
+            if team_id not in all_teams:
+                team = team_index.by_id(team_id)
+                all_teams[team_id] = {
+                    'team_id': team_id,
+                    'name': team.name if team else team_id.split('-', 1)[1],
+                    'sport': player.sport,
+                    'league': player.league,
+                    'roster': []
+                }
+            all_teams[team_id]['roster'].append(player.player_id if self.compact else record)
+        
+        tasks = {}
         for league in leagues:
             if league not in self.agents:
                 logger.warning(f"No agent configured for {league}")
                 continue
             
-            logger.info(f"Processing {league}")
             agent = self.agents[league]
-            
-            async with agent as a:
-                try:
-                    players = await a.ingest()
-                    all_players.extend(players)
-                    
-                    # Group by team
-                    for player in players:
-                        team_id = player.team_id
-                        if team_id not in all_teams:
-                            all_teams[team_id] = {
-                                'team_id': team_id,
-                                'name': team_id.split('-')[1],
-                                'sport': player.sport,
-                                'league': player.league,
-                                'roster': []
-                            }
-                        all_teams[team_id]['roster'].append(asdict(player))
-                    
-                    logger.info(f"✓ {league}: {len(players)} players from {len(set(p.team_id for p in players))} teams")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to ingest {league}: {e}")
+            agent.on_player = add_player
+            tasks[league] = asyncio.create_task(self.run_league(league, agent, league_metrics))
+        
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
         # Prepare final dataset
+        generated_at = datetime.now()
         dataset = {
             'version': '2.0.0',
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at.isoformat(),
             'teams': list(all_teams.values()),
-            'players': [asdict(p) for p in all_players]
+            'players': player_records
         }
         
-        # Validate against schema
-        try:
-            validate(instance=dataset, schema=UNIFIED_SCHEMA)
+        # Players were validated as they arrived; check the dataset envelope once
+        envelope_errors = get_player_validator(str(SCHEMA_PATH)).errors(dict(dataset, teams=[], players=[]))
+        validation_errors = envelope_errors + validation_errors
+        if validation_errors:
+            invalid_players = len({error['player_id'] for error in validation_errors if error['player_id']})
+            logger.warning(f"Schema validation: {len(validation_errors)} errors across {invalid_players} players")
+            for error in validation_errors[:MAX_LOGGED_VALIDATION_ERRORS]:
+                logger.warning(f"  {format_error(error)}")
+        else:
             logger.info("✓ Dataset validates against unified schema")
-        except ValidationError as e:
-            logger.warning(f"Schema validation warning: {e.message}")
         
         # Save to files
-        output_file = self.output_dir / f"unified_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(dataset, f, indent=2)
-        
-        # Also save latest version
-        latest_file = self.output_dir / "unified_data_latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(dataset, f, indent=2)
+        stamp = generated_at.strftime('%Y%m%d_%H%M%S')
+        if self.compact:
+            output_file = self.output_dir / f"unified_data_{stamp}.columns"
+            write_columnar(str(output_file), dataset['players'], dataset['teams'],
+                           {'version': dataset['version'], 'generated_at': dataset['generated_at']})
+            latest_file = self.output_dir / "unified_data_latest.columns"
+        else:
+            output_file = self.output_dir / f"unified_data_{stamp}.json"
+            with open(output_file, 'w') as f:
+                json.dump(dataset, f, indent=2)
+            latest_file = self.output_dir / "unified_data_latest.json"
+        
+        # Latest version links to this run instead of a second copy
+        link_latest(str(output_file), str(latest_file))
         
         # Generate summary
         summary = {
@@ -668,6 +668,8 @@ class UnifiedIngestionPipeline:
                 league: len([p for p in all_players if p.league == league])
                 for league in set(p.league for p in all_players)
             },
+            'league_metrics': league_metrics,
+            'validation_errors': validation_errors,
             'havf_stats': self.calculate_havf_stats(all_players),
             'output_file': str(output_file)
         }
@@ -676,6 +678,10 @@ class UnifiedIngestionPipeline:
         with open(summary_file, 'w') as f:
             json.dump(summary, f, indent=2)
         
+        league_lines = '\n'.join(
+            f"  • {league}: {m['status']}, {m['wall_clock_s']}s, {m['api_calls']} API calls, {m['errors']} errors"
+            for league, m in league_metrics.items()
+        )
         logger.info(f"""
 ╔══════════════════════════════════════════════════════╗
 ║         INGESTION PIPELINE COMPLETE                  ║
@@ -687,6 +693,9 @@ class UnifiedIngestionPipeline:
   • Teams: {len(all_teams)}
   • Output: {output_file.name}
 
+⏱️ By League:
+{league_lines}
+
 📈 HAV-F Averages:
   • Champion Readiness: {summary['havf_stats']['avg_champion_readiness']:.1f}
   • Cognitive Leverage: {summary['havf_stats']['avg_cognitive_leverage']:.1f}
@@ -697,6 +706,28 @@ class UnifiedIngestionPipeline:
         
         return summary
     
+    async def run_league(self, league: str, agent: BaseIngestionAgent, league_metrics: Dict):
+        """Ingest one league, recording its status, wall-clock time and API calls"""
+        logger.info(f"Processing {league}")
+        start = time.perf_counter()
+        status = 'failed'
+        
+        try:
+            async with agent as a:
+                players = await a.ingest()
+            status = 'ok'
+            logger.info(f"✓ {league}: {len(players)} players from {len(set(p.team_id for p in players))} teams")
+        except asyncio.CancelledError:
+            status = 'timed_out'
+            logger.error(f"{league} ingestion cancelled at deadline after {agent.metrics['processed']} players")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to ingest {league}: {e}")
+        finally:
+            league_metrics[league] = dict(agent.metrics, status=status,
+                                          wall_clock_s=round(time.perf_counter() - start, 2))
+            logger.info(f"{league}: {agent.metrics['api_calls']} API calls in {league_metrics[league]['wall_clock_s']}s")
+    
     def calculate_havf_stats(self, players: List[Player]) -> Dict:
         """Calculate HAV-F statistics across all players"""
         havf_scores = {
@@ -723,7 +754,12 @@ class UnifiedIngestionPipeline:
 
 async def main():
     """Main execution"""
-    pipeline = UnifiedIngestionPipeline()
+    parser = argparse.ArgumentParser(description='Blaze Intelligence multi-league ingestion')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write a columnar dataset (rosters reference player IDs)')
+    args = parser.parse_args()
+    
+    pipeline = UnifiedIngestionPipeline(compact=args.compact)
     
     # Run for all configured leagues
     await pipeline.run(['MLB', 'NFL', 'NCAA'])
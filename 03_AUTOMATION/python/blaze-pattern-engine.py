@@ -15,14 +15,14 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory, stream_with_context
 from flask_cors import CORS
 import sqlite3
 from pathlib import Path
 import threading
 import time
 import hashlib
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 import statistics
 from sklearn.cluster import KMeans, DBSCAN
 from sklearn.preprocessing import StandardScaler
@@ -32,9 +32,21 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from textblob import TextBlob
 import matplotlib.pyplot as plt
 import seaborn as sns
-from bs4 import BeautifulSoup
 import requests
 
+from pattern_store import PatternStore, PATTERN_DB_PATH, DEFAULT_PAGE_SIZE, content_digest, content_id, file_digest
+from html_extractor import extract_document, read_chunks
+from job_queue import JobQueue, JobCancelled, QueueFull
+
+# Recent analysis runs kept in memory (all runs are persisted)
+HISTORY_WINDOW = 100
+
+# Analysis jobs: concurrent runs and how many may wait for a worker
+ANALYSIS_WORKERS = int(os.getenv('BLAZE_ANALYSIS_WORKERS', '2'))
+MAX_PENDING_JOBS = int(os.getenv('BLAZE_MAX_PENDING_JOBS', '16'))
+DEFAULT_SOURCE = 'blaze_os'
+SSE_KEEPALIVE_SECONDS = 15
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -68,7 +80,7 @@ class AnalyticsInsight:
 class BlazePatternEngine:
     """Advanced pattern recognition and analytics engine"""
     
-    def __init__(self, port=8080):
+    def __init__(self, port=8080, db_path=PATTERN_DB_PATH):
         self.port = port
         self.app = Flask(__name__, template_folder='templates', static_folder='static')
         CORS(self.app)
@@ -79,17 +91,20 @@ class BlazePatternEngine:
         self.insight_generator = InsightGenerator()
         self.visualization_engine = VisualizationEngine()
         
-        # Data storage
-        self.patterns_db = {}
-        self.insights_cache = {}
-        self.analytics_history = []
+        # Data storage: SQLite with a full-text index, mirrored in memory for the API
+        self.pattern_store = PatternStore(db_path)
+        self.patterns_db = self.pattern_store.patterns()
+        self.insights_cache = self.pattern_store.insights()
+        # Guards the in-memory mirrors: analysis jobs write them while request threads read
+        self._results_lock = threading.Lock()
+        self.analytics_history = deque(self.pattern_store.history(HISTORY_WINDOW), maxlen=HISTORY_WINDOW)
         
         # Setup routes
         self._setup_routes()
         
-        # Initialize background processing
-        self.processing_thread = None
-        self.is_processing = False
+        # Analysis jobs run on a bounded worker pool, one per named source document
+        self.sources = {DEFAULT_SOURCE: self.data_processor.blaze_os_path}
+        self.jobs = JobQueue(max_workers=ANALYSIS_WORKERS, max_pending=MAX_PENDING_JOBS)
         
         logger.info(f"Blaze Pattern Engine initialized on port {port}")
 
@@ -99,166 +114,284 @@ class BlazePatternEngine:
         @self.app.route('/')
         def dashboard():
             """Main analytics dashboard"""
+            patterns, insights = self._results_snapshot()
             return render_template('dashboard.html', 
-                                 patterns_count=len(self.patterns_db),
-                                 insights_count=len(self.insights_cache))
+                                 patterns_count=len(patterns),
+                                 insights_count=len(insights))
         
         @self.app.route('/api/patterns')
         def get_patterns():
             """Get all discovered patterns"""
+            patterns, _ = self._results_snapshot()
             return jsonify({
-                'patterns': list(self.patterns_db.values()),
-                'total_count': len(self.patterns_db),
+                'patterns': list(patterns.values()),
+                'total_count': len(patterns),
                 'last_updated': datetime.now().isoformat()
             })
         
         @self.app.route('/api/insights')
         def get_insights():
             """Get strategic insights"""
+            _, insights = self._results_snapshot()
             return jsonify({
-                'insights': list(self.insights_cache.values()),
-                'total_count': len(self.insights_cache),
+                'insights': list(insights.values()),
+                'total_count': len(insights),
                 'categories': self._get_insight_categories()
             })
         
         @self.app.route('/api/process', methods=['POST'])
         def trigger_processing():
-            """Trigger pattern analysis processing"""
-            if not self.is_processing:
-                self.start_pattern_analysis()
-                return jsonify({'status': 'processing_started', 'message': 'Pattern analysis initiated'})
-            else:
-                return jsonify({'status': 'already_processing', 'message': 'Analysis already in progress'})
+            """Queue a pattern analysis job (?source=<name>, ?full=true re-runs unchanged stages)"""
+            source = request.args.get('source', DEFAULT_SOURCE)
+            if source not in self.sources:
+                return jsonify({'status': 'unknown_source', 'message': f"No source named {source}"}), 404
+            try:
+                job = self.start_pattern_analysis(source, full=request.args.get('full', 'false').lower() == 'true')
+            except QueueFull as e:
+                return jsonify({'status': 'queue_full', 'message': str(e)}), 429
+            return jsonify({'status': 'queued', 'job_id': job.job_id, 'message': 'Pattern analysis queued',
+                            'events': f"/api/jobs/{job.job_id}/events"}), 202
+        
+        @self.app.route('/api/jobs')
+        def list_jobs():
+            """Known analysis jobs (?status= to filter)"""
+            jobs = self.jobs.jobs(request.args.get('status'))
+            return jsonify({'jobs': [job.to_dict() for job in jobs], 'counts': self.jobs.counts()})
+        
+        @self.app.route('/api/jobs/<job_id>')
+        def get_job(job_id):
+            """Status, current stage and result of one job"""
+            job = self.jobs.get(job_id)
+            if job is None:
+                return jsonify({'status': 'not_found', 'message': f"No job {job_id}"}), 404
+            return jsonify(job.to_dict())
+        
+        @self.app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+        def cancel_job(job_id):
+            """Cancel a queued job, or stop a running one at its next stage"""
+            job = self.jobs.cancel(job_id)
+            if job is None:
+                return jsonify({'status': 'not_found', 'message': f"No job {job_id}"}), 404
+            return jsonify(job.to_dict())
+        
+        @self.app.route('/api/jobs/<job_id>/events')
+        def job_events(job_id):
+            """Server-sent events: status and stage progress until the job finishes"""
+            job = self.jobs.get(job_id)
+            if job is None:
+                return jsonify({'status': 'not_found', 'message': f"No job {job_id}"}), 404
+            # Resume after the last event the client saw
+            last_seen = request.headers.get('Last-Event-ID', type=int)
+            after = (request.args.get('after', -1, type=int) if last_seen is None else last_seen) + 1
+            
+            def stream():
+                for event in job.follow(after, timeout=SSE_KEEPALIVE_SECONDS):
+                    if event is None:
+                        yield ": keep-alive\n\n"
+                    else:
+                        yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+            
+            return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
         
         @self.app.route('/api/status')
         def get_status():
             """Get engine status"""
+            job_counts = self.jobs.counts()
+            patterns, insights = self._results_snapshot()
             return jsonify({
-                'status': 'processing' if self.is_processing else 'idle',
-                'patterns_discovered': len(self.patterns_db),
-                'insights_generated': len(self.insights_cache),
+                'status': 'processing' if job_counts['running'] or job_counts['queued'] else 'idle',
+                'jobs': job_counts,
+                'patterns_discovered': len(patterns),
+                'insights_generated': len(insights),
                 'last_analysis': self.analytics_history[-1] if self.analytics_history else None,
                 'uptime': self._get_uptime()
             })
         
         @self.app.route('/api/search/<query>')
         def search_patterns(query):
-            """Search patterns and insights"""
-            results = self._search_analytics(query)
+            """Search patterns and insights (ranked; ?limit=&offset= to page)"""
+            results = self._search_analytics(query,
+                                             limit=request.args.get('limit', DEFAULT_PAGE_SIZE, type=int),
+                                             offset=request.args.get('offset', 0, type=int))
             return jsonify(results)
         
         @self.app.route('/visualizations/<viz_type>')
         def get_visualization(viz_type):
             """Generate and return visualizations"""
-            viz_data = self.visualization_engine.generate_visualization(viz_type, self.patterns_db)
+            patterns, _ = self._results_snapshot()
+            viz_data = self.visualization_engine.generate_visualization(viz_type, patterns)
             return jsonify(viz_data)
 
-    def start_pattern_analysis(self):
-        """Start background pattern analysis"""
-        if self.processing_thread and self.processing_thread.is_alive():
-            return
-        
-        self.processing_thread = threading.Thread(target=self._run_pattern_analysis)
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
-        
-        logger.info("Pattern analysis started in background thread")
+    def register_source(self, name: str, path: str):
+        """Make another document (e.g. a tenant's OS export) available to analysis jobs"""
+        self.sources[name] = path
 
-    def _run_pattern_analysis(self):
-        """Main pattern analysis loop"""
-        self.is_processing = True
+    def start_pattern_analysis(self, source: str = DEFAULT_SOURCE, full: bool = False):
+        """Queue a pattern analysis job for a source (full re-runs every stage); returns the job"""
+        job = self.jobs.submit(self._run_pattern_analysis, source=source, full=full)
+        logger.info(f"Pattern analysis job {job.job_id} queued for {source}")
+        return job
+
+    def _source_hash(self, source: str) -> Optional[str]:
+        """Hash of a source document; re-read only when its size or mtime changes"""
+        path = self.sources[source]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        fingerprint = f"{stat.st_size}:{stat.st_mtime_ns}"
+        source_hash = self.pattern_store.get_stage(f"{source}:source", fingerprint)
+        if source_hash is None:
+            source_hash = file_digest(path)
+            self.pattern_store.put_stage(f"{source}:source", fingerprint, source_hash)
+        return source_hash
+
+    def _cached_stage(self, job, stage: str, input_hash: Optional[str], compute, skipped: List[str]):
+        """Output of compute(), or the cached output when stage already ran on input_hash"""
+        job.progress(stage)
+        key = f"{job.params['source']}:{stage}"
+        if input_hash is not None and not job.params['full']:
+            cached = self.pattern_store.get_stage(key, input_hash)
+            if cached is not None:
+                logger.info(f"⏭️ {stage}: input unchanged, reusing cached output")
+                skipped.append(stage)
+                return cached
+        
+        output = compute()
+        # Empty output (e.g. unreadable source) is not worth caching
+        if input_hash is not None and output:
+            self.pattern_store.put_stage(key, input_hash, output)
+        return output
+
+    def _run_pattern_analysis(self, job) -> Dict[str, Any]:
+        """Main pattern analysis for one job; stages whose input is unchanged are skipped"""
+        source = job.params['source']
         start_time = datetime.now()
+        skipped = []
         
         try:
-            logger.info("🧠 Starting comprehensive pattern analysis...")
+            logger.info(f"🧠 Starting comprehensive pattern analysis of {source} (job {job.job_id})...")
+            job.progress('source')
+            source_hash = self._source_hash(source)
             
             # Stage 1: Data ingestion and processing
             logger.info("📊 Stage 1: Processing Blaze Intelligence OS data...")
-            raw_data = self.data_processor.process_blaze_os_file()
+            extraction_timings = {}
+            
+            def extract():
+                data, timings = self.data_processor.process_blaze_os_file(self.sources[source])
+                extraction_timings.update(timings)
+                return data
+            
+            raw_data = self._cached_stage(job, 'extract', source_hash, extract, skipped)
+            data_hash = content_digest(raw_data)
             
             # Stage 2: Pattern detection
             logger.info("🔍 Stage 2: Detecting hidden patterns...")
-            patterns = self.pattern_detector.discover_patterns(raw_data)
+            pattern_records = self._cached_stage(
+                job, 'detect', data_hash,
+                lambda: [asdict(p) for p in self.pattern_detector.discover_patterns(raw_data)], skipped
+            )
+            patterns = [PatternDiscovery(**record) for record in pattern_records]
             
-            # Stage 3: Insight generation
+            # Stage 3: Insight generation (pattern IDs are content-derived)
             logger.info("💡 Stage 3: Generating strategic insights...")
-            insights = self.insight_generator.generate_insights(patterns, raw_data)
+            insights_hash = content_digest([data_hash, [p.pattern_id for p in patterns]])
+            insight_records = self._cached_stage(
+                job, 'insights', insights_hash,
+                lambda: [asdict(i) for i in self.insight_generator.generate_insights(patterns, raw_data)], skipped
+            )
+            insights = [AnalyticsInsight(**record) for record in insight_records]
             
             # Stage 4: Store results
-            self._store_analysis_results(patterns, insights)
+            self._cached_stage(job, 'store', insights_hash,
+                               lambda: self._store_analysis_results(patterns, insights), skipped)
             
             # Stage 5: Generate visualizations
             logger.info("📈 Stage 5: Creating visualizations...")
+            job.progress('visualize')
             self.visualization_engine.generate_dashboard_viz(patterns, insights)
             
             analysis_duration = (datetime.now() - start_time).total_seconds()
             
-            self.analytics_history.append({
+            summary = {
                 'timestamp': datetime.now().isoformat(),
+                'job_id': job.job_id,
+                'source': source,
                 'patterns_discovered': len(patterns),
                 'insights_generated': len(insights),
                 'duration_seconds': analysis_duration,
+                'source_hash': source_hash,
+                'stages_skipped': skipped,
+                'extraction_timings': extraction_timings,
                 'status': 'completed'
-            })
+            }
+            self._record_history(summary)
             
             logger.info(f"✅ Pattern analysis completed in {analysis_duration:.2f} seconds")
             logger.info(f"   - Patterns discovered: {len(patterns)}")
             logger.info(f"   - Insights generated: {len(insights)}")
+            return summary
             
+        except JobCancelled:
+            logger.info(f"🛑 Pattern analysis job {job.job_id} cancelled at {job.stage}")
+            self._record_history({
+                'timestamp': datetime.now().isoformat(),
+                'job_id': job.job_id,
+                'source': source,
+                'status': 'cancelled',
+                'stage': job.stage
+            })
+            raise
+        
         except Exception as e:
             logger.error(f"❌ Pattern analysis failed: {str(e)}")
-            self.analytics_history.append({
+            self._record_history({
                 'timestamp': datetime.now().isoformat(),
+                'job_id': job.job_id,
+                'source': source,
                 'status': 'failed',
                 'error': str(e)
             })
-        
-        finally:
-            self.is_processing = False
-
-    def _store_analysis_results(self, patterns: List[PatternDiscovery], insights: List[AnalyticsInsight]):
-        """Store analysis results in memory and cache"""
-        # Store patterns
-        for pattern in patterns:
-            self.patterns_db[pattern.pattern_id] = asdict(pattern)
-        
-        # Store insights
-        for insight in insights:
-            self.insights_cache[insight.insight_id] = asdict(insight)
+            raise
+
+    def _store_analysis_results(self, patterns: List[PatternDiscovery], insights: List[AnalyticsInsight]) -> Dict[str, int]:
+        """Store analysis results in the pattern store (indexed for search) and memory"""
+        pattern_records = [asdict(pattern) for pattern in patterns]
+        insight_records = [asdict(insight) for insight in insights]
+        self.pattern_store.upsert_patterns(pattern_records)
+        self.pattern_store.upsert_insights(insight_records)
+        
+        with self._results_lock:
+            # Store patterns
+            for pattern in pattern_records:
+                self.patterns_db[pattern['pattern_id']] = pattern
+            
+            # Store insights
+            for insight in insight_records:
+                self.insights_cache[insight['insight_id']] = insight
         
         logger.info(f"Stored {len(patterns)} patterns and {len(insights)} insights")
+        return {'patterns': len(patterns), 'insights': len(insights)}
+
+    def _record_history(self, entry: Dict[str, Any]):
+        """Persist an analysis run; the most recent runs stay in memory"""
+        self.pattern_store.append_history(entry)
+        self.analytics_history.append(entry)
+
+    def _results_snapshot(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Copies of the pattern and insight mirrors, safe to iterate while jobs store results"""
+        with self._results_lock:
+            return dict(self.patterns_db), dict(self.insights_cache)
 
     def _get_insight_categories(self) -> Dict[str, int]:
         """Get insight categories and counts"""
-        categories = defaultdict(int)
-        for insight in self.insights_cache.values():
-            categories[insight['category']] += 1
-        return dict(categories)
-
-    def _search_analytics(self, query: str) -> Dict[str, Any]:
-        """Search patterns and insights"""
-        query_lower = query.lower()
-        
-        matching_patterns = []
-        for pattern in self.patterns_db.values():
-            if (query_lower in pattern['description'].lower() or 
-                query_lower in pattern['pattern_type'].lower() or
-                any(query_lower in insight.lower() for insight in pattern['insights'])):
-                matching_patterns.append(pattern)
-        
-        matching_insights = []
-        for insight in self.insights_cache.values():
-            if (query_lower in insight['description'].lower() or
-                query_lower in insight['category'].lower() or
-                any(query_lower in rec.lower() for rec in insight['actionable_recommendations'])):
-                matching_insights.append(insight)
-        
-        return {
-            'query': query,
-            'patterns': matching_patterns,
-            'insights': matching_insights,
-            'total_matches': len(matching_patterns) + len(matching_insights)
-        }
+        return self.pattern_store.insight_categories()
+
+    def _search_analytics(self, query: str, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> Dict[str, Any]:
+        """Search patterns and insights through the full-text index"""
+        return self.pattern_store.search(query, limit=limit, offset=offset)
 
     def _get_uptime(self) -> str:
         """Get engine uptime"""
@@ -280,320 +413,28 @@ class DataProcessor:
     
     def __init__(self):
         self.blaze_os_path = "/Users/AustinHumphrey/Library/Mobile Documents/com~apple~CloudDocs/Austin Humphrey/🔥 Blaze Intelligence OS — Championship Sports Analytics.htm"
-        self.processed_data = {}
         
-    def process_blaze_os_file(self) -> Dict[str, Any]:
-        """Process the comprehensive Blaze Intelligence OS file"""
+    def process_blaze_os_file(self, path: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Process the comprehensive Blaze Intelligence OS file (or another export
+        at path). Returns the extracted data and seconds spent per extractor.
+        """
         logger.info("📄 Processing Blaze Intelligence OS data...")
         
         try:
-            with open(self.blaze_os_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
+            # One streaming traversal feeds every extractor
+            extracted_data, timings = extract_document(read_chunks(path or self.blaze_os_path))
             
-            # Extract structured data
-            extracted_data = {
-                'metadata': self._extract_metadata(soup),
-                'components': self._extract_components(soup),
-                'analytics': self._extract_analytics_data(soup),
-                'visualizations': self._extract_visualization_data(soup),
-                'javascript': self._extract_javascript_patterns(content),
-                'styles': self._extract_style_patterns(soup),
-                'performance_metrics': self._extract_performance_data(soup),
-                'user_interactions': self._extract_interaction_patterns(soup),
-                'data_flows': self._extract_data_flow_patterns(content)
-            }
-            
-            self.processed_data = extracted_data
             logger.info(f"✅ Processed {len(extracted_data)} data categories")
+            logger.info("⏱️ Extraction timings: " + ", ".join(
+                f"{name} {seconds * 1000:.1f}ms" for name, seconds in timings.items()
+            ))
             
-            return extracted_data
+            return extracted_data, timings
             
         except Exception as e:
             logger.error(f"❌ Error processing Blaze OS file: {str(e)}")
-            return {}
-
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract metadata and configuration"""
-        metadata = {
-            'title': soup.title.string if soup.title else 'Unknown',
-            'description': '',
-            'keywords': [],
-            'libraries': [],
-            'css_variables': {},
-            'responsive_breakpoints': []
-        }
-        
-        # Extract meta tags
-        for meta in soup.find_all('meta'):
-            if meta.get('name') == 'description':
-                metadata['description'] = meta.get('content', '')
-            elif meta.get('name') == 'keywords':
-                metadata['keywords'] = meta.get('content', '').split(',')
-        
-        # Extract linked libraries
-        for link in soup.find_all('link', rel='stylesheet'):
-            href = link.get('href', '')
-            if href:
-                metadata['libraries'].append(href)
-        
-        for script in soup.find_all('script', src=True):
-            src = script.get('src', '')
-            if src:
-                metadata['libraries'].append(src)
-        
-        # Extract CSS variables
-        style_tags = soup.find_all('style')
-        for style_tag in style_tags:
-            content = style_tag.string or ''
-            css_vars = re.findall(r'--([^:]+):\s*([^;]+);', content)
-            for var_name, var_value in css_vars:
-                metadata['css_variables'][var_name.strip()] = var_value.strip()
-        
-        return metadata
-
-    def _extract_components(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract UI components and their characteristics"""
-        components = {
-            'sections': [],
-            'interactive_elements': [],
-            'data_displays': [],
-            'navigation': []
-        }
-        
-        # Extract sections
-        for section in soup.find_all(['section', 'div'], class_=True):
-            classes = section.get('class', [])
-            if any('section' in cls.lower() for cls in classes):
-                components['sections'].append({
-                    'classes': classes,
-                    'id': section.get('id', ''),
-                    'child_count': len(section.find_all()),
-                    'text_content_length': len(section.get_text().strip())
-                })
-        
-        # Extract interactive elements
-        interactive_tags = ['button', 'input', 'select', 'textarea', 'a']
-        for tag in interactive_tags:
-            for element in soup.find_all(tag):
-                components['interactive_elements'].append({
-                    'tag': tag,
-                    'classes': element.get('class', []),
-                    'id': element.get('id', ''),
-                    'text': element.get_text().strip()[:100]
-                })
-        
-        # Extract data display elements
-        for canvas in soup.find_all('canvas'):
-            components['data_displays'].append({
-                'type': 'canvas',
-                'id': canvas.get('id', ''),
-                'classes': canvas.get('class', [])
-            })
-        
-        for chart_elem in soup.find_all(['div', 'canvas'], class_=lambda x: x and 'chart' in ' '.join(x).lower()):
-            components['data_displays'].append({
-                'type': 'chart',
-                'classes': chart_elem.get('class', []),
-                'id': chart_elem.get('id', '')
-            })
-        
-        return components
-
-    def _extract_analytics_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract analytics and metrics data patterns"""
-        analytics = {
-            'metrics_mentioned': [],
-            'data_sources': [],
-            'kpis': [],
-            'sports_entities': [],
-            'performance_indicators': []
-        }
-        
-        text_content = soup.get_text().lower()
-        
-        # Common sports analytics metrics
-        metrics_patterns = [
-            r'(\d+\.?\d*%)\s*(accuracy|precision|recall|f1)',
-            r'(\d+\.?\d*)\s*(seconds?|ms|milliseconds?)\s*response',
-            r'(\d+\.?\d*%)\s*(improvement|increase|reduction|decrease)',
-            r'(\d+)\s*(teams?|players?|leagues?|games?)',
-            r'(\$\d+\.?\d*[kmb]?)\s*(revenue|cost|savings|value)'
-        ]
-        
-        for pattern in metrics_patterns:
-            matches = re.finditer(pattern, text_content)
-            for match in matches:
-                analytics['metrics_mentioned'].append(match.group(0))
-        
-        # Sports entities
-        sports_entities = ['cardinals', 'titans', 'longhorns', 'grizzlies', 'mlb', 'nfl', 'nba', 'ncaa']
-        for entity in sports_entities:
-            if entity in text_content:
-                analytics['sports_entities'].append(entity)
-        
-        # Data sources
-        data_source_patterns = ['api', 'database', 'stream', 'feed', 'integration']
-        for source in data_source_patterns:
-            if source in text_content:
-                analytics['data_sources'].append(source)
-        
-        return analytics
-
-    def _extract_visualization_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract visualization patterns and configurations"""
-        visualizations = {
-            'chart_types': [],
-            'color_schemes': [],
-            'three_js_scenes': [],
-            'interactive_elements': []
-        }
-        
-        # Extract Three.js related content
-        scripts = soup.find_all('script')
-        for script in scripts:
-            content = script.string or ''
-            if 'three.js' in content.lower() or 'THREE.' in content:
-                # Extract Three.js patterns
-                three_patterns = re.findall(r'new THREE\.(\w+)', content)
-                visualizations['three_js_scenes'].extend(three_patterns)
-        
-        # Extract color schemes from CSS
-        style_content = ''
-        for style in soup.find_all('style'):
-            style_content += style.string or ''
-        
-        color_patterns = re.findall(r'#[0-9a-fA-F]{3,6}|rgb\([^)]+\)|rgba\([^)]+\)', style_content)
-        visualizations['color_schemes'] = color_patterns
-        
-        return visualizations
-
-    def _extract_javascript_patterns(self, content: str) -> Dict[str, Any]:
-        """Extract JavaScript patterns and functionality"""
-        js_patterns = {
-            'frameworks': [],
-            'apis_used': [],
-            'event_handlers': [],
-            'data_processing': []
-        }
-        
-        # Extract framework usage
-        frameworks = ['React', 'Vue', 'Angular', 'jQuery', 'Chart.js', 'Three.js', 'D3']
-        for framework in frameworks:
-            if framework in content:
-                js_patterns['frameworks'].append(framework)
-        
-        # Extract API calls
-        api_patterns = re.findall(r'fetch\([^)]+\)|axios\.|XMLHttpRequest|\.get\(|\.post\(', content)
-        js_patterns['apis_used'] = api_patterns[:10]  # Limit results
-        
-        # Extract event handlers
-        event_patterns = re.findall(r'addEventListener\([^)]+\)|on\w+\s*=', content)
-        js_patterns['event_handlers'] = event_patterns[:10]
-        
-        return js_patterns
-
-    def _extract_style_patterns(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract styling patterns and themes"""
-        styles = {
-            'layout_methods': [],
-            'animations': [],
-            'responsive_design': [],
-            'color_themes': []
-        }
-        
-        style_content = ''
-        for style_tag in soup.find_all('style'):
-            style_content += style_tag.string or ''
-        
-        # Layout methods
-        layout_patterns = ['flexbox', 'grid', 'float', 'position']
-        for pattern in layout_patterns:
-            if pattern in style_content.lower():
-                styles['layout_methods'].append(pattern)
-        
-        # Animations
-        animation_patterns = re.findall(r'@keyframes\s+(\w+)|animation:|transition:', style_content)
-        styles['animations'] = [p for p in animation_patterns if p]
-        
-        # Responsive design
-        media_queries = re.findall(r'@media[^{]+', style_content)
-        styles['responsive_design'] = media_queries
-        
-        return styles
-
-    def _extract_performance_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract performance-related data and metrics"""
-        performance = {
-            'optimization_techniques': [],
-            'loading_strategies': [],
-            'caching_mechanisms': []
-        }
-        
-        # Look for performance optimization patterns
-        text = soup.get_text().lower()
-        
-        performance_keywords = [
-            'lazy loading', 'code splitting', 'compression', 'minification',
-            'caching', 'cdn', 'optimization', 'performance'
-        ]
-        
-        for keyword in performance_keywords:
-            if keyword in text:
-                performance['optimization_techniques'].append(keyword)
-        
-        return performance
-
-    def _extract_interaction_patterns(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract user interaction patterns"""
-        interactions = {
-            'user_flows': [],
-            'input_methods': [],
-            'feedback_mechanisms': []
-        }
-        
-        # Extract forms and inputs
-        forms = soup.find_all('form')
-        for form in forms:
-            inputs = form.find_all(['input', 'select', 'textarea'])
-            interactions['input_methods'].extend([inp.get('type', inp.name) for inp in inputs])
-        
-        # Extract buttons and clickable elements
-        clickable = soup.find_all(['button', 'a'], class_=True)
-        for elem in clickable:
-            classes = elem.get('class', [])
-            if any('btn' in cls or 'button' in cls for cls in classes):
-                interactions['feedback_mechanisms'].append('button_interaction')
-        
-        return interactions
-
-    def _extract_data_flow_patterns(self, content: str) -> Dict[str, Any]:
-        """Extract data flow and processing patterns"""
-        data_flows = {
-            'data_sources': [],
-            'processing_steps': [],
-            'output_formats': []
-        }
-        
-        # Extract data source references
-        source_patterns = [
-            r'api\..*\.com', r'database\.\w+', r'stream\.\w+',
-            r'feed\.\w+', r'cdn\.\w+'
-        ]
-        
-        for pattern in source_patterns:
-            matches = re.findall(pattern, content.lower())
-            data_flows['data_sources'].extend(matches)
-        
-        # Extract processing indicators
-        processing_keywords = ['filter', 'transform', 'aggregate', 'analyze', 'compute']
-        for keyword in processing_keywords:
-            if keyword in content.lower():
-                data_flows['processing_steps'].append(keyword)
-        
-        return data_flows
+            return {}, {}
 
 class PatternDetector:
     """Advanced pattern detection using machine learning"""
@@ -641,7 +482,7 @@ class PatternDetector:
                 max_complexity = max(complexity_scores)
                 
                 pattern = PatternDiscovery(
-                    pattern_id=f"temporal_complexity_{int(time.time())}",
+                    pattern_id=content_id("temporal_complexity", complexity_scores),
                     pattern_type="temporal",
                     confidence_score=0.85,
                     description=f"Component complexity pattern: Average {avg_complexity:.1f} children, max {max_complexity}",
@@ -678,7 +519,7 @@ class PatternDetector:
                 correlation_ratio = component_count / library_count
                 
                 pattern = PatternDiscovery(
-                    pattern_id=f"correlation_lib_comp_{int(time.time())}",
+                    pattern_id=content_id("correlation_lib_comp", library_count, component_count),
                     pattern_type="correlation",
                     confidence_score=0.78,
                     description=f"Library-Component correlation: {correlation_ratio:.2f} components per library",
@@ -716,7 +557,7 @@ class PatternDetector:
                 
                 if len(color_vars) > 10:  # Anomaly: Too many color variables
                     pattern = PatternDiscovery(
-                        pattern_id=f"anomaly_color_vars_{int(time.time())}",
+                        pattern_id=content_id("anomaly_color_vars", css_vars),
                         pattern_type="anomaly",
                         confidence_score=0.72,
                         description=f"Unusual color variable count: {len(color_vars)} color-related CSS variables",
@@ -758,7 +599,7 @@ class PatternDetector:
                 most_common_tag = max(tag_clusters.items(), key=lambda x: x[1])
                 
                 pattern = PatternDiscovery(
-                    pattern_id=f"cluster_interactions_{int(time.time())}",
+                    pattern_id=content_id("cluster_interactions", tag_clusters),
                     pattern_type="cluster",
                     confidence_score=0.88,
                     description=f"Interaction clustering: {most_common_tag[0]} elements dominate with {most_common_tag[1]} instances",
@@ -797,7 +638,7 @@ class PatternDetector:
                 primary_entities = entity_counts.most_common(3)
                 
                 pattern = PatternDiscovery(
-                    pattern_id=f"semantic_sports_{int(time.time())}",
+                    pattern_id=content_id("semantic_sports", entity_counts),
                     pattern_type="semantic",
                     confidence_score=0.92,
                     description=f"Sports focus pattern: Primary entities {', '.join([e[0] for e in primary_entities])}",
@@ -861,7 +702,7 @@ class InsightGenerator:
             
             if avg_complexity > 10:  # High complexity threshold
                 insight = AnalyticsInsight(
-                    insight_id=f"perf_complexity_{int(time.time())}",
+                    insight_id=content_id("perf_complexity", pattern.pattern_id),
                     category="performance",
                     priority="high",
                     impact_score=8.5,
@@ -892,7 +733,7 @@ class InsightGenerator:
             dominant_type = pattern.metrics.get('dominant_type', 'unknown')
             
             insight = AnalyticsInsight(
-                insight_id=f"ux_interaction_{int(time.time())}",
+                insight_id=content_id("ux_interaction", pattern.pattern_id),
                 category="user_experience",
                 priority="medium",
                 impact_score=7.2,
@@ -926,7 +767,7 @@ class InsightGenerator:
                 top_entity = max(primary_entities.items(), key=lambda x: x[1])
                 
                 insight = AnalyticsInsight(
-                    insight_id=f"biz_market_focus_{int(time.time())}",
+                    insight_id=content_id("biz_market_focus", pattern.pattern_id),
                     category="market",
                     priority="critical",
                     impact_score=9.1,
@@ -978,7 +819,7 @@ class InsightGenerator:
                 ]
             
             insight = AnalyticsInsight(
-                insight_id=f"tech_libraries_{int(time.time())}",
+                insight_id=content_id("tech_libraries", pattern.pattern_id),
                 category="technical",
                 priority=priority,
                 impact_score=impact,
@@ -1388,8 +1229,13 @@ def create_dashboard_template():
                 const result = await response.json();
                 console.log('Processing triggered:', result);
                 
-                // Poll for completion
-                pollStatus();
+                if (!result.job_id) {
+                    statusEl.textContent = 'Busy';
+                    return;
+                }
+                
+                // Follow the job's stage progress
+                followJob(result);
             } catch (error) {
                 console.error('Error triggering processing:', error);
                 statusEl.textContent = 'Error';
@@ -1397,6 +1243,32 @@ def create_dashboard_template():
             }
         }
 
+        function followJob(job) {
+            const statusEl = document.getElementById('status');
+            const events = new EventSource(job.events);
+            
+            events.addEventListener('stage', (event) => {
+                const progress = JSON.parse(event.data);
+                statusEl.textContent = `Processing: ${progress.stage}`;
+            });
+            
+            events.addEventListener('status', (event) => {
+                const progress = JSON.parse(event.data);
+                if (['completed', 'failed', 'cancelled'].includes(progress.status)) {
+                    events.close();
+                    statusEl.textContent = progress.status === 'completed' ? 'Ready' : progress.status;
+                    statusEl.className = progress.status === 'failed' ? 'status error' : 'status idle';
+                    refreshData();
+                }
+            });
+            
+            // Fall back to polling if the stream drops
+            events.onerror = () => {
+                events.close();
+                pollStatus();
+            };
+        }
+
         async function pollStatus() {
             const statusEl = document.getElementById('status');
             
@@ -4,20 +4,26 @@ Blaze Sports Data Aggregator (2025)
 Unifies team data from multiple leagues into a standardized JSON format.
 """
 
+import sys
 import json
 import csv
 import hashlib
+import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+# Repository root for the shared ingestion package
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from ingestion.team_registry import team_index
 
 def generate_team_id(league: str, team_name: str) -> str:
-    """Generate a consistent team_id from league and team name."""
+    """Fallback team_id from league and team name, for teams not in the registry."""
     combined = f"{league}:{team_name}"
     return hashlib.md5(combined.encode()).hexdigest()[:12]
 
 def extract_market_from_team(team_name: str) -> str:
-    """Extract market/city from team name."""
+    """Extract market/city from team name (fallback for teams not in the registry)."""
     # Common patterns for extracting market
     if " " in team_name:
         # For teams like "St. Louis Cardinals", "New York Yankees"
@@ -30,7 +36,7 @@ def extract_market_from_team(team_name: str) -> str:
     return team_name
 
 def create_aliases(team_name: str, market: str) -> List[str]:
-    """Generate common aliases for a team."""
+    """Generate common aliases for a team (fallback for teams not in the registry)."""
     aliases = []
     
     # Add market name if different from team name
@@ -50,207 +56,192 @@ def create_aliases(team_name: str, market: str) -> List[str]:
     
     return list(set(aliases))  # Remove duplicates
 
-def process_mlb_teams(file_path: str) -> List[Dict[str, Any]]:
-    """Process MLB teams JSON file."""
-    with open(file_path, 'r') as f:
-        teams = json.load(f)
-    
-    processed = []
-    for team in teams:
-        team_name = team['team']
-        market = extract_market_from_team(team_name)
-        
-        processed_team = {
-            "league": "MLB",
-            "team_id": generate_team_id("MLB", team_name),
-            "team_name": team_name,
-            "level": "Professional",
-            "conference": None,
-            "division": None,  # Could be added later (AL/NL, divisions)
-            "market": market,
-            "aliases": create_aliases(team_name, market),
-            "last_updated_iso": datetime.utcnow().isoformat() + "Z"
-        }
-        processed.append(processed_team)
-    
-    return processed
+# Source files and how their records map onto unified teams.
+# records_key: key holding the team list (None when the file is a list)
+# registry_league: team_registry league the names are resolved against
+SOURCES = [
+    {"key": "mlb", "file": "mlb_teams.json", "league": "MLB", "registry_league": "MLB", "level": "Professional",
+     "records_key": None, "conference_field": None, "label": "📊 MLB"},
+    {"key": "nfl", "file": "nfl_teams.json", "league": "NFL", "registry_league": "NFL", "level": "Professional",
+     "records_key": None, "conference_field": None, "label": "🏈 NFL"},
+    {"key": "fcs", "file": "fcs_teams.json", "league": "NCAA FCS", "registry_league": "NCAA", "level": "College",
+     "records_key": None, "conference_field": "conference", "label": "🏆 NCAA FCS"},
+    {"key": "fbs", "file": "fbs_power_conferences_2025.json", "league": "NCAA FBS", "registry_league": "NCAA",
+     "level": "College", "records_key": "flat", "conference_field": "conference", "label": "🎓 NCAA FBS"}
+]
 
-def process_nfl_teams(file_path: str) -> List[Dict[str, Any]]:
-    """Process NFL teams JSON file."""
-    with open(file_path, 'r') as f:
-        teams = json.load(f)
-    
-    processed = []
-    for team in teams:
-        team_name = team['team']
-        market = extract_market_from_team(team_name)
-        
-        processed_team = {
-            "league": "NFL",
-            "team_id": generate_team_id("NFL", team_name),
-            "team_name": team_name,
-            "level": "Professional",
-            "conference": None,
-            "division": None,  # Could be added later (AFC/NFC, divisions)
-            "market": market,
-            "aliases": create_aliases(team_name, market),
-            "last_updated_iso": datetime.utcnow().isoformat() + "Z"
-        }
-        processed.append(processed_team)
-    
-    return processed
+# Bump when processed team records change so saved state is discarded
+STATE_VERSION = 1
+
+REQUIRED_FIELDS = ["league", "team_id", "team_name", "level", "last_updated_iso"]
+
+
+def process_source(source: Dict[str, Any], data: Any, batch_timestamp: str) -> List[Dict[str, Any]]:
+    """Unified team records for one source file's parsed JSON."""
+    records = data[source["records_key"]] if source["records_key"] else data
+    league = source["league"]
+    conference_field = source["conference_field"]
 
-def process_fcs_teams(file_path: str) -> List[Dict[str, Any]]:
-    """Process NCAA FCS teams JSON file."""
-    with open(file_path, 'r') as f:
-        teams = json.load(f)
-    
     processed = []
-    for team in teams:
-        team_name = team['team']
-        market = extract_market_from_team(team_name)
-        
-        processed_team = {
-            "league": "NCAA FCS",
-            "team_id": generate_team_id("NCAA FCS", team_name),
+    for record in records:
+        team_name = record['team']
+        team = team_index.resolve(team_name, source["registry_league"])
+        if team:
+            # Registry team: canonical ID and identifiers
+            team_id, division = team.team_id, team.division
+            market = team.market or extract_market_from_team(team_name)
+            aliases = [alias for alias in team.aliases if alias != team_name]
+        else:
+            team_id, division = generate_team_id(league, team_name), None
+            market = extract_market_from_team(team_name)
+            aliases = create_aliases(team_name, market)
+        processed.append({
+            "league": league,
+            "team_id": team_id,
             "team_name": team_name,
-            "level": "College",
-            "conference": team['conference'],
-            "division": None,
+            "level": source["level"],
+            "conference": record[conference_field] if conference_field else None,
+            "division": division,
             "market": market,
-            "aliases": create_aliases(team_name, market),
-            "last_updated_iso": datetime.utcnow().isoformat() + "Z"
-        }
-        processed.append(processed_team)
-    
+            "aliases": aliases,
+            "last_updated_iso": batch_timestamp
+        })
+
     return processed
 
-def process_fbs_teams(file_path: str) -> List[Dict[str, Any]]:
-    """Process NCAA FBS power conference teams JSON file."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    processed = []
-    for team_data in data['flat']:
-        team_name = team_data['team']
-        market = extract_market_from_team(team_name)
-        
-        processed_team = {
-            "league": "NCAA FBS",
-            "team_id": generate_team_id("NCAA FBS", team_name),
-            "team_name": team_name,
-            "level": "College",
-            "conference": team_data['conference'],
-            "division": None,
-            "market": market,
-            "aliases": create_aliases(team_name, market),
-            "last_updated_iso": datetime.utcnow().isoformat() + "Z"
+def load_state(state_path: Path) -> Dict[str, Any]:
+    """Per-source fingerprints and teams from the previous run (empty for another STATE_VERSION)."""
+    try:
+        with open(state_path, 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {"sources": {}}
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {"sources": {}}
+    return state
+
+def load_sources(input_files: Dict[str, Path], state: Dict[str, Any],
+                 batch_timestamp: str, full: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Load every source file in one pass. Sources whose mtime and size, or
+    failing that content hash, match the previous run reuse its teams;
+    only changed files are parsed and re-processed.
+    """
+    previous = state.get("sources", {})
+    entries = {}
+
+    for source in SOURCES:
+        path = input_files[source["key"]]
+        stat = path.stat()
+        cached = None if full else previous.get(source["key"])
+
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            entries[source["key"]] = dict(cached, changed=False)
+            continue
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cached and cached["sha256"] == digest:
+            # Touched but not modified
+            entries[source["key"]] = dict(cached, mtime_ns=stat.st_mtime_ns, changed=False)
+            continue
+
+        entries[source["key"]] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "teams": process_source(source, json.loads(raw), batch_timestamp),
+            "changed": True
         }
-        processed.append(processed_team)
-    
-    return processed
 
-def validate_data(teams: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Validate the aggregated data and return summary statistics."""
+    return entries
+
+def save_state(state_path: Path, entries: Dict[str, Dict[str, Any]]):
+    sources = {
+        key: {field: value for field, value in entry.items() if field != "changed"}
+        for key, entry in entries.items()
+    }
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"version": STATE_VERSION, "sources": sources}, f, ensure_ascii=False)
+    tmp_path.replace(state_path)
+
+def aggregate(teams: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Deduplicate, validate and sort in a single pass over a hash index
+    keyed by (league, team_id). Returns the unified teams and the
+    validation report.
+    """
     validation_report = {
-        "total_teams": len(teams),
+        "total_teams": 0,
         "leagues": {},
         "conferences": {},
         "issues": []
     }
-    
-    seen_team_ids = set()
-    
+
+    index = {}
     for team in teams:
-        # Check required fields
-        required_fields = ["league", "team_id", "team_name", "level", "last_updated_iso"]
-        for field in required_fields:
-            if field not in team or team[field] is None:
-                validation_report["issues"].append(f"Missing {field} for team: {team.get('team_name', 'UNKNOWN')}")
-        
-        # Check for duplicate team_ids
         team_id = team.get("team_id")
-        if team_id in seen_team_ids:
+        key = (team.get("league"), team_id)
+        if key in index:
             validation_report["issues"].append(f"Duplicate team_id: {team_id}")
-        seen_team_ids.add(team_id)
-        
-        # Count by league
-        league = team.get("league", "UNKNOWN")
+            continue
+        index[key] = team
+
+        # Check required fields
+        for field in REQUIRED_FIELDS:
+            if team.get(field) is None:
+                validation_report["issues"].append(f"Missing {field} for team: {team.get('team_name', 'UNKNOWN')}")
+
+        # Count by league and conference
+        league = team.get("league") or "UNKNOWN"
         validation_report["leagues"][league] = validation_report["leagues"].get(league, 0) + 1
-        
-        # Count by conference
         conference = team.get("conference")
         if conference:
             validation_report["conferences"][conference] = validation_report["conferences"].get(conference, 0) + 1
-    
-    return validation_report
 
-def deduplicate_and_sort(teams: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Remove duplicates and sort by league then team_name."""
-    # Remove duplicates based on (league, team_id)
-    seen = set()
-    deduplicated = []
-    
-    for team in teams:
-        key = (team["league"], team["team_id"])
-        if key not in seen:
-            seen.add(key)
-            deduplicated.append(team)
-    
     # Sort by league, then team_name
-    deduplicated.sort(key=lambda x: (x["league"], x["team_name"]))
-    
-    return deduplicated
+    unified = sorted(index.values(), key=lambda x: (x["league"], x["team_name"]))
+    validation_report["total_teams"] = len(unified)
 
-def main():
-    """Main aggregation function."""
-    print("🏟️  Blaze Sports Data Aggregator - Starting aggregation...")
-    
-    # Input file paths
-    base_path = Path.home() / "Library/Mobile Documents/com~apple~CloudDocs/Austin Humphrey/BI"
-    
-    input_files = {
-        "mlb": base_path / "mlb_teams.json",
-        "nfl": base_path / "nfl_teams.json", 
-        "fcs": base_path / "fcs_teams.json",
-        "fbs": base_path / "fbs_power_conferences_2025.json"
-    }
+    return unified, validation_report
+
+def run_aggregation(base_path: Path, output_path: Path, full: bool = False) -> Optional[Dict[str, Any]]:
+    """Aggregate source files under base_path into output_path (None when a file is missing)."""
+    input_files = {source["key"]: base_path / source["file"] for source in SOURCES}
     
     # Check if all files exist
     for name, path in input_files.items():
         if not path.exists():
             print(f"❌ ERROR: {name} file not found at {path}")
-            return
-    
-    # Process each league
-    all_teams = []
+            return None
     
-    print("📊 Processing MLB teams...")
-    all_teams.extend(process_mlb_teams(str(input_files["mlb"])))
+    # One timestamp for every team (re)processed in this batch
+    batch_timestamp = datetime.utcnow().isoformat() + "Z"
+    state_path = output_path.with_name(output_path.stem + ".state.json")
     
-    print("🏈 Processing NFL teams...")
-    all_teams.extend(process_nfl_teams(str(input_files["nfl"])))
+    print("📂 Loading source files...")
+    entries = load_sources(input_files, load_state(state_path), batch_timestamp, full=full)
+    for source in SOURCES:
+        entry = entries[source["key"]]
+        status = "processed" if entry["changed"] else "unchanged, reused"
+        print(f"  {source['label']}: {len(entry['teams'])} teams ({status})")
     
-    print("🏆 Processing NCAA FCS teams...")
-    all_teams.extend(process_fcs_teams(str(input_files["fcs"])))
-    
-    print("🎓 Processing NCAA FBS teams...")
-    all_teams.extend(process_fbs_teams(str(input_files["fbs"])))
-    
-    # Deduplicate and sort
-    print("🔄 Deduplicating and sorting...")
-    all_teams = deduplicate_and_sort(all_teams)
-    
-    # Validate data
-    print("✅ Validating data...")
-    validation_report = validate_data(all_teams)
+    # Deduplicate, validate and sort
+    print("🔄 Deduplicating, validating and sorting...")
+    all_teams, validation_report = aggregate(
+        team for source in SOURCES for team in entries[source["key"]]["teams"]
+    )
     
     # Output unified JSON
-    output_path = Path.cwd() / "blaze-sports-data-2025.json"
-    with open(output_path, 'w') as f:
-        json.dump(all_teams, f, indent=2, ensure_ascii=False)
+    if any(entry["changed"] for entry in entries.values()) or not output_path.exists():
+        with open(output_path, 'w') as f:
+            json.dump(all_teams, f, indent=2, ensure_ascii=False)
+        print(f"✅ Successfully created unified dataset: {output_path}")
+    else:
+        print(f"⏭️  No source changes since the last run: {output_path}")
+    save_state(state_path, entries)
     
-    print(f"✅ Successfully created unified dataset: {output_path}")
     print(f"📈 Total teams: {validation_report['total_teams']}")
     
     # Print league breakdown
@@ -271,7 +262,23 @@ def main():
     else:
         print("\n✅ No validation issues found!")
     
-    return output_path
+    return {"output_path": output_path, "teams": all_teams, "validation": validation_report,
+            "changed": [key for key, entry in entries.items() if entry["changed"]]}
+
+def main():
+    """Main aggregation function."""
+    parser = argparse.ArgumentParser(description='Aggregate league team files into one dataset')
+    parser.add_argument('--input-dir', type=Path,
+                        default=Path.home() / "Library/Mobile Documents/com~apple~CloudDocs/Austin Humphrey/BI",
+                        help='Directory holding the league team files')
+    parser.add_argument('--output', type=Path, default=Path.cwd() / "blaze-sports-data-2025.json",
+                        help='Unified dataset path')
+    parser.add_argument('--full', action='store_true', help='Re-process every source file')
+    args = parser.parse_args()
+    
+    print("🏟️  Blaze Sports Data Aggregator - Starting aggregation...")
+    result = run_aggregation(args.input_dir, args.output, full=args.full)
+    return result["output_path"] if result else None
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Single-pass HTML extraction for the Blaze Intelligence Pattern Engine
+The document is tokenized once (SAX-style, html.parser) and every
+extractor is fed from that one stream of start/end/text events. Shared
+buffers (document text, inline styles and scripts, and the raw source as
+fed, comments and markup included) are collected once and handed to each
+extractor when it builds its result. All regexes are compiled at import.
+"""
+
+import re
+import time
+from html.parser import HTMLParser
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
+
+READ_CHUNK_CHARS = 1 << 16
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+    'source', 'track', 'wbr'
+])
+RAW_TEXT_ELEMENTS = frozenset(['script', 'style'])
+
+CSS_VARIABLE_RE = re.compile(r'--([^:]+):\s*([^;]+);')
+METRIC_RES = [re.compile(pattern) for pattern in [
+    r'(\d+\.?\d*%)\s*(accuracy|precision|recall|f1)',
+    r'(\d+\.?\d*)\s*(seconds?|ms|milliseconds?)\s*response',
+    r'(\d+\.?\d*%)\s*(improvement|increase|reduction|decrease)',
+    r'(\d+)\s*(teams?|players?|leagues?|games?)',
+    r'(\$\d+\.?\d*[kmb]?)\s*(revenue|cost|savings|value)'
+]]
+THREE_OBJECT_RE = re.compile(r'new THREE\.(\w+)')
+COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,6}|rgb\([^)]+\)|rgba\([^)]+\)')
+API_CALL_RE = re.compile(r'fetch\([^)]+\)|axios\.|XMLHttpRequest|\.get\(|\.post\(')
+EVENT_HANDLER_RE = re.compile(r'addEventListener\([^)]+\)|on\w+\s*=')
+ANIMATION_RE = re.compile(r'@keyframes\s+(\w+)|animation:|transition:')
+MEDIA_QUERY_RE = re.compile(r'@media[^{]+')
+DATA_SOURCE_RES = [re.compile(pattern) for pattern in [
+    r'api\..*\.com', r'database\.\w+', r'stream\.\w+', r'feed\.\w+', r'cdn\.\w+'
+]]
+
+SPORTS_ENTITIES = ['cardinals', 'titans', 'longhorns', 'grizzlies', 'mlb', 'nfl', 'nba', 'ncaa']
+DATA_SOURCE_KEYWORDS = ['api', 'database', 'stream', 'feed', 'integration']
+FRAMEWORKS = ['React', 'Vue', 'Angular', 'jQuery', 'Chart.js', 'Three.js', 'D3']
+LAYOUT_KEYWORDS = ['flexbox', 'grid', 'float', 'position']
+PERFORMANCE_KEYWORDS = [
+    'lazy loading', 'code splitting', 'compression', 'minification',
+    'caching', 'cdn', 'optimization', 'performance'
+]
+PROCESSING_KEYWORDS = ['filter', 'transform', 'aggregate', 'analyze', 'compute']
+INTERACTIVE_TAGS = ['button', 'input', 'select', 'textarea', 'a']
+
+
+class Document:
+    """Buffers shared by all extractors, collected during the traversal"""
+
+    def __init__(self):
+        self.text_parts = []    # Text outside script/style
+        self.styles = []        # Inline <style> blocks
+        self.scripts = []       # Inline <script> blocks
+        self.source_parts = []  # Raw document chunks as fed
+        self._text = None
+        self._source = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = ''.join(self.text_parts)
+        return self._text
+
+    @property
+    def lower_text(self) -> str:
+        return self.text.lower()
+
+    @property
+    def style_content(self) -> str:
+        return ''.join(self.styles)
+
+    @property
+    def source(self) -> str:
+        if self._source is None:
+            self._source = ''.join(self.source_parts)
+        return self._source
+
+
+class _TextLength:
+    """len(text.strip()) of a growing text without keeping it"""
+
+    def __init__(self):
+        self.length = self.leading = self.trailing = 0
+        self.seen = False
+
+    def add(self, data: str):
+        self.length += len(data)
+        stripped = data.rstrip()
+        if not stripped:
+            if self.seen:
+                self.trailing += len(data)
+            else:
+                self.leading += len(data)
+            return
+        if not self.seen:
+            self.leading += len(data) - len(data.lstrip())
+            self.seen = True
+        self.trailing = len(data) - len(stripped)
+
+    def stripped(self) -> int:
+        return self.length - self.leading - self.trailing if self.seen else 0
+
+
+class Extractor:
+    """Base visitor; subclasses override the events they need and result()"""
+    name = ''
+
+    def start(self, tag: str, attrs: Dict[str, str], classes: List[str]):
+        pass
+
+    def end(self, tag: str):
+        pass
+
+    def text(self, data: str):
+        pass
+
+    def result(self, document: Document) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class MetadataExtractor(Extractor):
+    name = 'metadata'
+
+    def __init__(self):
+        self.title = None
+        self.in_title = False
+        self.description = ''
+        self.keywords = []
+        self.libraries = []
+
+    def start(self, tag, attrs, classes):
+        if tag == 'title' and self.title is None:
+            self.in_title = True
+            self.title = ''
+        elif tag == 'meta':
+            if attrs.get('name') == 'description':
+                self.description = attrs.get('content', '')
+            elif attrs.get('name') == 'keywords':
+                self.keywords = attrs.get('content', '').split(',')
+        elif tag == 'link' and 'stylesheet' in attrs.get('rel', '').split() and attrs.get('href'):
+            self.libraries.append(attrs['href'])
+        elif tag == 'script' and attrs.get('src'):
+            self.libraries.append(attrs['src'])
+
+    def end(self, tag):
+        if tag == 'title':
+            self.in_title = False
+
+    def text(self, data):
+        if self.in_title:
+            self.title += data
+
+    def result(self, document):
+        css_variables = {}
+        for style in document.styles:
+            for var_name, var_value in CSS_VARIABLE_RE.findall(style):
+                css_variables[var_name.strip()] = var_value.strip()
+
+        return {
+            'title': self.title if self.title is not None else 'Unknown',
+            'description': self.description,
+            'keywords': self.keywords,
+            'libraries': self.libraries,
+            'css_variables': css_variables,
+            'responsive_breakpoints': []
+        }
+
+
+class ComponentsExtractor(Extractor):
+    name = 'components'
+
+    def __init__(self):
+        self.depth = 0
+        self.sections = []
+        self.open_sections = []     # (depth, record, _TextLength)
+        self.interactive = {tag: [] for tag in INTERACTIVE_TAGS}
+        self.open_interactive = []  # (depth, record, text parts)
+        self.canvases = []
+        self.charts = []
+
+    def start(self, tag, attrs, classes):
+        self.depth += 1
+        for _, record, _ in self.open_sections:
+            record['child_count'] += 1
+
+        if tag in ('section', 'div') and 'class' in attrs and any('section' in cls.lower() for cls in classes):
+            record = {'classes': classes, 'id': attrs.get('id', ''), 'child_count': 0, 'text_content_length': 0}
+            self.sections.append(record)
+            self.open_sections.append((self.depth, record, _TextLength()))
+
+        if tag in self.interactive:
+            record = {'tag': tag, 'classes': classes, 'id': attrs.get('id', ''), 'text': ''}
+            self.interactive[tag].append(record)
+            self.open_interactive.append((self.depth, record, []))
+
+        if tag == 'canvas':
+            self.canvases.append({'type': 'canvas', 'id': attrs.get('id', ''), 'classes': classes})
+        if tag in ('div', 'canvas') and classes and 'chart' in ' '.join(classes).lower():
+            self.charts.append({'type': 'chart', 'classes': classes, 'id': attrs.get('id', '')})
+
+    def end(self, tag):
+        if self.open_sections and self.open_sections[-1][0] == self.depth:
+            _, record, length = self.open_sections.pop()
+            record['text_content_length'] = length.stripped()
+        if self.open_interactive and self.open_interactive[-1][0] == self.depth:
+            _, record, parts = self.open_interactive.pop()
+            record['text'] = ''.join(parts).strip()[:100]
+        self.depth -= 1
+
+    def text(self, data):
+        for _, _, length in self.open_sections:
+            length.add(data)
+        for _, _, parts in self.open_interactive:
+            parts.append(data)
+
+    def result(self, document):
+        return {
+            'sections': self.sections,
+            'interactive_elements': [record for tag in INTERACTIVE_TAGS for record in self.interactive[tag]],
+            'data_displays': self.canvases + self.charts,
+            'navigation': []
+        }
+
+
+class AnalyticsExtractor(Extractor):
+    name = 'analytics'
+
+    def result(self, document):
+        text_content = document.lower_text
+        return {
+            'metrics_mentioned': [match.group(0) for pattern in METRIC_RES for match in pattern.finditer(text_content)],
+            'data_sources': [source for source in DATA_SOURCE_KEYWORDS if source in text_content],
+            'kpis': [],
+            'sports_entities': [entity for entity in SPORTS_ENTITIES if entity in text_content],
+            'performance_indicators': []
+        }
+
+
+class VisualizationExtractor(Extractor):
+    name = 'visualizations'
+
+    def result(self, document):
+        three_js_scenes = []
+        for script in document.scripts:
+            if 'three.js' in script.lower() or 'THREE.' in script:
+                three_js_scenes.extend(THREE_OBJECT_RE.findall(script))
+
+        return {
+            'chart_types': [],
+            'color_schemes': COLOR_RE.findall(document.style_content),
+            'three_js_scenes': three_js_scenes,
+            'interactive_elements': []
+        }
+
+
+class JavascriptExtractor(Extractor):
+    name = 'javascript'
+
+    def result(self, document):
+        source = document.source
+        return {
+            'frameworks': [framework for framework in FRAMEWORKS if framework in source],
+            'apis_used': API_CALL_RE.findall(source)[:10],  # Limit results
+            'event_handlers': EVENT_HANDLER_RE.findall(source)[:10],
+            'data_processing': []
+        }
+
+
+class StyleExtractor(Extractor):
+    name = 'styles'
+
+    def result(self, document):
+        style_content = document.style_content
+        lower_style = style_content.lower()
+        return {
+            'layout_methods': [pattern for pattern in LAYOUT_KEYWORDS if pattern in lower_style],
+            'animations': [p for p in ANIMATION_RE.findall(style_content) if p],
+            'responsive_design': MEDIA_QUERY_RE.findall(style_content),
+            'color_themes': []
+        }
+
+
+class PerformanceExtractor(Extractor):
+    name = 'performance_metrics'
+
+    def result(self, document):
+        text = document.lower_text
+        return {
+            'optimization_techniques': [keyword for keyword in PERFORMANCE_KEYWORDS if keyword in text],
+            'loading_strategies': [],
+            'caching_mechanisms': []
+        }
+
+
+class InteractionExtractor(Extractor):
+    name = 'user_interactions'
+
+    def __init__(self):
+        self.open_forms = 0
+        self.input_methods = []
+        self.feedback_mechanisms = []
+
+    def start(self, tag, attrs, classes):
+        if tag == 'form':
+            self.open_forms += 1
+        elif tag in ('input', 'select', 'textarea') and self.open_forms:
+            self.input_methods.extend([attrs.get('type', tag)] * self.open_forms)
+
+        if tag in ('button', 'a') and 'class' in attrs and any('btn' in cls or 'button' in cls for cls in classes):
+            self.feedback_mechanisms.append('button_interaction')
+
+    def end(self, tag):
+        if tag == 'form':
+            self.open_forms -= 1
+
+    def result(self, document):
+        return {
+            'user_flows': [],
+            'input_methods': self.input_methods,
+            'feedback_mechanisms': self.feedback_mechanisms
+        }
+
+
+class DataFlowExtractor(Extractor):
+    name = 'data_flows'
+
+    def result(self, document):
+        source = document.source.lower()
+        return {
+            'data_sources': [match for pattern in DATA_SOURCE_RES for match in pattern.findall(source)],
+            'processing_steps': [keyword for keyword in PROCESSING_KEYWORDS if keyword in source],
+            'output_formats': []
+        }
+
+
+def default_extractors() -> List[Extractor]:
+    """Extractors in the order of the processed data categories"""
+    return [MetadataExtractor(), ComponentsExtractor(), AnalyticsExtractor(), VisualizationExtractor(),
+            JavascriptExtractor(), StyleExtractor(), PerformanceExtractor(), InteractionExtractor(),
+            DataFlowExtractor()]
+
+
+def _overrides(extractor: Extractor, method: str) -> bool:
+    return getattr(type(extractor), method) is not getattr(Extractor, method)
+
+
+class SinglePassParser(HTMLParser):
+    """Tokenizes once, keeps the element stack and dispatches events to extractors"""
+
+    def __init__(self, extractors: List[Extractor]):
+        super().__init__(convert_charrefs=True)
+        self.document = Document()
+        self.extractors = extractors
+        self.timings = {extractor.name: 0.0 for extractor in extractors}
+        # Only extractors that handle an event are called for it
+        self._start = [e for e in extractors if _overrides(e, 'start')]
+        self._end = [e for e in extractors if _overrides(e, 'end')]
+        self._text = [e for e in extractors if _overrides(e, 'text')]
+        self._stack = []
+        self._raw_block = None
+
+    def _dispatch(self, handlers: List[Extractor], method: str, *args):
+        timings = self.timings
+        for extractor in handlers:
+            started = time.perf_counter()
+            getattr(extractor, method)(*args)
+            timings[extractor.name] += time.perf_counter() - started
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: '' if value is None else value for name, value in attrs}
+
+        classes = attrs.get('class', '').split()
+        self._dispatch(self._start, 'start', tag, attrs, classes)
+        if tag in VOID_ELEMENTS:
+            self._dispatch(self._end, 'end', tag)
+            return
+
+        self._stack.append(tag)
+        if tag in RAW_TEXT_ELEMENTS:
+            self._raw_block = []
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in self._stack:
+            return  # Stray end tag
+        while self._stack:
+            open_tag = self._stack.pop()
+            if open_tag in RAW_TEXT_ELEMENTS and self._raw_block is not None:
+                block = ''.join(self._raw_block)
+                (self.document.scripts if open_tag == 'script' else self.document.styles).append(block)
+                self._raw_block = None
+            self._dispatch(self._end, 'end', open_tag)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._stack and self._stack[-1] in RAW_TEXT_ELEMENTS:
+            self._raw_block.append(data)
+            return
+        self.document.text_parts.append(data)
+        self._dispatch(self._text, 'text', data)
+
+    def feed(self, data):
+        # The javascript and data flow extractors match against the raw source
+        self.document.source_parts.append(data)
+        super().feed(data)
+
+    def close(self):
+        super().close()
+        if self._stack:
+            self.handle_endtag(self._stack[0])  # Close anything left open
+
+
+def extract_document(source: Union[str, Iterable[str]],
+                     extractors: Optional[List[Extractor]] = None) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run every extractor over an HTML document (a string, or chunks such as
+    an open file) in one traversal. Returns the extracted data keyed by
+    extractor name and seconds spent per extractor ('parse' is tokenizing
+    and shared buffering).
+    """
+    extractors = extractors if extractors is not None else default_extractors()
+    parser = SinglePassParser(extractors)
+
+    started = time.perf_counter()
+    if isinstance(source, str):
+        parser.feed(source)
+    else:
+        for chunk in source:
+            parser.feed(chunk)
+    parser.close()
+
+    data = {}
+    for extractor in extractors:
+        result_started = time.perf_counter()
+        data[extractor.name] = extractor.result(parser.document)
+        parser.timings[extractor.name] += time.perf_counter() - result_started
+
+    total = time.perf_counter() - started
+    timings = dict(parser.timings)
+    timings['parse'] = max(0.0, total - sum(parser.timings.values()))
+    return data, timings
+
+
+def read_chunks(path: str, chunk_chars: int = READ_CHUNK_CHARS) -> Iterable[str]:
+    """Stream a UTF-8 document in chunks"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(chunk_chars), ''):
+            yield chunk
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Analysis job queue for the Blaze Intelligence Pattern Engine
+Each request becomes a job with its own ID, run on a bounded worker pool.
+Jobs report per-stage progress as an ordered event log that clients can
+follow (the engine streams it over SSE), and can be cancelled: queued jobs
+never start, running jobs stop at their next stage boundary.
+"""
+
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 16
+DEFAULT_RETAINED_JOBS = 100
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+
+class QueueFull(Exception):
+    """Raised when too many jobs are waiting for a worker"""
+
+
+class Job:
+    """One analysis request: status, parameters, progress events and result"""
+
+    def __init__(self, params: Dict[str, Any]):
+        self.job_id = uuid.uuid4().hex
+        self.params = params
+        self.status = QUEUED
+        self.stage = None
+        self.result = None
+        self.error = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []
+        self.future = None
+        self._cancel = threading.Event()
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def _append_event(self, event_type: str, **details):
+        # Caller holds self._changed
+        self.events.append({'seq': len(self.events), 'type': event_type, 'job_id': self.job_id,
+                            'status': self.status, 'stage': self.stage,
+                            'timestamp': datetime.now().isoformat(), **details})
+        self._changed.notify_all()
+
+    def _emit(self, event_type: str, **details):
+        with self._changed:
+            self._append_event(event_type, **details)
+
+    def _set_status(self, status: str, **details):
+        # Status and its event change together, so followers never see a
+        # finished job without its final event
+        with self._changed:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = datetime.now().isoformat()
+            elif status in FINISHED_STATUSES:
+                self.finished_at = datetime.now().isoformat()
+            self._append_event('status', **details)
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled(self.job_id)
+
+    def progress(self, stage: str, **details):
+        """Enter a stage (called by the job); stops the job here if it was cancelled"""
+        self.check_cancelled()
+        with self._changed:
+            self.stage = stage
+            self._append_event('stage', **details)
+
+    def follow(self, after: int = 0, timeout: Optional[float] = None) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Events with seq >= after, waiting for new ones until the job finishes.
+        Yields None when timeout passes with nothing new (for keep-alives).
+        """
+        position = after
+        while True:
+            with self._changed:
+                if position >= len(self.events) and not self.finished:
+                    self._changed.wait(timeout)
+                pending = self.events[position:]
+                done = self.finished
+            for event in pending:
+                yield event
+            position += len(pending)
+            if done and position >= len(self.events):
+                return
+            if not pending:
+                yield None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'stage': self.stage,
+            'params': self.params,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'cancel_requested': self.cancel_requested,
+            'result': self.result,
+            'error': self.error
+        }
+
+
+class JobQueue:
+    """Bounded worker pool running jobs submitted as target(job)"""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING,
+                 retained_jobs: int = DEFAULT_RETAINED_JOBS):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retained_jobs = retained_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='blaze-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, target: Callable[[Job], Any], **params) -> Job:
+        """Queue target to run with a new Job; raises QueueFull when max_pending jobs are waiting"""
+        job = Job(params)
+        with self._lock:
+            if sum(1 for queued in self._jobs.values() if queued.status == QUEUED) >= self.max_pending:
+                raise QueueFull(f"{self.max_pending} jobs already waiting")
+            self._jobs[job.job_id] = job
+            self._prune()
+            job._emit('status')
+            job.future = self._executor.submit(self._run, job, target)
+        return job
+
+    def _run(self, job: Job, target: Callable[[Job], Any]):
+        with self._lock:
+            if job.cancel_requested:
+                return  # Cancelled while queued; already marked
+            job._set_status(RUNNING)
+        try:
+            job.result = target(job)
+            job._set_status(COMPLETED)
+        except JobCancelled:
+            job._set_status(CANCELLED)
+        except Exception as e:
+            job.error = str(e)
+            job._set_status(FAILED, error=str(e))
+
+    def _prune(self):
+        # Forget the oldest finished jobs beyond the retention limit
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(self._jobs) - self.retained_jobs)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, status: Optional[str] = None) -> List[Job]:
+        """Known jobs, oldest first"""
+        with self._lock:
+            return [job for job in self._jobs.values() if status is None or job.status == status]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in (QUEUED, RUNNING) + FINISHED_STATUSES}
+        for job in self.jobs():
+            counts[job.status] += 1
+        return counts
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; None when the job is unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job._cancel.set()
+            if job.status == QUEUED:
+                job._set_status(CANCELLED)
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until the job finishes (or timeout passes)"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with job._changed:
+            while not job.finished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                job._changed.wait(remaining)
+        return job
+
+    def shutdown(self, wait: bool = True):
+        """Cancel waiting jobs and stop the workers"""
+        for job in self.jobs(QUEUED):
+            self.cancel(job.job_id)
+        self._executor.shutdown(wait=wait)
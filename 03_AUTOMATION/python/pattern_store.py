@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Persistent pattern store for the Blaze Intelligence Pattern Engine
+Patterns, insights and analysis history live in SQLite. Every pattern and
+insight is also indexed in an FTS5 table, kept current as results are
+stored, so search is ranked (bm25) and paginated instead of a scan.
+Each analysis stage's latest output is kept with the hash of its input so
+unchanged stages can be skipped.
+"""
+
+import os
+import re
+import json
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+PATTERN_DB_PATH = os.getenv(
+    'BLAZE_PATTERN_DB',
+    str(Path(__file__).resolve().parents[2] / '02_DATA' / 'worker-cache' / 'pattern_engine.db')
+)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS patterns (
+    pattern_id TEXT PRIMARY KEY,
+    pattern_type TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS insights (
+    insight_id TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analytics_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stage_cache (
+    stage TEXT PRIMARY KEY,
+    input_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+# Index rowids locate the source row: 2 * rowid for patterns, 2 * rowid + 1
+# for insights, so entries are replaced by rowid instead of a column scan
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+    title, body, tokenize = 'porter unicode61'
+);
+"""
+
+# Bump when the index layout changes; older indexes are rebuilt on open
+INDEX_VERSION = 2
+
+PATTERN_KIND = 0
+INSIGHT_KIND = 1
+
+
+def _pattern_text(pattern: Dict[str, Any]) -> Dict[str, str]:
+    return {'title': pattern['pattern_type'], 'body': ' '.join([pattern['description'], *pattern['insights']])}
+
+
+def _insight_text(insight: Dict[str, Any]) -> Dict[str, str]:
+    return {'title': insight['category'],
+            'body': ' '.join([insight['description'], *insight['actionable_recommendations']])}
+
+
+def content_digest(value: Any) -> str:
+    """sha256 of a JSON-serializable value (key order does not matter)"""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def content_id(prefix: str, *content: Any) -> str:
+    """Stable ID for a result: the same content always gets the same ID"""
+    return f"{prefix}_{content_digest(content)[:16]}"
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fts_query(query: str) -> Optional[str]:
+    """FTS5 query matching every word of query as a prefix (None when it has no words)"""
+    terms = re.findall(r'\w+', query.lower())
+    return ' '.join(f'"{term}"*' for term in terms) or None
+
+
+class PatternStore:
+    """SQLite-backed patterns, insights and history with a full-text search index"""
+
+    def __init__(self, db_path: str = PATTERN_DB_PATH):
+        self.db_path = db_path
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # One connection shared by Flask request threads and analysis threads
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS search_index")
+                self._conn.executescript(FTS_SCHEMA)
+                self._rebuild_index()
+                self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _index(self, rowid: int, kind: int, fields: Dict[str, str]):
+        # Caller holds self._lock inside a transaction
+        index_rowid = 2 * rowid + kind
+        self._conn.execute("DELETE FROM search_index WHERE rowid = ?", (index_rowid,))
+        self._conn.execute(
+            "INSERT INTO search_index (rowid, title, body) VALUES (?, ?, ?)",
+            (index_rowid, fields['title'], fields['body'])
+        )
+
+    def _rebuild_index(self):
+        # Caller holds self._lock inside a transaction
+        self._conn.execute("DELETE FROM search_index")
+        for table, kind, text in (('patterns', PATTERN_KIND, _pattern_text), ('insights', INSIGHT_KIND, _insight_text)):
+            for rowid, data in self._conn.execute(f"SELECT rowid, data FROM {table}").fetchall():
+                self._index(rowid, kind, text(json.loads(data)))
+
+    def rebuild_index(self):
+        """Re-index every pattern and insight (e.g. after a VACUUM renumbered rows)"""
+        with self._lock, self._conn:
+            self._rebuild_index()
+
+    def _upsert(self, table: str, key: str, group: str, kind: int, items: Iterable[Dict[str, Any]], text) -> int:
+        count = 0
+        with self._lock, self._conn:
+            for item in items:
+                item_id = item[key]
+                # Update in place so the row (and its index entry) keeps its rowid
+                self._conn.execute(
+                    f"""
+                    INSERT INTO {table} ({key}, {group}, data) VALUES (?, ?, ?)
+                    ON CONFLICT ({key}) DO UPDATE SET {group} = excluded.{group}, data = excluded.data
+                    """,
+                    (item_id, item[group], json.dumps(item))
+                )
+                rowid = self._conn.execute(f"SELECT rowid FROM {table} WHERE {key} = ?", (item_id,)).fetchone()[0]
+                # Keep the index in step with the row
+                self._index(rowid, kind, text(item))
+                count += 1
+        return count
+
+    def upsert_patterns(self, patterns: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace patterns (dicts of PatternDiscovery fields)"""
+        return self._upsert('patterns', 'pattern_id', 'pattern_type', PATTERN_KIND, patterns, _pattern_text)
+
+    def upsert_insights(self, insights: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace insights (dicts of AnalyticsInsight fields)"""
+        return self._upsert('insights', 'insight_id', 'category', INSIGHT_KIND, insights, _insight_text)
+
+    def append_history(self, entry: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO analytics_history (data) VALUES (?)", (json.dumps(entry),))
+
+    def _load(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def patterns(self) -> Dict[str, Dict[str, Any]]:
+        return {pattern['pattern_id']: pattern for pattern in self._load("SELECT data FROM patterns ORDER BY rowid")}
+
+    def insights(self) -> Dict[str, Dict[str, Any]]:
+        return {insight['insight_id']: insight for insight in self._load("SELECT data FROM insights ORDER BY rowid")}
+
+    def history(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent analysis runs, oldest first"""
+        recent = self._load("SELECT data FROM analytics_history ORDER BY id DESC LIMIT ?", (limit,))
+        return recent[::-1]
+
+    def get_stage(self, stage: str, input_hash: str) -> Optional[Any]:
+        """Cached output of stage when it last ran on input_hash (None otherwise)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM stage_cache WHERE stage = ? AND input_hash = ?", (stage, input_hash)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put_stage(self, stage: str, input_hash: str, data: Any):
+        """Cache a stage's output; only the latest input is kept per stage"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage_cache (stage, input_hash, data) VALUES (?, ?, ?)",
+                (stage, input_hash, json.dumps(data, default=str))
+            )
+
+    def insight_categories(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT category, COUNT(*) FROM insights GROUP BY category").fetchall())
+
+    def search(self, query: str, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0) -> Dict[str, Any]:
+        """
+        Patterns and insights matching every word of query (prefix match on
+        type/category, description, insights and recommendations), best
+        bm25 rank first, one page at a time.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        offset = max(0, offset)
+        results = {'query': query, 'patterns': [], 'insights': [], 'total_matches': 0,
+                   'limit': limit, 'offset': offset, 'has_more': False}
+
+        match = fts_query(query)
+        if match is None:
+            return results
+
+        with self._lock:
+            results['total_matches'] = self._conn.execute(
+                "SELECT COUNT(*) FROM search_index WHERE search_index MATCH ?", (match,)
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                """
+                SELECT search_index.rowid % 2, bm25(search_index, 2.0, 1.0) AS score, COALESCE(p.data, i.data)
+                FROM search_index
+                LEFT JOIN patterns AS p ON search_index.rowid % 2 = 0 AND p.rowid = search_index.rowid / 2
+                LEFT JOIN insights AS i ON search_index.rowid % 2 = 1 AND i.rowid = search_index.rowid / 2
+                WHERE search_index MATCH ?
+                ORDER BY score
+                LIMIT ? OFFSET ?
+                """,
+                (match, limit, offset)
+            ).fetchall()
+
+        for kind, score, data in rows:
+            item = dict(json.loads(data), search_score=round(-score, 4))
+            results['patterns' if kind == PATTERN_KIND else 'insights'].append(item)
+
+        results['has_more'] = offset + len(rows) < results['total_matches']
+        return results
@@ -8,11 +8,13 @@ import sys
 import os
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-# Add current directory to path
+# Add current directory and repository root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 # Import all agents
 from ingestion.mlb_agent import MLBAgent
@@ -22,6 +24,12 @@ from ingestion.hs_agent import HSAgent
 from ingestion.nil_agent import NILAgent
 from ingestion.intl_agent import InternationalAgent
 from ingestion.nba_agent import NBADataAgent
+from ingestion.pipeline import AgentPipeline
+
+
+def _process_league(agent_class: type, raw: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    """Run the CPU-bound stages (normalize, score, write) of a pipeline agent in a worker process"""
+    return agent_class().process(raw, params)
 
 
 class BlazeOrchestrator:
@@ -38,6 +46,8 @@ class BlazeOrchestrator:
             'nba': NBADataAgent()
         }
         
+        self.durations = {}
+        
         self.default_params = {
             'mlb': {'team': 'STL'},
             'nfl': {'team': 'TEN'},
@@ -48,13 +58,37 @@ class BlazeOrchestrator:
             'nba': {'team': 'MEM'}
         }
     
+    def execute_agent(self, league: str, live: bool = False, params: Dict[str, Any] = None,
+                      cpu_pool: Optional[ProcessPoolExecutor] = None) -> Dict[str, Any]:
+        """
+        Run a specific agent and report success, duration and error.
+        With a cpu_pool, pipeline agents fetch on the calling thread and
+        normalize/score/write in a worker process.
+        """
+        agent = self.agents[league]
+        agent_params = params or self.default_params.get(league, {})
+        
+        start_time = time.time()
+        error = None
+        
+        try:
+            if cpu_pool is not None and isinstance(agent, AgentPipeline):
+                raw = agent.fetch_raw(agent_params, live)
+                success = cpu_pool.submit(_process_league, type(agent), raw, agent_params).result()
+            else:
+                success = agent.run(agent_params, live=live)
+        except Exception as e:
+            success = False
+            error = str(e)
+        
+        return {'success': success, 'duration': time.time() - start_time, 'error': error}
+    
     def run_agent(self, league: str, live: bool = False, params: Dict[str, Any] = None) -> bool:
         """Run a specific agent"""
         if league not in self.agents:
             print(f"Unknown league: {league}")
             return False
         
-        agent = self.agents[league]
         agent_params = params or self.default_params.get(league, {})
         
         print(f"\n{'='*20} {league.upper()} AGENT {'='*20}")
@@ -62,50 +96,86 @@ class BlazeOrchestrator:
         print(f"Parameters: {agent_params}")
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        start_time = time.time()
+        report = self.execute_agent(league, live=live, params=agent_params)
+        self.durations[league] = report['duration']
         
-        try:
-            success = agent.run(agent_params, live=live)
-            end_time = time.time()
-            duration = end_time - start_time
-            
-            status = "SUCCESS" if success else "FAILED"
-            print(f"Status: {status}")
-            print(f"Duration: {duration:.2f}s")
-            
-            return success
-            
-        except Exception as e:
-            end_time = time.time()
-            duration = end_time - start_time
+        if report['error']:
             print(f"Status: ERROR")
-            print(f"Error: {e}")
-            print(f"Duration: {duration:.2f}s")
-            return False
+            print(f"Error: {report['error']}")
+        else:
+            print(f"Status: {'SUCCESS' if report['success'] else 'FAILED'}")
+        print(f"Duration: {report['duration']:.2f}s")
+        
+        return report['success']
     
-    def run_all_agents(self, live: bool = False, leagues: List[str] = None) -> Dict[str, bool]:
-        """Run all agents in priority order"""
+    def run_agents_parallel(self, leagues: List[str], live: bool = False,
+                            max_parallel: int = 4) -> Dict[str, bool]:
+        """
+        Run agents concurrently: fetches on a thread pool (I/O-bound) and
+        normalize/score/write on a process pool (CPU-bound).
+        """
+        results = {}
+        
+        try:
+            cpu_pool = ProcessPoolExecutor(max_workers=min(max_parallel, os.cpu_count() or 1))
+        except (OSError, NotImplementedError) as e:
+            print(f"Process pool unavailable ({e}), scoring on threads")
+            cpu_pool = None
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix='blaze-agent') as io_pool:
+                futures = {
+                    io_pool.submit(self.execute_agent, league, live, None, cpu_pool): league
+                    for league in leagues
+                }
+                
+                for future in as_completed(futures):
+                    league = futures[future]
+                    report = future.result()
+                    results[league] = report['success']
+                    self.durations[league] = report['duration']
+                    
+                    status = "ERROR" if report['error'] else "SUCCESS" if report['success'] else "FAILED"
+                    detail = f" ({report['error']})" if report['error'] else ""
+                    print(f"[{league.upper()}] {status} in {report['duration']:.2f}s{detail}")
+        finally:
+            if cpu_pool is not None:
+                cpu_pool.shutdown()
+        
+        return {league: results[league] for league in leagues}
+    
+    def run_all_agents(self, live: bool = False, leagues: List[str] = None,
+                       max_parallel: int = 1) -> Dict[str, bool]:
+        """Run all agents in priority order, up to max_parallel at a time"""
         target_leagues = leagues or ['mlb', 'nfl', 'ncaa', 'nba', 'hs', 'nil', 'intl']
         results = {}
+        self.durations = {}
         
         print(f"\n{'='*60}")
         print("BLAZE INTELLIGENCE MASTER ORCHESTRATOR")
         print(f"{'='*60}")
         print(f"Live fetch mode: {live}")
         print(f"Target leagues: {', '.join(target_leagues)}")
+        print(f"Max parallel: {max_parallel}")
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         total_start = time.time()
         
-        # Run agents in order (prioritizing Cardinals, Titans, Longhorns)
+        known_leagues = [league for league in target_leagues if league in self.agents]
         for league in target_leagues:
-            if league in self.agents:
-                success = self.run_agent(league, live=live)
-                results[league] = success
-            else:
+            if league not in self.agents:
                 print(f"Skipping unknown league: {league}")
                 results[league] = False
         
+        if max_parallel > 1 and len(known_leagues) > 1:
+            results.update(self.run_agents_parallel(known_leagues, live=live, max_parallel=max_parallel))
+        else:
+            # Run agents in order (prioritizing Cardinals, Titans, Longhorns)
+            for league in known_leagues:
+                results[league] = self.run_agent(league, live=live)
+        
+        results = {league: results[league] for league in target_leagues}
+        
         total_end = time.time()
         total_duration = total_end - total_start
         
@@ -118,12 +188,13 @@ class BlazeOrchestrator:
         total_agents = len(results)
         
         print(f"Success rate: {successes}/{total_agents} ({100*successes/total_agents:.1f}%)")
-        print(f"Total duration: {total_duration:.2f}s")
+        print(f"Total duration: {total_duration:.2f}s (sum of agents: {sum(self.durations.values()):.2f}s)")
         
         print("\nDetailed Results:")
         for league, success in results.items():
             status = "✅" if success else "❌"
-            print(f"  {status} {league.upper()}")
+            duration = f" ({self.durations[league]:.2f}s)" if league in self.durations else ""
+            print(f"  {status} {league.upper()}{duration}")
         
         return results
     
@@ -256,6 +327,8 @@ def main():
                        help='Skip readiness board generation')
     parser.add_argument('--agent', 
                        help='Run specific agent only')
+    parser.add_argument('--max-parallel', type=int, default=1,
+                       help='Run up to N league agents concurrently (default: 1, sequential)')
     parser.add_argument('--biometric-analysis', action='store_true',
                        help='Run biometric analysis on key players')
     parser.add_argument('--video-analysis', action='store_true',
@@ -285,7 +358,8 @@ def main():
         sys.exit(0 if success else 1)
     
     # Run full orchestration
-    results = orchestrator.run_all_agents(live=args.live, leagues=target_leagues)
+    results = orchestrator.run_all_agents(live=args.live, leagues=target_leagues,
+                                          max_parallel=args.max_parallel)
     
     # Run tests unless skipped
     if not args.skip_tests:
@@ -9,12 +9,15 @@ import os
 import sys
 import time
 import requests
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from ingestion.readiness_snapshot import load_readiness
+
 
 class BlazeHealthMonitor:
     """Production health monitoring system"""
@@ -154,23 +157,21 @@ class BlazeHealthMonitor:
         results = {"status": "healthy", "issues": [], "metrics": {}}
         
         try:
-            with open("site/src/data/readiness.json", 'r') as f:
-                readiness_data = json.load(f)
+            readiness = load_readiness()
         except Exception as e:
             results["status"] = "critical"
             results["issues"].append(f"Cannot read readiness data: {e}")
             return results
         
-        players = readiness_data.get('players', [])
-        summary = readiness_data.get('summary', {})
+        players = readiness.players
+        summary = readiness.summary
         
-        # Check metric bounds
+        # Check metric bounds (missing metrics are NaN)
         invalid_metrics = []
-        for player in players:
-            for metric in ['champion_readiness', 'cognitive_leverage', 'nil_trust_score']:
-                value = player.get(metric)
-                if value is not None and not (0 <= value <= 100):
-                    invalid_metrics.append(f"{player['name']}: {metric}={value}")
+        for metric in ['champion_readiness', 'cognitive_leverage', 'nil_trust_score']:
+            values = players[metric]
+            for row in np.flatnonzero((values < 0) | (values > 100)).tolist():
+                invalid_metrics.append(f"{readiness.string(int(players['name'][row]))}: {metric}={values[row]}")
         
         if invalid_metrics:
             results["status"] = "critical"
@@ -178,11 +179,11 @@ class BlazeHealthMonitor:
         
         # Check focus team coverage
         focus_teams = self.config["focus_teams"]
-        focus_players = [p for p in players if p.get('team_id') in focus_teams]
+        focus_players = sum(len(readiness.player_records(team_id=team_id)) for team_id in focus_teams)
         
         results["metrics"] = {
             "total_players": len(players),
-            "focus_players": len(focus_players),
+            "focus_players": focus_players,
             "ready_players": summary.get('ready_players', 0),
             "monitor_players": summary.get('monitor_players', 0),
             "caution_players": summary.get('caution_players', 0),
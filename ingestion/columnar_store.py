@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Columnar player tables for Blaze Intelligence unified datasets
+A dataset is a directory of .npy columns plus manifest.json:
+- numeric fields are float64 (NaN for missing) or int64 columns
+- text and nested values are int32 codes into one shared string dictionary
+  (UTF-8 bytes in strings.npy, boundaries in string_offsets.npy), -1 for missing
+- teams reference players by player_id instead of embedding them
+Every column can be opened with np.load(..., mmap_mode='r').
+"""
+
+import json
+import os
+from typing import Dict, List, Any, Iterator, Optional
+
+import numpy as np
+
+from ingestion.league_writer import atomic_write
+
+
+FORMAT_VERSION = 1
+MANIFEST = 'manifest.json'
+STRINGS = 'strings.npy'
+STRING_OFFSETS = 'string_offsets.npy'
+MISSING_CODE = -1
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Nested dicts -> dotted keys; lists and other values are kept as leaves"""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten_record(value, name + '.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _column_kind(values: List[Any]) -> str:
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+        return 'int' if len(present) == len(values) else 'float'
+    if present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        return 'float'
+    return 'string'
+
+
+def write_columnar(path: str, players: List[Dict[str, Any]], teams: Optional[List[Dict[str, Any]]] = None,
+                   metadata: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Write players as a columnar dataset directory at path.
+    teams may hold rosters of player_ids. Returns the number of players.
+    """
+    os.makedirs(path, exist_ok=True)
+    rows = [flatten_record(player) for player in players]
+    names = list(dict.fromkeys(name for row in rows for name in row))
+
+    strings = {}
+    columns = []
+    for index, name in enumerate(names):
+        values = [row.get(name) for row in rows]
+        kind = _column_kind(values)
+        if kind == 'int':
+            array = np.array(values, dtype=np.int64)
+        elif kind == 'float':
+            array = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        else:
+            # Columns with non-string leaves (lists, bools, empty dicts) are stored as JSON
+            if not all(value is None or isinstance(value, str) for value in values):
+                kind = 'json'
+                values = [None if value is None else json.dumps(value, sort_keys=True) for value in values]
+            array = np.array([
+                MISSING_CODE if value is None else strings.setdefault(value, len(strings))
+                for value in values
+            ], dtype=np.int32)
+
+        filename = f"col{index:04d}.npy"
+        np.save(os.path.join(path, filename), array)
+        columns.append({'name': name, 'kind': kind, 'file': filename})
+
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    np.save(os.path.join(path, STRINGS), np.frombuffer(b''.join(encoded), dtype=np.uint8))
+    np.save(os.path.join(path, STRING_OFFSETS), offsets)
+
+    manifest = dict(metadata or {}, format_version=FORMAT_VERSION, rows=len(rows),
+                    columns=columns, teams=teams or [])
+    with atomic_write(os.path.join(path, MANIFEST)) as f:
+        json.dump(manifest, f, indent=2)
+    return len(rows)
+
+
+class ColumnarDataset:
+    """Read-only view of a columnar dataset; columns are memory-mapped on first use"""
+
+    def __init__(self, path: str, mmap: bool = True):
+        self.path = path
+        self.mmap_mode = 'r' if mmap else None
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.columns = {column['name']: column for column in self.manifest['columns']}
+        self.teams = self.manifest['teams']
+        self._arrays = {}
+        self._strings = None
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return self.manifest['rows']
+
+    def string(self, code: int) -> str:
+        """Dictionary entry for a string code"""
+        if self._strings is None:
+            self._strings = np.load(os.path.join(self.path, STRINGS), mmap_mode=self.mmap_mode)
+            self._offsets = np.load(os.path.join(self.path, STRING_OFFSETS), mmap_mode=self.mmap_mode)
+        return self._strings[self._offsets[code]:self._offsets[code + 1]].tobytes().decode('utf-8')
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw column array (string columns hold dictionary codes)"""
+        array = self._arrays.get(name)
+        if array is None:
+            array = np.load(os.path.join(self.path, self.columns[name]['file']), mmap_mode=self.mmap_mode)
+            self._arrays[name] = array
+        return array
+
+    def values(self, name: str) -> List[Any]:
+        """Decoded column values, None where missing"""
+        kind = self.columns[name]['kind']
+        array = self.column(name)
+        if kind == 'int':
+            return array.tolist()
+        if kind == 'float':
+            return [None if np.isnan(value) else value for value in array.tolist()]
+        decoded = {}
+        for code in np.unique(array).tolist():
+            if code != MISSING_CODE:
+                decoded[code] = json.loads(self.string(code)) if kind == 'json' else self.string(code)
+        return [decoded.get(code) for code in array.tolist()]
+
+    def players(self) -> Iterator[Dict[str, Any]]:
+        """Rebuild player records (missing fields are omitted)"""
+        decoded = {name: self.values(name) for name in self.columns}
+        for row in range(len(self)):
+            player = {}
+            for name, values in decoded.items():
+                if values[row] is None:
+                    continue
+                *parents, leaf = name.split('.')
+                node = player
+                for part in parents:
+                    node = node.setdefault(part, {})
+                node[leaf] = values[row]
+            yield player
+
+
+def link_latest(target: str, latest: str) -> None:
+    """
+    Point latest at target without copying: a relative symlink, or a
+    hardlink for files where symlinks are unavailable. Replaced atomically.
+    """
+    tmp = f"{latest}.tmp"
+    if os.path.lexists(tmp):
+        os.unlink(tmp)
+    try:
+        os.symlink(os.path.relpath(target, os.path.dirname(os.path.abspath(latest))), tmp)
+    except (OSError, NotImplementedError):
+        os.link(target, tmp)
+    os.replace(tmp, latest)
@@ -6,16 +6,89 @@ Computes three core metrics:
 - NIL Trust Score: Authenticity + Velocity + Salience
 """
 
-from datetime import datetime
+import hashlib
+import json
+import logging
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
+from ingestion.scoring_registry import registry
+
+
+# Bump when a formula changes so cached scores are invalidated
+HAVF_VERSION = "1"
+
+# Fields read by the HAV-F formulas (performance fields come from the
+# scoring registry, see registry.performance_fields())
+HAVF_PERF_FIELDS = registry.performance_fields()
+HAVF_BIOMETRIC_FIELDS = ("hrv_rmssd_ms", "reaction_ms", "gsr_microsiemens", "sleep_hours")
+HAVF_NIL_FIELDS = ("engagement_rate", "deals_last_90d", "deal_value_90d_usd",
+                   "search_index", "local_popularity_index")
+
+# Distinct (dob, reference day) pairs kept in the trajectory table
+DOB_CACHE_SIZE = 32768
+
+logger = logging.getLogger(__name__)
+
 
 def normalize_value(value: float, min_val: float = 0, max_val: float = 100) -> float:
     """Clamp value to [min_val, max_val] range."""
     return round(max(min_val, min(max_val, value)), 1)
 
 
-def compute_champion_readiness(player: Dict[str, Any]) -> Optional[float]:
+def trajectory_for_age(age: float) -> float:
+    """Peak athletic age modeling: 24-28 optimal."""
+    if 24 <= age <= 28:
+        return 90
+    elif 20 <= age < 24:
+        return 70 + (age - 20) * 5
+    elif 28 < age <= 35:
+        return 90 - (age - 28) * 5
+    else:
+        return 50
+
+
+@lru_cache(maxsize=DOB_CACHE_SIZE)
+def dob_trajectory(dob: str, reference_day: date) -> Optional[float]:
+    """
+    Trajectory score for a bio.dob string as of reference_day.
+    Memoized across players and leagues; returns None for unparseable DOBs.
+    """
+    try:
+        born = datetime.fromisoformat(dob.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    
+    # Ages are whole days as of the reference day
+    age = (reference_day - born.date()).days / 365.25
+    return trajectory_for_age(age)
+
+
+def trajectory_for_dob(dob: Any, reference_day: date) -> Optional[float]:
+    """dob_trajectory for any bio.dob value; None for non-strings, which may not be hashable."""
+    return dob_trajectory(dob, reference_day) if isinstance(dob, str) else None
+
+
+def has_dob(player: Dict[str, Any]) -> bool:
+    """Whether the player carries a bio.dob for the trajectory score."""
+    return "bio" in player and bool(player["bio"].get("dob"))
+
+
+def compute_trajectory_score(player: Dict[str, Any], reference: Optional[datetime] = None) -> float:
+    """
+    Compute trajectory score (age/experience heuristic) used by champion readiness.
+    Ages are taken as of reference (default: now); missing or bad DOBs score 50.
+    """
+    if not has_dob(player):
+        return 50.0  # Default
+    
+    reference_day = (reference or datetime.now()).date()
+    traj_score = trajectory_for_dob(player["bio"]["dob"], reference_day)
+    return 50.0 if traj_score is None else traj_score
+
+
+def compute_champion_readiness(player: Dict[str, Any], reference: Optional[datetime] = None) -> Optional[float]:
     """
     Compute champion readiness score (0-100).
     Formula: 0.5*performance + 0.4*physical + 0.1*trajectory
@@ -24,23 +97,12 @@ def compute_champion_readiness(player: Dict[str, Any]) -> Optional[float]:
     perf_score = 50.0  # Default baseline
     
     if "stats" in player and "perfs" in player["stats"]:
-        perfs = player["stats"]["perfs"]
         sport = player.get("sport", "")
         
-        if sport == "MLB":
-            # MLB: Combine WAR + WPA
-            war = perfs.get("war", 0)
-            wpa = perfs.get("wpa", 0)
-            perf_score = normalize_value(30 * war + 200 * wpa + 30)
-        elif sport == "NFL":
-            # NFL: EPA-based
-            epa = perfs.get("epa", 0)
-            perf_score = normalize_value(50 + epa * 2)
-        elif sport in ["NCAA-FB", "HS-FB"]:
-            # Football: Yards/TD weighted
-            yards = perfs.get("total_yards", 0)
-            tds = perfs.get("total_tds", 0)
-            perf_score = normalize_value(yards/100 + tds*5)
+        # Sport-specific formula from the scoring registry
+        performance = registry.performance_scorers.get(sport) if isinstance(sport, str) else None
+        if performance is not None:
+            perf_score = performance(player["stats"]["perfs"])
     
     # Physical score from biometrics
     phys_score = 50.0  # Default if missing
@@ -80,24 +142,7 @@ def compute_champion_readiness(player: Dict[str, Any]) -> Optional[float]:
             phys_score = sum(scores) / len(scores)
     
     # Trajectory score (age/experience heuristic)
-    traj_score = 50.0  # Default
-    
-    if "bio" in player and player["bio"].get("dob"):
-        try:
-            dob = datetime.fromisoformat(player["bio"]["dob"].replace("Z", "+00:00"))
-            age = (datetime.now() - dob).days / 365.25
-            
-            # Peak athletic age modeling (24-28 optimal)
-            if 24 <= age <= 28:
-                traj_score = 90
-            elif 20 <= age < 24:
-                traj_score = 70 + (age - 20) * 5
-            elif 28 < age <= 35:
-                traj_score = 90 - (age - 28) * 5
-            else:
-                traj_score = 50
-        except:
-            pass
+    traj_score = compute_trajectory_score(player, reference)
     
     # Final blend
     score = 0.5 * perf_score + 0.4 * phys_score + 0.1 * traj_score
@@ -215,17 +260,13 @@ def compute_nil_trust(player: Dict[str, Any]) -> Optional[float]:
     return normalize_value(score)
 
 
-def stamp_havf(player_dict: Dict[str, Any], now_iso: str) -> None:
+def write_havf_scores(player_dict: Dict[str, Any], champion_readiness: Optional[float],
+                      cognitive_leverage: Optional[float], nil_trust_score: Optional[float],
+                      now_iso: str) -> None:
     """
-    Compute and stamp HAV-F scores on player dict in-place.
+    Stamp precomputed HAV-F scores on player dict in-place.
     Also updates meta.updated_at.
     """
-    # Compute scores
-    champion_readiness = compute_champion_readiness(player_dict)
-    cognitive_leverage = compute_cognitive_leverage(player_dict)
-    nil_trust_score = compute_nil_trust(player_dict)
-    
-    # Stamp HAV-F
     if "hav_f" not in player_dict:
         player_dict["hav_f"] = {}
     
@@ -234,16 +275,174 @@ def stamp_havf(player_dict: Dict[str, Any], now_iso: str) -> None:
     player_dict["hav_f"]["nil_trust_score"] = nil_trust_score
     player_dict["hav_f"]["last_computed_at"] = now_iso
     
+    # Scores no longer correspond to any earlier fingerprint
+    player_dict["hav_f"].pop("input_fingerprint", None)
+    
     # Update meta
     if "meta" not in player_dict:
         player_dict["meta"] = {}
     player_dict["meta"]["updated_at"] = now_iso
 
 
-def compute_all(players: List[Dict[str, Any]]) -> None:
+def stamp_havf(player_dict: Dict[str, Any], now_iso: str, reference: Optional[datetime] = None) -> None:
+    """
+    Compute and stamp HAV-F scores on player dict in-place.
+    Also updates meta.updated_at.
+    """
+    write_havf_scores(
+        player_dict,
+        compute_champion_readiness(player_dict, reference),
+        compute_cognitive_leverage(player_dict),
+        compute_nil_trust(player_dict),
+        now_iso
+    )
+
+
+def _pick(source: Any, keys: tuple) -> Any:
+    """Values of keys from a dict, or the object itself if it is not a dict."""
+    if isinstance(source, dict):
+        return tuple(map(source.get, keys))
+    return source
+
+
+def havf_fingerprint(player: Dict[str, Any], reference: Optional[datetime] = None) -> str:
+    """
+    Stable content hash of the fields HAV-F reads.
+    The trajectory score is included at output precision so age-driven
+    changes still trigger a recompute as players get older.
+    """
+    stats = player.get("stats")
+    nil = player.get("nil_profile")
+    
+    material = (
+        HAVF_VERSION,
+        player.get("sport"),
+        _pick(stats.get("perfs") if isinstance(stats, dict) else stats, registry.performance_fields()),
+        _pick(player.get("biometrics"), HAVF_BIOMETRIC_FIELDS),
+        _pick(nil, HAVF_NIL_FIELDS),
+        isinstance(nil, dict) and any(value is not None for value in nil.values()),
+        round(compute_trajectory_score(player, reference), 1)
+    )
+    
+    return hashlib.sha1(repr(material).encode("utf-8")).hexdigest()[:16]
+
+
+def load_previous_havf(output_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load HAV-F state from a previous league output file, keyed by player_id.
+    Only hav_f and meta.updated_at are kept for each player.
+    Returns an empty index if the file is missing or unreadable.
+    """
+    try:
+        with open(output_path, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    
+    return {
+        player["player_id"]: {
+            "hav_f": player.get("hav_f"),
+            "meta": {"updated_at": (player.get("meta") or {}).get("updated_at")}
+        }
+        for player in data.get("players", [])
+        if isinstance(player, dict) and player.get("player_id")
+    }
+
+
+def _reuse_havf(player_dict: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Carry HAV-F scores and timestamps over from the previous run's player."""
+    player_dict["hav_f"] = dict(previous["hav_f"])
+    
+    updated_at = (previous.get("meta") or {}).get("updated_at")
+    if updated_at:
+        if "meta" not in player_dict:
+            player_dict["meta"] = {}
+        player_dict["meta"]["updated_at"] = updated_at
+
+
+# Rosters at least this large are scored with the columnar batch engine
+BATCH_MIN_PLAYERS = 64
+
+
+def compute_all(players: List[Dict[str, Any]], batch: Optional[bool] = None,
+                previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                bad_dobs: Optional[List[Any]] = None) -> int:
     """
     Apply HAV-F computation to all players in-place.
+    
+    batch=None picks the NumPy batch engine (ingestion.havf_batch) for large
+    rosters when NumPy is installed; batch=False forces the scalar reference
+    path. Both produce identical scores.
+    
+    previous maps player_id to that player's record from the last run (see
+    load_previous_havf). Players whose input fingerprint is unchanged keep
+    their previous scores and timestamps instead of being recomputed.
+    
+    All ages are computed against one reference date per call. Players whose
+    bio.dob cannot be parsed score the default trajectory; their player_ids
+    are logged and appended to bad_dobs when a list is given.
+    
+    Returns the number of players that were (re)computed.
     """
     now_iso = datetime.utcnow().isoformat() + "Z"
+    reference = datetime.now()
+    
+    fingerprints = [havf_fingerprint(player, reference) for player in players]
+    pending = []
+    pending_fingerprints = []
+    
+    for player, fingerprint in zip(players, fingerprints):
+        prior = previous.get(player.get("player_id")) if previous else None
+        prior_havf = prior.get("hav_f") if prior else None
+        
+        if prior_havf and prior_havf.get("input_fingerprint") == fingerprint:
+            _reuse_havf(player, prior)
+        else:
+            pending.append(player)
+            pending_fingerprints.append(fingerprint)
+    
+    _report_bad_dobs(players, reference, bad_dobs)
+    _score_players(pending, now_iso, batch, reference)
+    
+    for player, fingerprint in zip(pending, pending_fingerprints):
+        player["hav_f"]["input_fingerprint"] = fingerprint
+    
+    return len(pending)
+
+
+def _report_bad_dobs(players: List[Dict[str, Any]], reference: datetime,
+                     bad_dobs: Optional[List[Any]]) -> None:
+    """Log players whose bio.dob could not be parsed (already in the trajectory table)."""
+    reference_day = reference.date()
+    bad = [
+        player.get("player_id")
+        for player in players
+        if has_dob(player) and trajectory_for_dob(player["bio"]["dob"], reference_day) is None
+    ]
+    
+    if bad:
+        logger.warning("HAV-F: %d player(s) with unparseable bio.dob scored with default trajectory: %s",
+                       len(bad), ", ".join(str(player_id) for player_id in bad[:10]) +
+                       (" ..." if len(bad) > 10 else ""))
+        if bad_dobs is not None:
+            bad_dobs.extend(bad)
+
+
+def _score_players(players: List[Dict[str, Any]], now_iso: str, batch: Optional[bool],
+                   reference: Optional[datetime] = None) -> None:
+    """Stamp HAV-F scores on players with the batch engine or the scalar path."""
+    if batch is None:
+        batch = len(players) >= BATCH_MIN_PLAYERS
+    
+    if batch:
+        try:
+            from ingestion.havf_batch import compute_all_batch
+        except ImportError:
+            compute_all_batch = None  # NumPy not installed
+        
+        if compute_all_batch is not None:
+            compute_all_batch(players, now_iso, reference)
+            return
+    
     for player in players:
-        stamp_havf(player, now_iso)
+        stamp_havf(player, now_iso, reference)
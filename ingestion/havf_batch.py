@@ -0,0 +1,281 @@
+"""
+Columnar batch engine for HAV-F computation.
+Extracts stats, biometrics, bio and nil_profile fields into NumPy arrays once
+and computes all three scores for a roster with array operations.
+
+The scalar functions in ingestion.havf remain the reference implementation;
+every score produced here is identical to what they return. Players whose
+inputs the batch engine cannot represent (non-numeric or non-finite values,
+malformed sub-objects) are handed to the scalar path unchanged.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from ingestion.havf import compute_trajectory_score, stamp_havf, write_havf_scores
+from ingestion.scoring_registry import registry, round_array
+
+
+# Sport code for players without a performance formula; registry sports
+# with one are numbered from 1
+SPORT_OTHER = 0
+
+# Inputs beyond this magnitude (incl. integers that lose precision as
+# float64) are routed to the scalar path
+_MAX_EXACT_INT = 2 ** 53
+
+_BIO_FIELDS = ("hrv_rmssd_ms", "reaction_ms", "gsr_microsiemens", "sleep_hours")
+_NIL_FIELDS = ("engagement_rate", "deals_last_90d", "deal_value_90d_usd",
+               "search_index", "local_popularity_index")
+
+
+_NUMERIC_TYPES = (int, float)
+_NAN = float("nan")
+
+
+class _Fallback(Exception):
+    """Raised during extraction when a player must be scored by the scalar path."""
+
+
+def _num(value: Any) -> float:
+    """Accept a JSON number, rejecting anything the scalar path would treat differently."""
+    if type(value) not in _NUMERIC_TYPES or value != value:
+        raise _Fallback()
+    return value
+
+
+def _opt(value: Any) -> float:
+    """Accept an optional JSON number, NaN when missing."""
+    return _NAN if value is None else _num(value)
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    """Vectorized normalize_value with the default [0, 100] range."""
+    return round_array(np.clip(values, 0, 100), 1)
+
+
+def _to_scores(raw: np.ndarray) -> List[Any]:
+    """
+    Final normalize_value as Python values. The builtin clamp returns the int
+    bounds 0 and 100 when it engages, so those are reproduced exactly.
+    """
+    scores = _normalize(raw).tolist()
+    for i in np.flatnonzero(raw <= 0):
+        scores[i] = 0
+    for i in np.flatnonzero(raw >= 100):
+        scores[i] = 100
+    return scores
+
+
+def _masked_mean(components: List[np.ndarray], masks: List[np.ndarray], default: float) -> np.ndarray:
+    """Mean of the present components in list order, default where none are present."""
+    total = np.zeros_like(components[0])
+    count = np.zeros(components[0].shape, dtype=np.int64)
+    for component, mask in zip(components, masks):
+        total = total + np.where(mask, component, 0.0)
+        count += mask
+    return np.where(count > 0, total / np.maximum(count, 1), default)
+
+
+_EMPTY_BIO = (_NAN,) * len(_BIO_FIELDS)
+_EMPTY_NIL = (_NAN,) * len(_NIL_FIELDS)
+
+
+class HAVFBatch:
+    """Columnar view of a roster holding every input the HAV-F formulas read"""
+
+    def __init__(self, players: List[Dict[str, Any]], now: Optional[datetime] = None):
+        self.size = len(players)
+        self.now = now or datetime.now()
+
+        # Performance columns and per-sport layouts from the scoring registry
+        self.perf_fields = registry.performance_fields()
+        self.sport_codes = {sport: code for code, sport in enumerate(registry.performance_sports(), 1)}
+        self.perf_layouts = {
+            sport: tuple(field if field in registry.get(sport).performance_fields else None
+                         for field in self.perf_fields)
+            for sport in self.sport_codes
+        }
+        self.empty_perf = (0,) * len(self.perf_fields)
+        empty_row = (SPORT_OTHER,) + self.empty_perf + (50.0, False, False) + _EMPTY_BIO + _EMPTY_NIL
+
+        rows, fallback = [], []
+        for player in players:
+            try:
+                rows.append(self._extract(player))
+                fallback.append(False)
+            except Exception:
+                rows.append(empty_row)
+                fallback.append(True)
+
+        # One conversion for the whole roster, then column views
+        matrix = np.array(rows, dtype=np.float64).reshape(self.size, len(empty_row))
+        self.fallback = np.array(fallback, dtype=bool)
+        self.fallback |= np.isinf(matrix).any(axis=1) | (np.abs(matrix) > _MAX_EXACT_INT).any(axis=1)
+        columns = iter(matrix.T)
+
+        # Champion readiness inputs
+        self.sport = next(columns).astype(np.int8)
+        self.perfs = {field: next(columns) for field in self.perf_fields}
+        self.trajectory = next(columns)
+        self.has_biometrics = next(columns).astype(bool)
+        self.has_nil = next(columns).astype(bool)
+        self.bio = {field: next(columns) for field in _BIO_FIELDS}
+
+        # NIL inputs
+        self.nil = {field: next(columns) for field in _NIL_FIELDS}
+
+    def _extract(self, player: Dict[str, Any]) -> tuple:
+        """Mirror the field access of the scalar functions for one player"""
+        sport, perf_row = SPORT_OTHER, self.empty_perf
+        if "stats" in player and "perfs" in player["stats"]:
+            perfs = player["stats"]["perfs"]
+            sport_name = player.get("sport", "")
+
+            layout = self.perf_layouts.get(sport_name) if isinstance(sport_name, str) else None
+            if layout is not None:
+                sport = self.sport_codes[sport_name]
+                perf_row = [_num(perfs.get(field, 0)) if field else 0 for field in layout]
+
+        biometrics = player.get("biometrics")
+        if biometrics is None:
+            bio_row = _EMPTY_BIO
+        elif type(biometrics) is dict:
+            bio_row = tuple(_opt(biometrics.get(field)) for field in _BIO_FIELDS)
+        else:
+            raise _Fallback()
+
+        traj = compute_trajectory_score(player, self.now)
+
+        nil = player.get("nil_profile")
+        nil_row = _EMPTY_NIL
+        if nil is not None:
+            if type(nil) is not dict:
+                raise _Fallback()
+            if not all(value is None for value in nil.values()):
+                nil_row = tuple(_opt(nil.get(field)) for field in _NIL_FIELDS)
+
+        return (sport, *perf_row, traj, biometrics is not None, nil_row is not _EMPTY_NIL,
+                *bio_row, *nil_row)
+
+    def champion_readiness(self) -> np.ndarray:
+        """Vectorized compute_champion_readiness, before the final normalize"""
+        perf = np.full(self.size, 50.0)
+        for sport, code in self.sport_codes.items():
+            selected = self.sport == code
+            if selected.any():
+                perf = np.where(selected, registry.get(sport).performance_kernel(self.perfs), perf)
+
+        hrv = self.bio["hrv_rmssd_ms"]
+        reaction = self.bio["reaction_ms"]
+        gsr = self.bio["gsr_microsiemens"]
+        sleep = self.bio["sleep_hours"]
+        sleep_score = np.where((sleep >= 7) & (sleep <= 9), 100.0,
+                               _normalize(100 - np.abs(8 - sleep) * 20))
+        phys = _masked_mean(
+            [_normalize((hrv - 20) * 1.25),
+             _normalize(100 - (reaction - 150) * 0.5),
+             _normalize(100 - (gsr - 2) * 10),
+             sleep_score],
+            [~np.isnan(hrv), ~np.isnan(reaction), ~np.isnan(gsr), ~np.isnan(sleep)],
+            50.0
+        )
+        phys = np.where(self.has_biometrics, phys, 50.0)
+
+        # Trajectory comes from the shared DOB table at extraction time
+        return 0.5 * perf + 0.4 * phys + 0.1 * self.trajectory
+
+    def cognitive_leverage(self) -> np.ndarray:
+        """Vectorized compute_cognitive_leverage, before the final normalize"""
+        hrv = self.bio["hrv_rmssd_ms"]
+        reaction = self.bio["reaction_ms"]
+        gsr = self.bio["gsr_microsiemens"]
+        has_hrv, has_reaction, has_gsr = ~np.isnan(hrv), ~np.isnan(reaction), ~np.isnan(gsr)
+
+        neural = np.where(has_reaction, _normalize(100 - (reaction - 150)), 50.0)
+        composure = _masked_mean(
+            [_normalize((hrv - 20) * 1.25), _normalize(100 - (gsr - 2) * 10)],
+            [has_hrv, has_gsr],
+            50.0
+        )
+        return 0.6 * neural + 0.4 * composure
+
+    def has_cognitive_data(self) -> np.ndarray:
+        """Players whose biometrics carry at least one cognitive input"""
+        return ~(np.isnan(self.bio["reaction_ms"]) & np.isnan(self.bio["hrv_rmssd_ms"]) &
+                 np.isnan(self.bio["gsr_microsiemens"]))
+
+    def nil_trust(self) -> np.ndarray:
+        """Vectorized compute_nil_trust, before the final normalize"""
+        engagement = self.nil["engagement_rate"]
+        deals = self.nil["deals_last_90d"]
+        value = self.nil["deal_value_90d_usd"]
+        search = self.nil["search_index"]
+        local = self.nil["local_popularity_index"]
+
+        authenticity = np.where(~np.isnan(engagement), _normalize(engagement * 20), 50.0)
+        velocity = _masked_mean(
+            [_normalize(deals * 10), _normalize(value / 1000)],
+            [~np.isnan(deals), ~np.isnan(value)],
+            50.0
+        )
+        salience = _masked_mean(
+            [_normalize(search), _normalize(local)],
+            [~np.isnan(search), ~np.isnan(local)],
+            50.0
+        )
+        return 0.6 * authenticity + 0.25 * velocity + 0.15 * salience
+
+
+def compute_scores(players: List[Dict[str, Any]], reference: Optional[datetime] = None) -> List[Optional[tuple]]:
+    """
+    Compute (champion_readiness, cognitive_leverage, nil_trust_score) for each player.
+    Entries are None for players that must go through the scalar path.
+    """
+    if not players:
+        return []
+
+    batch = HAVFBatch(players, reference)
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        champion = _to_scores(batch.champion_readiness())
+        cognitive = _to_scores(batch.cognitive_leverage())
+        nil_trust = _to_scores(batch.nil_trust())
+        has_cognitive = batch.has_cognitive_data()
+
+    results = []
+    for i in range(batch.size):
+        if batch.fallback[i]:
+            results.append(None)
+            continue
+
+        if not batch.has_biometrics[i]:
+            cl = 25.0  # Default low score for missing data
+        elif not has_cognitive[i]:
+            cl = None
+        else:
+            cl = cognitive[i]
+        nil = nil_trust[i] if batch.has_nil[i] else 15.0
+
+        results.append((champion[i], cl, nil))
+    return results
+
+
+def compute_all_batch(players: List[Dict[str, Any]], now_iso: Optional[str] = None,
+                      reference: Optional[datetime] = None) -> None:
+    """
+    Apply HAV-F computation to all players in-place using the batch engine.
+    Ages are computed as of reference (default: now).
+    """
+    if now_iso is None:
+        now_iso = datetime.utcnow().isoformat() + "Z"
+
+    if reference is None:
+        reference = datetime.now()
+
+    for player, scores in zip(players, compute_scores(players, reference)):
+        if scores is None:
+            stamp_havf(player, now_iso, reference)
+        else:
+            write_havf_scores(player, *scores, now_iso)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Disk-backed HTTP response cache for Blaze Intelligence live fetchers
+Responses are kept under 02_DATA/worker-cache/http with their ETag and
+Last-Modified validators. Within an endpoint's TTL the cached body is used
+without a request; after it, the fetcher revalidates with If-None-Match /
+If-Modified-Since and a 304 costs no download.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from ingestion.league_writer import atomic_write
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         '02_DATA', 'worker-cache', 'http')
+
+# Seconds a cached response is used without revalidation, per endpoint
+CACHE_TTLS = {
+    'mlb_teams': 24 * 3600,  # Team IDs change between seasons at most
+    'nflverse_player_stats': 6 * 3600  # Rebuilt nightly upstream
+}
+DEFAULT_TTL = 0  # Always revalidate
+
+
+class HTTPCache:
+    """Cached response bodies plus validators, keyed by URL and params"""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttls: Optional[Dict[str, float]] = None):
+        self.cache_dir = cache_dir
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+
+    def ttl(self, endpoint: Optional[str]) -> float:
+        """Freshness lifetime for an endpoint"""
+        return self.ttls.get(endpoint, DEFAULT_TTL)
+
+    def _paths(self, url: str, params: Optional[Dict] = None):
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, digest)
+        return base + '.meta.json', base + '.body'
+
+    def load(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Cached entry {'meta', 'body'} or None"""
+        meta_path, body_path = self._paths(url, params)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, encoding='utf-8') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return {'meta': meta, 'body': body}
+
+    def is_fresh(self, entry: Dict[str, Any], endpoint: Optional[str]) -> bool:
+        return time.time() - entry['meta'].get('stored_at', 0) < self.ttl(endpoint)
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Revalidation headers for a cached entry"""
+        if not entry:
+            return {}
+        headers = {}
+        if entry['meta'].get('etag'):
+            headers['If-None-Match'] = entry['meta']['etag']
+        if entry['meta'].get('last_modified'):
+            headers['If-Modified-Since'] = entry['meta']['last_modified']
+        return headers
+
+    def store(self, url: str, params: Optional[Dict], body: str,
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Save a body with its validators; the body is written before its metadata"""
+        meta_path, body_path = self._paths(url, params)
+        with atomic_write(body_path) as f:
+            f.write(body)
+        self._write_meta(meta_path, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time()
+        })
+
+    def touch(self, url: str, params: Optional[Dict], entry: Dict[str, Any]) -> None:
+        """Restart an entry's TTL after a 304"""
+        meta_path, _ = self._paths(url, params)
+        self._write_meta(meta_path, dict(entry['meta'], stored_at=time.time()))
+
+    def _write_meta(self, path: str, meta: Dict[str, Any]) -> None:
+        with atomic_write(path) as f:
+            json.dump(meta, f)
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Process-wide cache shared by all fetchers"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache()
+        return _shared_cache
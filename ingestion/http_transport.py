@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP transport for Blaze Intelligence live fetchers
+One keep-alive requests.Session shared by every fetcher, with per-host
+connection limits so independent requests can overlap safely
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Concurrent connections allowed per upstream host
+HOST_CONNECTION_LIMITS = {
+    'statsapi.mlb.com': 8,
+    'baseballsavant.mlb.com': 2,
+    'raw.githubusercontent.com': 4,
+    'site.api.espn.com': 4,
+    'api.collegefootballdata.com': 4,
+    'stats.nba.com': 2,  # NBA API is strict
+    'www.thesportsdb.com': 2
+}
+DEFAULT_HOST_CONNECTION_LIMIT = 4
+
+# Hosts kept in the connection pool
+POOL_CONNECTIONS = 16
+
+
+class HTTPTransport:
+    """Keep-alive session with per-host connection limits"""
+
+    def __init__(self, host_limits: Optional[Dict[str, int]] = None,
+                 default_limit: int = DEFAULT_HOST_CONNECTION_LIMIT):
+        self.host_limits = dict(HOST_CONNECTION_LIMITS if host_limits is None else host_limits)
+        self.default_limit = default_limit
+
+        self.session = requests.Session()
+        pool_size = max([default_limit] + list(self.host_limits.values()))
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots = {}
+
+    def host_limit(self, host: str) -> int:
+        """Connection limit for a host"""
+        return self.host_limits.get(host, self.default_limit)
+
+    def _slots(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = threading.BoundedSemaphore(self.host_limit(host))
+                self._host_slots[host] = slots
+            return slots
+
+    def get(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None,
+            timeout: float = 30) -> requests.Response:
+        """GET over the pooled session, waiting for a free slot on the host"""
+        with self._slots(urlsplit(url).hostname or ''):
+            return self.session.get(url, headers=headers, params=params, timeout=timeout)
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int) -> List[Any]:
+        """
+        Apply fn to items concurrently, preserving order.
+        fn is expected to issue its requests through this transport, so the
+        per-host limits still apply.
+        """
+        items = list(items)
+        if max_workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items)),
+                                thread_name_prefix='blaze-http') as pool:
+            return list(pool.map(fn, items))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared_transport = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Process-wide transport shared by all fetchers"""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HTTPTransport()
+        return _shared_transport
@@ -0,0 +1,114 @@
+"""
+Streaming, atomic JSON writer for league output files.
+Players are encoded one at a time from any iterable (list or generator), so
+the full roster never needs to be serialized in memory at once. Output goes
+to a temp file in the target directory, is fsynced, then renamed over the
+target, so readers never observe a partially written file.
+
+The indented output is byte-identical to json.dump(..., indent=2) of
+{"league", "generated_at", "players"}; compact mode drops all whitespace.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Any, Optional, TextIO, Iterator
+
+
+# Players are buffered and flushed to the file in chunks of this many characters
+WRITE_BUFFER_CHARS = 1 << 16
+
+# Permissions for newly created files (mkstemp creates 0600)
+DEFAULT_FILE_MODE = 0o644
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w') -> Iterator[TextIO]:
+    """
+    Open a temp file next to path for writing ('w', or 'wb' for binary);
+    on success fsync it and atomically replace path. On error the temp file
+    is removed and path is left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    try:
+        file_mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        file_mode = DEFAULT_FILE_MODE
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), file_mode)
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Persist the rename itself (best effort; not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_league_file(path: str, league: str, players: Iterable[Dict[str, Any]],
+                      generated_at: Optional[str] = None, compact: bool = False) -> int:
+    """
+    Stream a league output file atomically.
+    Returns the number of players written.
+    """
+    if generated_at is None:
+        generated_at = datetime.utcnow().isoformat() + 'Z'
+
+    if compact:
+        encoder = json.JSONEncoder(separators=(',', ':'))
+        open_players, separator, close_players = '[', ',', ']}'
+        encode = encoder.encode
+        header = '{"league":%s,"generated_at":%s,"players":' % (encoder.encode(league), encoder.encode(generated_at))
+    else:
+        encoder = json.JSONEncoder(indent=2)
+        open_players, separator, close_players = '[\n    ', ',\n    ', '\n  ]\n}'
+        # Players sit two levels deep in the document
+        encode = lambda player: encoder.encode(player).replace('\n', '\n    ')
+        header = '{\n  "league": %s,\n  "generated_at": %s,\n  "players": ' % (
+            encoder.encode(league), encoder.encode(generated_at))
+
+    count = 0
+    with atomic_write(path) as f:
+        f.write(header)
+
+        buffer, size = [], 0
+        for player in players:
+            chunk = (separator if count else open_players) + encode(player)
+            buffer.append(chunk)
+            size += len(chunk)
+            count += 1
+            if size >= WRITE_BUFFER_CHARS:
+                f.write(''.join(buffer))
+                buffer, size = [], 0
+
+        buffer.append(close_players if count else '[]}' if compact else '[]\n}')
+        f.write(''.join(buffer))
+
+    return count
@@ -8,31 +8,45 @@ import requests
 import time
 import csv
 from io import StringIO
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Iterable, Optional
+from urllib.parse import urlsplit
 import os
 import json
 
+from ingestion.http_transport import HTTPTransport, get_transport
+from ingestion.rate_limiter import HostRateLimiter, get_rate_limiter
+from ingestion.http_cache import HTTPCache, get_http_cache
+
 
 class BaseLiveFetcher:
     """Base class for live data fetching with rate limiting"""
     
-    def __init__(self, rate_limit: float = 0.5):
-        self.rate_limit = rate_limit  # seconds between requests
-        self.last_request = 0
+    def __init__(self, rate_limit: float = 0.5, transport: Optional[HTTPTransport] = None,
+                 limiter: Optional[HostRateLimiter] = None, cache: Optional[HTTPCache] = None):
+        self.rate_limit = rate_limit  # seconds between requests for hosts without a configured limit
+        self.transport = transport or get_transport()  # Shared keep-alive session
+        self.limiter = limiter or get_rate_limiter()  # Shared per-host token buckets
+        self.cache = cache or get_http_cache()  # Conditional-request response cache
+    
+    def _throttle(self, url: str) -> float:
+        """Wait for the token bucket of url's host"""
+        rate = 1 / self.rate_limit if self.rate_limit > 0 else 0
+        return self.limiter.acquire(urlsplit(url).hostname or '', rate=rate)
     
-    def _throttle(self):
-        """Ensure rate limiting between requests"""
-        elapsed = time.time() - self.last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self.last_request = time.time()
+    def fetch_concurrently(self, fn: Callable[[Any], Any], items: Iterable[Any], url: str) -> List[Any]:
+        """
+        Apply fn to items with overlapping requests, up to the connection
+        limit of url's host; results keep the order of items.
+        """
+        max_workers = self.transport.host_limit(urlsplit(url).hostname or '')
+        return self.transport.map(fn, items, max_workers)
     
     def _retry_request(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None, max_retries: int = 3) -> requests.Response:
         """Make HTTP request with exponential backoff retry"""
         for attempt in range(max_retries):
             try:
-                self._throttle()
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                self._throttle(url)
+                response = self.transport.get(url, headers=headers, params=params, timeout=30)
                 
                 if response.status_code == 429:  # Rate limited
                     wait_time = 2 ** attempt
@@ -52,6 +66,28 @@ class BaseLiveFetcher:
                 time.sleep(wait_time)
         
         raise requests.RequestException("Max retries exceeded")
+    
+    def _cached_request(self, url: str, endpoint: str, headers: Optional[Dict] = None,
+                        params: Optional[Dict] = None) -> str:
+        """
+        Response body from the disk cache while the endpoint's TTL holds,
+        otherwise revalidated with ETag/Last-Modified (304 reuses the body)
+        """
+        entry = self.cache.load(url, params)
+        if entry and self.cache.is_fresh(entry, endpoint):
+            return entry['body']
+        
+        request_headers = dict(headers or {}, **self.cache.conditional_headers(entry))
+        response = self._retry_request(url, headers=request_headers, params=params)
+        
+        if response.status_code == 304 and entry:
+            self.cache.touch(url, params, entry)
+            return entry['body']
+        
+        self.cache.store(url, params, response.text,
+                         etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'))
+        return response.text
 
 
 class MLBLiveFetcher(BaseLiveFetcher):
@@ -64,15 +100,8 @@ class MLBLiveFetcher(BaseLiveFetcher):
     
     def get_team_roster(self, team_abbr: str = "STL") -> List[Dict[str, Any]]:
         """Get current roster for a team"""
-        # First get team ID
-        teams_response = self._retry_request(f"{self.api_url}/teams")
-        teams_data = teams_response.json()
-        
-        team_id = None
-        for team in teams_data.get("teams", []):
-            if team.get("abbreviation") == team_abbr:
-                team_id = team.get("id")
-                break
+        # First get team ID (cached /teams lookup)
+        team_id = self.get_team_ids().get(team_abbr)
         
         if not team_id:
             raise ValueError(f"Team {team_abbr} not found")
@@ -83,6 +112,11 @@ class MLBLiveFetcher(BaseLiveFetcher):
         
         return roster_data.get("roster", [])
     
+    def get_team_ids(self) -> Dict[str, int]:
+        """Team abbreviation -> MLB team ID, from the cached /teams response"""
+        teams_data = json.loads(self._cached_request(f"{self.api_url}/teams", "mlb_teams"))
+        return {team.get("abbreviation"): team.get("id") for team in teams_data.get("teams", [])}
+    
     def get_player_stats(self, player_id: str, season: str = "2024") -> Dict[str, Any]:
         """Get player stats from MLB Stats API"""
         stats_response = self._retry_request(
@@ -91,6 +125,11 @@ class MLBLiveFetcher(BaseLiveFetcher):
         )
         return stats_response.json()
     
+    def get_players_stats(self, player_ids: List[str], season: str = "2024") -> List[Dict[str, Any]]:
+        """Get stats for many players with overlapping requests"""
+        return self.fetch_concurrently(
+            lambda player_id: self.get_player_stats(player_id, season), player_ids, self.api_url)
+    
     def get_statcast_data(self, team_abbr: str = "STL", season: str = "2024", player_type: str = "batter") -> List[Dict[str, Any]]:
         """Get Statcast data from Baseball Savant"""
         url = f"{self.base_url}/statcast_search/csv"
@@ -120,8 +159,7 @@ class NFLLiveFetcher(BaseLiveFetcher):
         """Get player stats from nflverse"""
         url = f"{self.nflverse_base}/player_stats_{season}.json"
         
-        response = self._retry_request(url)
-        data = response.json()
+        data = json.loads(self._cached_request(url, "nflverse_player_stats"))
         
         if team_abbr:
             # Filter by team
@@ -7,14 +7,17 @@ import json
 import os
 import sys
 import argparse
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import Dict, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from ingestion.havf import compute_all
+from ingestion.pipeline import AgentPipeline
+from ingestion.team_registry import team_index
 
 
-class MLBAgent:
+class MLBAgent(AgentPipeline):
+    league = 'MLB'
+    agent_name = 'MLB'
+    
     def __init__(self):
         self.mock_path = os.path.join(os.path.dirname(__file__), 'mocks', 'mlb_mock.json')
         self.output_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
@@ -31,22 +34,22 @@ class MLBAgent:
                 roster = fetcher.get_team_roster(team_abbr)
                 players = []
                 
-                for player_info in roster[:5]:  # Limit to 5 players for demo
-                    player_id = player_info.get('person', {}).get('id')
-                    if player_id:
-                        stats = fetcher.get_player_stats(str(player_id))
-                        
-                        # Convert live data to mock format
-                        player = {
-                            'id': f"MLB-{team_abbr}-{player_info.get('person', {}).get('fullName', '').replace(' ', '-').lower()}",
-                            'name': player_info.get('person', {}).get('fullName', 'Unknown'),
-                            'team_id': f"MLB-{team_abbr}",
-                            'position': player_info.get('position', {}).get('abbreviation', 'Unknown'),
-                            'stats': self._extract_live_stats(stats),
-                            'biometrics': None,  # Not available from MLB API
-                            'projections': {}
-                        }
-                        players.append(player)
+                # Limit to 5 players for demo; stats requests overlap on the pooled transport
+                roster = [p for p in roster[:5] if p.get('person', {}).get('id')]
+                all_stats = fetcher.get_players_stats([str(p['person']['id']) for p in roster])
+                
+                for player_info, stats in zip(roster, all_stats):
+                    # Convert live data to mock format
+                    player = {
+                        'id': f"MLB-{team_abbr}-{player_info.get('person', {}).get('fullName', '').replace(' ', '-').lower()}",
+                        'name': player_info.get('person', {}).get('fullName', 'Unknown'),
+                        'team_id': team_index.team_id('MLB', team_abbr),
+                        'position': player_info.get('position', {}).get('abbreviation', 'Unknown'),
+                        'stats': self._extract_live_stats(stats),
+                        'biometrics': None,  # Not available from MLB API
+                        'projections': {}
+                    }
+                    players.append(player)
                 
                 print(f"Fetched {len(players)} live MLB players")
                 return {'players': players}
@@ -83,78 +86,50 @@ class MLBAgent:
         
         return stats
     
-    def normalize(self, raw: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Normalize to Blaze schema"""
-        players = []
-        now_iso = datetime.utcnow().isoformat() + 'Z'
-        
-        for raw_player in raw.get('players', []):
-            player = {
-                'player_id': raw_player.get('id', f"MLB-{raw_player.get('name', '').replace(' ', '-')}"),
-                'name': raw_player['name'],
-                'sport': 'MLB',
-                'league': 'MLB',
-                'team_id': raw_player.get('team_id', 'MLB-STL'),
-                'position': raw_player.get('position', 'Unknown'),
-                'bio': {
-                    'dob': raw_player.get('dob'),
-                    'height_cm': raw_player.get('height_cm'),
-                    'weight_kg': raw_player.get('weight_kg'),
-                    'class_year': None  # MLB doesn't have class years
-                },
-                'stats': {
-                    'season': '2024',
-                    'perfs': raw_player.get('stats', {})
-                },
-                'projections': {
-                    'season': '2025',
-                    'model': None,
-                    'values': raw_player.get('projections', {})
-                },
-                'nil_profile': raw_player.get('nil_profile'),
-                'biometrics': raw_player.get('biometrics'),
-                'hav_f': {},
-                'meta': {
-                    'sources': ['Statcast', 'Baseball Savant'],
-                    'updated_at': now_iso
-                }
+    def normalize_player(self, raw_player: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Normalize one player to Blaze schema"""
+        return {
+            'player_id': raw_player.get('id', f"MLB-{raw_player.get('name', '').replace(' ', '-')}"),
+            'name': raw_player['name'],
+            'sport': 'MLB',
+            'league': 'MLB',
+            'team_id': raw_player.get('team_id', 'MLB-STL'),
+            'position': raw_player.get('position', 'Unknown'),
+            'bio': {
+                'dob': raw_player.get('dob'),
+                'height_cm': raw_player.get('height_cm'),
+                'weight_kg': raw_player.get('weight_kg'),
+                'class_year': None  # MLB doesn't have class years
+            },
+            'stats': {
+                'season': '2024',
+                'perfs': raw_player.get('stats', {})
+            },
+            'projections': {
+                'season': '2025',
+                'model': None,
+                'values': raw_player.get('projections', {})
+            },
+            'nil_profile': raw_player.get('nil_profile'),
+            'biometrics': raw_player.get('biometrics'),
+            'hav_f': {},
+            'meta': {
+                'sources': ['Statcast', 'Baseball Savant'],
+                'updated_at': now_iso
             }
-            players.append(player)
-        
-        return players
-    
-    def run(self, params: Dict[str, Any], live: bool = False) -> bool:
-        """Run pipeline"""
-        try:
-            raw = self.fetch_raw(params, live)
-            players = self.normalize(raw)
-            compute_all(players)
-            
-            # Save
-            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-            with open(self.output_path, 'w') as f:
-                json.dump({
-                    'league': 'MLB',
-                    'generated_at': datetime.utcnow().isoformat() + 'Z',
-                    'players': players
-                }, f, indent=2)
-            
-            print(f"MLB Agent: Saved {len(players)} players")
-            return True
-        except Exception as e:
-            print(f"MLB Agent failed: {e}")
-            return False
+        }
 
 
 def main():
     parser = argparse.ArgumentParser(description='MLB Data Ingestion Agent')
     parser.add_argument('--live', action='store_true')
     parser.add_argument('--mock', action='store_true')
+    parser.add_argument('--compact', action='store_true', help='Write non-indented JSON')
     parser.add_argument('--team', default='STL')
     args = parser.parse_args()
     
     agent = MLBAgent()
-    success = agent.run({'team': args.team}, live=args.live)
+    success = agent.run({'team': args.team, 'compact': args.compact}, live=args.live)
     sys.exit(0 if success else 1)
 
 
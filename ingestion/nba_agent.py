@@ -6,11 +6,20 @@ Fetches live Memphis Grizzlies data and other NBA teams using NBA Stats API
 
 import requests
 import json
+import os
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
 import logging
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ingestion.scoring_registry import registry
+from ingestion.team_registry import Team, team_index
+from ingestion.http_transport import HTTPTransport, get_transport
+from ingestion.rate_limiter import HostRateLimiter, get_rate_limiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,19 +28,24 @@ logger = logging.getLogger(__name__)
 class NBADataAgent:
     """Agent for fetching and processing NBA data"""
     
-    def __init__(self, team_focus: List[str] = None):
-        self.team_focus = team_focus or ["1610612763"]  # Memphis Grizzlies team ID
+    def __init__(self, team_focus: List[str] = None, transport: Optional[HTTPTransport] = None,
+                 limiter: Optional[HostRateLimiter] = None, max_players: Optional[int] = 5):
+        self.team_focus = team_focus or ["MEM"]  # Memphis Grizzlies (NBA_TEAMS codes)
+        self.max_players = max_players  # Players per team (None = full roster)
         self.base_url = "https://stats.nba.com/stats"
-        self.session = requests.Session()
+        
+        # Shared keep-alive session and stats.nba.com token bucket
+        self.transport = transport or get_transport()
+        self.limiter = limiter or get_rate_limiter()
         
         # NBA API requires specific headers
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
             'Referer': 'https://www.nba.com/',
             'Connection': 'keep-alive'
-        })
+        }
         
         self.grizzlies_roster = [
             {"name": "Ja Morant", "position": "PG", "jersey": "12"},
@@ -41,8 +55,14 @@ class NBADataAgent:
             {"name": "Jaylen Wells", "position": "SF", "jersey": "0"}
         ]
         
-    def fetch_team_roster(self, team_id: str) -> List[Dict[str, Any]]:
+    def _get(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """GET through the shared session, paced by the host's rate limit"""
+        self.limiter.acquire(urlsplit(url).hostname or '')
+        return self.transport.get(url, headers=self.headers, params=params, timeout=10)
+    
+    def fetch_team_roster(self, team_id: str, fallback: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """Fetch current roster for team"""
+        fallback = self.grizzlies_roster if fallback is None else fallback
         try:
             url = f"{self.base_url}/commonteamroster"
             params = {
@@ -50,7 +70,7 @@ class NBADataAgent:
                 'Season': '2024-25'
             }
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get(url, params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -76,11 +96,11 @@ class NBADataAgent:
             
             # Fallback to predefined roster
             logger.warning(f"API call failed for team {team_id}, using predefined roster")
-            return self.grizzlies_roster
+            return fallback
             
         except Exception as e:
             logger.error(f"Error fetching roster for team {team_id}: {str(e)}")
-            return self.grizzlies_roster
+            return fallback
     
     def fetch_player_stats(self, player_id: str) -> Dict[str, Any]:
         """Fetch individual player statistics"""
@@ -92,7 +112,7 @@ class NBADataAgent:
                 'SeasonType': 'Regular Season'
             }
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get(url, params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -141,101 +161,52 @@ class NBADataAgent:
     def compute_havf_metrics(self, player_data: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, float]:
         """Compute HAV-F metrics for NBA player"""
         
-        # Champion Readiness (0-100)
-        # Based on statistical performance, experience, and team impact
-        ppg = stats.get('points_per_game', 0)
-        rpg = stats.get('rebounds_per_game', 0) 
-        apg = stats.get('assists_per_game', 0)
-        fg_pct = stats.get('field_goal_pct', 0)
-        games = stats.get('games_played', 0)
-        
-        # Performance component (0-40)
-        performance = min(40, (ppg * 1.5) + (rpg * 1.0) + (apg * 1.2) + (fg_pct * 20))
-        
-        # Physical/availability component (0-40)
-        availability = min(40, (games / 82) * 40) if games > 0 else 20
-        
-        # Experience/clutch component (0-20)
-        experience = min(20, 15)  # Base clutch factor
-        
-        champion_readiness = min(100, performance + availability + experience)
-        
-        # Cognitive Leverage (0-100)
-        # NBA requires high basketball IQ - assists and efficiency indicate this
-        court_vision = min(50, apg * 8 + (fg_pct * 25))
-        decision_making = min(50, 30 + (stats.get('three_point_pct', 0) * 20))
+        # Performance/availability/clutch, court vision and marketability
+        # formulas live in the scoring registry (ingestion/scoring_registry.py)
+        return registry.score("NBA", stats)
+    
+    def process_grizzlies_data(self) -> List[Dict[str, Any]]:
+        """Process Memphis Grizzlies roster data"""
+        return self.process_teams(["MEM"])
+    
+    def process_teams(self, team_codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process rosters for NBA_TEAMS codes. Rosters, then player stats, are
+        fetched concurrently; the shared limiter paces stats.nba.com.
+        """
+        teams = []
+        for code in team_codes:
+            team = team_index.get('NBA', code)
+            if team:
+                teams.append(team)
+            else:
+                logger.warning(f"Unknown NBA team code: {code}")
         
-        cognitive_leverage = min(100, court_vision + decision_making)
+        # Only the Grizzlies have a predefined fallback roster
+        rosters = self._fetch_concurrently(
+            lambda team: self.fetch_team_roster(
+                team.nba_id, fallback=self.grizzlies_roster if team.code == "MEM" else []),
+            teams)
         
-        # NIL Trust Score (0-100)
-        # For NBA players, this represents marketability and brand value
-        performance_factor = min(40, ppg * 2)
-        popularity_factor = 35  # Base NBA player popularity
-        consistency_factor = min(25, fg_pct * 25)
+        entries = [
+            (team, i, player)
+            for team, roster in zip(teams, rosters)
+            for i, player in enumerate(roster[:self.max_players])  # Focus on top players
+        ]
         
-        nil_trust_score = min(100, performance_factor + popularity_factor + consistency_factor)
+        def player_stats(entry):
+            team, i, player = entry
+            player_id = self._roster_player_id(player, i)
+            return self.fetch_player_stats(player_id) if player_id.isdigit() else {}
         
-        return {
-            "champion_readiness": round(champion_readiness, 1),
-            "cognitive_leverage": round(cognitive_leverage, 1), 
-            "nil_trust_score": round(nil_trust_score, 1)
-        }
-    
-    def process_grizzlies_data(self) -> List[Dict[str, Any]]:
-        """Process Memphis Grizzlies roster data"""
-        team_id = "1610612763"  # Memphis Grizzlies
-        roster = self.fetch_team_roster(team_id)
+        all_stats = self._fetch_concurrently(player_stats, entries)
         
         processed_players = []
-        
-        for i, player in enumerate(roster[:5]):  # Focus on top 5 players
+        for (team, i, player), stats in zip(entries, all_stats):
             try:
-                # Get player stats
-                player_id = player.get('player_id', f'nba_griz_{i}')
-                stats = self.fetch_player_stats(player_id) if player_id.isdigit() else {}
-                
-                # Compute HAV-F metrics
-                havf_metrics = self.compute_havf_metrics(player, stats)
-                
-                # Create Blaze Intelligence player record
-                blaze_player = {
-                    "player_id": f"nba_mem_{player_id}",
-                    "name": player.get('name', f'Grizzlies Player {i+1}'),
-                    "sport": "basketball",
-                    "league": "NBA",
-                    "team_id": "nba_mem",
-                    "team_name": "Memphis Grizzlies",
-                    "position": player.get('position', 'G'),
-                    "jersey_number": str(player.get('jersey', i+1)),
-                    "height": player.get('height', '6-2'),
-                    "weight": player.get('weight', '200'),
-                    "age": 24,  # Average NBA age
-                    "experience_years": player.get('experience', 3),
-                    "school": player.get('school', 'Unknown'),
-                    "stats": {
-                        "season": "2024-25",
-                        "games_played": stats.get('games_played', 0),
-                        "points_per_game": stats.get('points_per_game', 0.0),
-                        "rebounds_per_game": stats.get('rebounds_per_game', 0.0),
-                        "assists_per_game": stats.get('assists_per_game', 0.0),
-                        "field_goal_percentage": stats.get('field_goal_pct', 0.0),
-                        "three_point_percentage": stats.get('three_point_pct', 0.0),
-                        "free_throw_percentage": stats.get('free_throw_pct', 0.0),
-                        "minutes_per_game": stats.get('minutes_per_game', 0.0)
-                    },
-                    "havf_scores": havf_metrics,
-                    "metadata": {
-                        "last_updated": datetime.now().isoformat(),
-                        "data_source": "nba_stats_api",
-                        "agent_version": "1.0"
-                    }
-                }
-                
+                blaze_player = self.build_player(team, i, player, stats)
                 processed_players.append(blaze_player)
-                logger.info(f"✅ Processed NBA player: {blaze_player['name']} (Readiness: {havf_metrics['champion_readiness']})")
-                
-                # Rate limiting
-                time.sleep(1)
+                logger.info(f"✅ Processed NBA player: {blaze_player['name']} (Readiness: {blaze_player['havf_scores']['champion_readiness']})")
                 
             except Exception as e:
                 logger.error(f"Error processing player {player.get('name', 'Unknown')}: {str(e)}")
@@ -243,12 +214,64 @@ class NBADataAgent:
         
         return processed_players
     
+    def _fetch_concurrently(self, fn, items: List[Any]) -> List[Any]:
+        """Apply fn to items up to the stats.nba.com connection limit, keeping order"""
+        max_workers = self.transport.host_limit(urlsplit(self.base_url).hostname)
+        return self.transport.map(fn, items, max_workers)
+    
+    def _roster_player_id(self, player: Dict[str, Any], i: int) -> str:
+        # Only the predefined Grizzlies roster lacks NBA player IDs
+        return player.get('player_id', f'nba_griz_{i}')
+    
+    def build_player(self, team: Team, i: int, player: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a Blaze Intelligence player record"""
+        player_id = self._roster_player_id(player, i)
+        
+        # Compute HAV-F metrics
+        havf_metrics = self.compute_havf_metrics(player, stats)
+        
+        return {
+            "player_id": f"{team.slug}_{player_id}",
+            "name": player.get('name', f"{team.name} Player {i+1}"),
+            "sport": "basketball",
+            "league": "NBA",
+            "team_id": team.slug,
+            "team_name": team.name,
+            "position": player.get('position', 'G'),
+            "jersey_number": str(player.get('jersey', i+1)),
+            "height": player.get('height', '6-2'),
+            "weight": player.get('weight', '200'),
+            "age": 24,  # Average NBA age
+            "experience_years": player.get('experience', 3),
+            "school": player.get('school', 'Unknown'),
+            "stats": {
+                "season": "2024-25",
+                "games_played": stats.get('games_played', 0),
+                "points_per_game": stats.get('points_per_game', 0.0),
+                "rebounds_per_game": stats.get('rebounds_per_game', 0.0),
+                "assists_per_game": stats.get('assists_per_game', 0.0),
+                "field_goal_percentage": stats.get('field_goal_pct', 0.0),
+                "three_point_percentage": stats.get('three_point_pct', 0.0),
+                "free_throw_percentage": stats.get('free_throw_pct', 0.0),
+                "minutes_per_game": stats.get('minutes_per_game', 0.0)
+            },
+            "havf_scores": havf_metrics,
+            "metadata": {
+                "last_updated": datetime.now().isoformat(),
+                "data_source": "nba_stats_api",
+                "agent_version": "1.0"
+            }
+        }
+    
     def save_data(self, players: List[Dict[str, Any]]) -> str:
         """Save processed data to JSON file"""
-        output_file = f"data/nba_grizzlies_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        team_names = sorted(set(p["team_name"] for p in players))
+        label = "grizzlies" if team_names == ["Memphis Grizzlies"] else "teams"
+        output_file = f"data/nba_{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         output_data = {
-            "team": "Memphis Grizzlies",
+            "team": team_names[0] if len(team_names) == 1 else "NBA",
+            "teams": team_names,
             "league": "NBA", 
             "data_timestamp": datetime.now().isoformat(),
             "player_count": len(players),
@@ -274,14 +297,24 @@ class NBADataAgent:
 
     def run(self, params: Dict[str, Any] = None, live: bool = False) -> bool:
         """Run NBA agent with orchestrator interface"""
+        params = params or {}
+        if params.get('teams'):
+            team_codes = params['teams']
+        elif params.get('team'):
+            team_codes = [params['team']]
+        else:
+            team_codes = self.team_focus
+        
         try:
-            print("🏀 NBA Data Agent - Processing Memphis Grizzlies...")
+            names = [getattr(team_index.get('NBA', code), 'name', code) for code in team_codes]
+            print(f"🏀 NBA Data Agent - Processing {', '.join(names)}...")
             
-            # Process Grizzlies data
-            players = self.process_grizzlies_data()
+            start = time.perf_counter()
+            players = self.process_teams(team_codes)
             
             if players:
-                print(f"✅ Processed {len(players)} Grizzlies players")
+                print(f"✅ Processed {len(players)} players from {len(set(p['team_id'] for p in players))} teams "
+                      f"in {time.perf_counter() - start:.1f}s")
                 
                 # Save data
                 output_file = self.save_data(players)
@@ -302,11 +335,20 @@ class NBADataAgent:
 
 
 def main():
-    """Test the NBA agent"""
+    """Run the NBA agent"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='NBA Data Agent')
+    parser.add_argument('--teams', default='MEM', help='Comma-separated NBA team codes (default: MEM)')
+    parser.add_argument('--all-teams', action='store_true', help='Process all 30 NBA teams')
+    parser.add_argument('--full-roster', action='store_true', help='Process every rostered player, not the top 5')
+    args = parser.parse_args()
+    
     print("🏀 BLAZE INTELLIGENCE - NBA DATA AGENT")
     print("=" * 50)
     
-    agent = NBADataAgent()
+    teams = [team.code for team in team_index.in_league('NBA')] if args.all_teams else [code.strip().upper() for code in args.teams.split(',')]
+    agent = NBADataAgent(team_focus=teams, max_players=None if args.full_roster else 5)
     success = agent.run()
     
     if success:
@@ -316,4 +358,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -7,14 +7,16 @@ import json
 import os
 import sys
 import argparse
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import Dict, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from ingestion.havf import compute_all
+from ingestion.pipeline import AgentPipeline
 
 
-class NFLAgent:
+class NFLAgent(AgentPipeline):
+    league = 'NFL'
+    agent_name = 'NFL'
+    
     def __init__(self):
         self.mock_path = os.path.join(os.path.dirname(__file__), 'mocks', 'nfl_mock.json')
         self.output_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
@@ -42,73 +44,45 @@ class NFLAgent:
         except:
             return {'players': []}
     
-    def normalize(self, raw: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Normalize to Blaze schema"""
-        players = []
-        now_iso = datetime.utcnow().isoformat() + 'Z'
-        
-        for raw_player in raw.get('players', []):
-            player = {
-                'player_id': raw_player.get('id', f"NFL-{raw_player.get('name', '').replace(' ', '-')}"),
-                'name': raw_player['name'],
-                'sport': 'NFL',
-                'league': 'NFL',
-                'team_id': raw_player.get('team_id', 'NFL-TEN'),
-                'position': raw_player.get('position', 'Unknown'),
-                'bio': raw_player.get('bio', {}),
-                'stats': {
-                    'season': '2024',
-                    'perfs': raw_player.get('stats', {})
-                },
-                'projections': {
-                    'season': '2025',
-                    'model': None,
-                    'values': raw_player.get('projections', {})
-                },
-                'nil_profile': raw_player.get('nil_profile'),
-                'biometrics': raw_player.get('biometrics'),
-                'hav_f': {},
-                'meta': {
-                    'sources': ['nflverse', 'nflfastR'],
-                    'updated_at': now_iso
-                }
+    def normalize_player(self, raw_player: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Normalize one player to Blaze schema"""
+        return {
+            'player_id': raw_player.get('id', f"NFL-{raw_player.get('name', '').replace(' ', '-')}"),
+            'name': raw_player['name'],
+            'sport': 'NFL',
+            'league': 'NFL',
+            'team_id': raw_player.get('team_id', 'NFL-TEN'),
+            'position': raw_player.get('position', 'Unknown'),
+            'bio': raw_player.get('bio', {}),
+            'stats': {
+                'season': '2024',
+                'perfs': raw_player.get('stats', {})
+            },
+            'projections': {
+                'season': '2025',
+                'model': None,
+                'values': raw_player.get('projections', {})
+            },
+            'nil_profile': raw_player.get('nil_profile'),
+            'biometrics': raw_player.get('biometrics'),
+            'hav_f': {},
+            'meta': {
+                'sources': ['nflverse', 'nflfastR'],
+                'updated_at': now_iso
             }
-            players.append(player)
-        
-        return players
-    
-    def run(self, params: Dict[str, Any], live: bool = False) -> bool:
-        """Run pipeline"""
-        try:
-            raw = self.fetch_raw(params, live)
-            players = self.normalize(raw)
-            compute_all(players)
-            
-            # Save
-            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-            with open(self.output_path, 'w') as f:
-                json.dump({
-                    'league': 'NFL',
-                    'generated_at': datetime.utcnow().isoformat() + 'Z',
-                    'players': players
-                }, f, indent=2)
-            
-            print(f"NFL Agent: Saved {len(players)} players")
-            return True
-        except Exception as e:
-            print(f"NFL Agent failed: {e}")
-            return False
+        }
 
 
 def main():
     parser = argparse.ArgumentParser(description='NFL Data Ingestion Agent')
     parser.add_argument('--live', action='store_true')
     parser.add_argument('--mock', action='store_true')
+    parser.add_argument('--compact', action='store_true', help='Write non-indented JSON')
     parser.add_argument('--team', default='TEN')
     args = parser.parse_args()
     
     agent = NFLAgent()
-    success = agent.run({'team': args.team}, live=args.live)
+    success = agent.run({'team': args.team, 'compact': args.compact}, live=args.live)
     sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,132 @@
+"""
+Streaming ingestion pipeline shared by the league agents.
+Chains fetch_raw -> normalize -> HAV-F scoring -> league writer as
+generators, so only one scoring chunk of normalized players is held in
+memory at a time, and records how long each stage takes.
+
+Agents subclass AgentPipeline and implement fetch_raw and normalize_player;
+normalize (list-returning) is provided for callers that want the whole roster.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from ingestion.havf import compute_all, load_previous_havf
+from ingestion.league_writer import write_league_file
+
+
+# Players scored per compute_all call; large enough for the batch engine
+SCORE_CHUNK_SIZE = 1024
+
+PIPELINE_STAGES = ('fetch', 'normalize', 'score', 'write')
+
+
+class AgentPipeline:
+    """Base class for league agents: fetch -> normalize -> score -> write"""
+
+    # Output league label and name used in status messages
+    league = None
+    agent_name = None
+    output_path = None
+
+    def fetch_raw(self, params: Dict[str, Any], live: bool = False) -> Dict[str, Any]:
+        """Fetch raw data with a 'players' list"""
+        raise NotImplementedError
+
+    def normalize_player(self, raw_player: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Normalize one raw player to the Blaze schema"""
+        raise NotImplementedError
+
+    def normalize_iter(self, raw: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield normalized players one at a time"""
+        now_iso = datetime.utcnow().isoformat() + 'Z'
+        for raw_player in raw.get('players', []):
+            yield self.normalize_player(raw_player, now_iso)
+
+    def normalize(self, raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Normalize to Blaze schema"""
+        return list(self.normalize_iter(raw))
+
+    def score_iter(self, players: Iterable[Dict[str, Any]],
+                   previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                   chunk_size: int = SCORE_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """Stamp HAV-F scores chunk by chunk, reusing unchanged previous scores"""
+        chunk = []
+        for player in players:
+            chunk.append(player)
+            if len(chunk) >= chunk_size:
+                yield from self._score_chunk(chunk, previous)
+                chunk = []
+        if chunk:
+            yield from self._score_chunk(chunk, previous)
+
+    def _score_chunk(self, chunk: List[Dict[str, Any]],
+                     previous: Optional[Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        self.counters['rescored'] += compute_all(chunk, previous=previous)
+        return chunk
+
+    def _timed(self, stage: str, items: Iterable[Any]) -> Iterator[Any]:
+        """Accumulate the wall time spent producing items (including upstream stages)"""
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.timings[stage] += time.perf_counter() - start
+                return
+            self.timings[stage] += time.perf_counter() - start
+            yield item
+
+    def stage_timings(self) -> Dict[str, float]:
+        """Seconds spent in each stage of the last run, excluding upstream stages"""
+        inclusive = self.timings
+        return {
+            'fetch': inclusive['fetch'],
+            'normalize': inclusive['normalize'],
+            'score': inclusive['score'] - inclusive['normalize'],
+            'write': inclusive['write'] - inclusive['score']
+        }
+
+    def run(self, params: Dict[str, Any], live: bool = False) -> bool:
+        """Run pipeline"""
+        self._reset_counters()
+
+        try:
+            start = time.perf_counter()
+            raw = self.fetch_raw(params, live)
+            self.timings['fetch'] = time.perf_counter() - start
+        except Exception as e:
+            print(f"{self.agent_name} Agent failed: {e}")
+            return False
+
+        return self.process(raw, params, reset=False)
+
+    def process(self, raw: Dict[str, Any], params: Dict[str, Any], reset: bool = True) -> bool:
+        """Normalize, score and write already-fetched raw data (the CPU-bound stages)"""
+        if reset:
+            self._reset_counters()
+
+        try:
+            previous = load_previous_havf(self.output_path)
+            normalized = self._timed('normalize', self.normalize_iter(raw))
+            scored = self._timed('score', self.score_iter(normalized, previous))
+
+            # Save (streamed, atomic replace)
+            start = time.perf_counter()
+            self.counters['players'] = write_league_file(
+                self.output_path, self.league, scored, compact=params.get('compact', False))
+            self.timings['write'] = time.perf_counter() - start
+
+            timings = ', '.join(f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in self.stage_timings().items())
+            print(f"{self.agent_name} Agent: Saved {self.counters['players']} players "
+                  f"({self.counters['rescored']} rescored) [{timings}]")
+            return True
+        except Exception as e:
+            print(f"{self.agent_name} Agent failed: {e}")
+            return False
+
+    def _reset_counters(self) -> None:
+        self.timings = {stage: 0.0 for stage in PIPELINE_STAGES}
+        self.counters = {'players': 0, 'rescored': 0}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for Blaze Intelligence upstream APIs
+One bucket per upstream host, usable from threads and asyncio, and
+optionally shared across worker processes through a locked state file
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # File-backed sharing needs POSIX file locks
+
+
+# (requests per second, burst capacity) per upstream host
+HOST_RATE_LIMITS = {
+    'statsapi.mlb.com': (1.0, 5),
+    'baseballsavant.mlb.com': (1.0, 1),
+    'raw.githubusercontent.com': (2.0, 4),
+    'site.api.espn.com': (2.0, 4),
+    'api.collegefootballdata.com': (1.0, 5),
+    'stats.nba.com': (1 / 0.6, 1),  # NBA API is strict
+    'www.thesportsdb.com': (1.0, 2)
+}
+DEFAULT_BURST = 1
+
+# Set to a file path to share buckets between processes
+RATE_LIMIT_STORE_ENV = 'BLAZE_RATE_LIMIT_STORE'
+
+
+def _take(tokens: float, updated_at: float, now: float, rate: float, capacity: float,
+          count: float) -> Tuple[float, float]:
+    """
+    Refill a bucket to now and reserve count tokens.
+    Tokens may go negative: callers queue behind earlier reservations.
+    Returns (remaining tokens, seconds to wait before sending).
+    """
+    tokens = min(capacity, tokens + (now - updated_at) * rate) - count
+    return tokens, max(0.0, -tokens / rate)
+
+
+class FileBucketStore:
+    """Bucket state in a small JSON file guarded by an exclusive flock"""
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("File-backed rate limiting requires fcntl (POSIX)")
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def reserve(self, key: str, rate: float, capacity: float, count: float) -> float:
+        with open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+
+                now = time.time()
+                tokens, updated_at = state.get(key, (capacity, now))
+                tokens, delay = _take(tokens, updated_at, now, rate, capacity, count)
+                state[key] = (tokens, now)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return delay
+
+
+class TokenBucket:
+    """Token bucket with burst capacity; rate <= 0 disables limiting"""
+
+    def __init__(self, rate: float, capacity: float = DEFAULT_BURST,
+                 key: Optional[str] = None, store: Optional[FileBucketStore] = None):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.key = key
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+
+    def reserve(self, count: float = 1) -> float:
+        """Reserve tokens now; returns seconds the caller must wait before sending"""
+        if not self.rate or self.rate <= 0:
+            return 0.0
+        if self.store is not None:
+            return self.store.reserve(self.key, self.rate, self.capacity, count)
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, delay = _take(self._tokens, self._updated_at, now, self.rate, self.capacity, count)
+            self._updated_at = now
+        return delay
+
+    def acquire(self, count: float = 1) -> float:
+        """Block until tokens are available; returns seconds waited"""
+        delay = self.reserve(count)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, count: float = 1) -> float:
+        """Await until tokens are available without blocking the event loop"""
+        delay = self.reserve(count)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """Token buckets keyed by upstream host"""
+
+    def __init__(self, host_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 store: Optional[FileBucketStore] = None):
+        self.host_limits = dict(HOST_RATE_LIMITS if host_limits is None else host_limits)
+        self.store = store
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def bucket(self, host: str, rate: Optional[float] = None, burst: Optional[float] = None) -> TokenBucket:
+        """
+        Bucket for a host. Configured host limits take precedence; rate and
+        burst are the caller's defaults for hosts without one.
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                host_rate, host_burst = self.host_limits.get(host, (rate, burst or DEFAULT_BURST))
+                bucket = TokenBucket(host_rate, host_burst, key=host, store=self.store)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, host: str, rate: Optional[float] = None, burst: Optional[float] = None,
+                count: float = 1) -> float:
+        """Block until a request to host is allowed"""
+        return self.bucket(host, rate, burst).acquire(count)
+
+    async def acquire_async(self, host: str, rate: Optional[float] = None, burst: Optional[float] = None,
+                            count: float = 1) -> float:
+        """Await until a request to host is allowed"""
+        return await self.bucket(host, rate, burst).acquire_async(count)
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    Process-wide limiter shared by all fetchers and agents. When
+    BLAZE_RATE_LIMIT_STORE names a file, buckets are shared with every
+    process pointing at the same file.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            store_path = os.getenv(RATE_LIMIT_STORE_ENV)
+            _shared_limiter = HostRateLimiter(store=FileBucketStore(store_path) if store_path else None)
+        return _shared_limiter
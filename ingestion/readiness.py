@@ -7,15 +7,31 @@ Computes team and player readiness from HAV-F metrics
 import json
 import os
 import sys
+import heapq
 import argparse
+from fractions import Fraction
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional
 from statistics import mean
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ingestion.league_writer import atomic_write
 
-def load_league_data() -> Dict[str, Any]:
+
+LEAGUES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'site', 'src', 'data', 'leagues')
+
+# Per-league team sums and counters from the last run, so a board refresh
+# only recomputes leagues whose files changed
+READINESS_STATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    '02_DATA', 'worker-cache', 'readiness_state.json')
+STATE_VERSION = 3
+
+PLAYER_STATUSES = ("ready", "monitor", "caution", "unknown")
+
+
+def load_league_data(leagues_dir: str = LEAGUES_DIR) -> Dict[str, Any]:
     """Load all league data files"""
-    leagues_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'site', 'src', 'data', 'leagues')
     all_data = {}
     
     for filename in os.listdir(leagues_dir):
@@ -37,7 +53,10 @@ def load_league_data() -> Dict[str, Any]:
 
 
 def compute_team_readiness(players: List[Dict[str, Any]]) -> float:
-    """Compute average team readiness from player HAV-F scores"""
+    """
+    Compute average team readiness from player HAV-F scores (reference for
+    the board's cached sums, which must round exactly the same way)
+    """
     readiness_scores = []
     
     for player in players:
@@ -65,77 +84,236 @@ def categorize_player_status(readiness_score: Optional[float]) -> str:
         return "caution"
 
 
-def generate_readiness_report(all_data: Dict[str, Any], focus_teams: List[str] = None) -> Dict[str, Any]:
-    """Generate comprehensive readiness report"""
-    now_iso = datetime.utcnow().isoformat() + 'Z'
+def build_player_entry(player: Dict[str, Any], team_id: str, league: str) -> Dict[str, Any]:
+    """Readiness board row for one player"""
+    hav_f = player.get('hav_f') or {}
+    readiness_score = hav_f.get('champion_readiness')
     
-    teams_data = []
-    players_data = []
+    return {
+        "player_id": player.get('player_id'),
+        "name": player.get('name'),
+        "team_id": team_id,
+        "league": league,
+        "position": player.get('position'),
+        "champion_readiness": readiness_score,
+        "cognitive_leverage": hav_f.get('cognitive_leverage'),
+        "nil_trust_score": hav_f.get('nil_trust_score'),
+        "status": categorize_player_status(readiness_score),
+        "last_computed": hav_f.get('last_computed_at')
+    }
+
+
+def summarize_league(league_name: str, league_data: Dict[str, Any],
+                     focus_teams: List[str] = None) -> Dict[str, Any]:
+    """
+    One pass over a league's players: per-team readiness sums, counts and
+    status counters, plus board rows for focus-team players grouped by
+    team. Sums are exact ([numerator, denominator]) so averages round like
+    statistics.mean.
+    """
+    focus = set(focus_teams or [])
+    league = league_name.upper()
+    teams = {}
+    sums = {}
+    players = {}
     
-    # Process all leagues
-    for league_name, league_data in all_data.items():
-        league_players = league_data.get('players', [])
+    for player in league_data.get('players', []):
+        team_id = player.get('team_id', 'unknown')
+        team = teams.get(team_id)
+        if team is None:
+            team = teams[team_id] = {
+                "players_count": 0,
+                "readiness_sum": [0, 1],
+                "readiness_count": 0,
+                "status_counts": dict.fromkeys(PLAYER_STATUSES, 0)
+            }
+        
+        readiness_score = (player.get('hav_f') or {}).get('champion_readiness')
+        team["players_count"] += 1
+        if readiness_score is not None:
+            sums[team_id] = sums.get(team_id, 0) + Fraction(readiness_score)
+            team["readiness_count"] += 1
+        team["status_counts"][categorize_player_status(readiness_score)] += 1
+        
+        if team_id in focus:
+            players.setdefault(team_id, []).append(build_player_entry(player, team_id, league))
+    
+    for team_id, total in sums.items():
+        teams[team_id]["readiness_sum"] = [total.numerator, total.denominator]
+    
+    return {"teams": teams, "players": players}
+
+
+def _team_sort_key(team: Dict[str, Any]) -> float:
+    return team['avg_readiness']
+
+
+def _player_sort_key(player: Dict[str, Any]) -> float:
+    # None values last
+    return player['champion_readiness'] or -1
+
+
+def top_k(items: Iterable[Dict[str, Any]], k: Optional[int], key) -> List[Dict[str, Any]]:
+    """The k largest items, descending (heap selection); every item sorted when k is None"""
+    if k is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(k, items, key=key)
+
+
+class ReadinessEngine:
+    """
+    Readiness board kept as per-league summaries. refresh() recomputes only
+    league files whose mtime or size changed since the cached state; the
+    board is then assembled from the stored sums and counters.
+    """
+    
+    def __init__(self, focus_teams: List[str] = None, leagues_dir: str = LEAGUES_DIR,
+                 state_path: Optional[str] = READINESS_STATE_PATH):
+        self.focus_teams = list(focus_teams or [])
+        self.leagues_dir = os.path.abspath(leagues_dir)
+        self.state_path = state_path
+        self.leagues = {}  # league name -> {fingerprint, computed_at, teams, players}
+        self._load_state()
+    
+    def _load_state(self):
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
         
-        # Group players by team
-        teams_in_league = {}
-        for player in league_players:
-            team_id = player.get('team_id', 'unknown')
-            if team_id not in teams_in_league:
-                teams_in_league[team_id] = []
-            teams_in_league[team_id].append(player)
+        # Player rows and counters depend on the focus teams and source directory
+        if (state.get('version') == STATE_VERSION and state.get('focus_teams') == self.focus_teams
+                and state.get('leagues_dir') == self.leagues_dir):
+            self.leagues = state.get('leagues', {})
+    
+    def save(self):
+        """Persist league summaries for the next run"""
+        if not self.state_path:
+            return
+        state = {
+            "version": STATE_VERSION,
+            "leagues_dir": self.leagues_dir,
+            "focus_teams": self.focus_teams,
+            "leagues": self.leagues
+        }
+        with atomic_write(self.state_path) as f:
+            json.dump(state, f)
+    
+    def update_league(self, league_name: str, league_data: Dict[str, Any], fingerprint: List[int] = None):
+        """Replace one league's summary"""
+        self.leagues[league_name] = {
+            "fingerprint": fingerprint,
+            "computed_at": datetime.utcnow().isoformat() + 'Z',
+            **summarize_league(league_name, league_data, self.focus_teams)
+        }
+    
+    def refresh(self) -> List[str]:
+        """Recompute changed, new and removed league files; returns their names"""
+        changed = []
+        present = set()
         
-        # Process each team
-        for team_id, team_players in teams_in_league.items():
-            team_readiness = compute_team_readiness(team_players)
+        for filename in sorted(os.listdir(self.leagues_dir)):
+            if not filename.endswith('.json'):
+                continue
             
-            team_entry = {
-                "team_id": team_id,
-                "league": league_name.upper(),
-                "players_count": len(team_players),
-                "avg_readiness": team_readiness,
-                "last_updated": now_iso
-            }
-            teams_data.append(team_entry)
+            league_name = filename.replace('.json', '')
+            filepath = os.path.join(self.leagues_dir, filename)
+            stat = os.stat(filepath)
+            fingerprint = [stat.st_mtime_ns, stat.st_size]
             
-            # Process individual players for focused teams
-            if focus_teams and team_id in focus_teams:
-                for player in team_players:
-                    hav_f = player.get('hav_f', {})
-                    readiness_score = hav_f.get('champion_readiness')
-                    
-                    player_entry = {
-                        "player_id": player.get('player_id'),
-                        "name": player.get('name'),
-                        "team_id": team_id,
-                        "league": league_name.upper(),
-                        "position": player.get('position'),
-                        "champion_readiness": readiness_score,
-                        "cognitive_leverage": hav_f.get('cognitive_leverage'),
-                        "nil_trust_score": hav_f.get('nil_trust_score'),
-                        "status": categorize_player_status(readiness_score),
-                        "last_computed": hav_f.get('last_computed_at')
-                    }
-                    players_data.append(player_entry)
-    
-    # Sort teams by readiness (descending)
-    teams_data.sort(key=lambda x: x['avg_readiness'], reverse=True)
-    
-    # Sort players by readiness (descending, with None values last)
-    players_data.sort(key=lambda x: x['champion_readiness'] or -1, reverse=True)
+            cached = self.leagues.get(league_name)
+            if cached and cached.get('fingerprint') == fingerprint:
+                present.add(league_name)
+                continue
+            
+            try:
+                with open(filepath, 'r') as f:
+                    league_data = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                print(f"Warning: Could not load {filename}: {e}")
+                continue
+            
+            self.update_league(league_name, league_data, fingerprint)
+            present.add(league_name)
+            changed.append(league_name)
+        
+        for league_name in set(self.leagues) - present:
+            del self.leagues[league_name]
+            changed.append(league_name)
+        
+        return changed
     
-    return {
-        "generated_at": now_iso,
-        "teams": teams_data,
-        "players": players_data,
-        "summary": {
-            "total_teams": len(teams_data),
-            "total_players": sum(t['players_count'] for t in teams_data),
-            "ready_players": len([p for p in players_data if p['status'] == 'ready']),
-            "monitor_players": len([p for p in players_data if p['status'] == 'monitor']),
-            "caution_players": len([p for p in players_data if p['status'] == 'caution']),
-            "focus_teams": focus_teams or []
+    def _team_entries(self) -> Iterator[Dict[str, Any]]:
+        for league_name, summary in self.leagues.items():
+            for team_id, team in summary['teams'].items():
+                count = team['readiness_count']
+                yield {
+                    "team_id": team_id,
+                    "league": league_name.upper(),
+                    "players_count": team['players_count'],
+                    "avg_readiness": round(float(Fraction(*team['readiness_sum']) / count), 1) if count else 0.0,
+                    "last_updated": summary['computed_at']
+                }
+    
+    def report(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Assemble the readiness board from the league summaries. With top,
+        only the top teams overall, top players per focus team and top
+        players overall are selected, without sorting every team.
+        """
+        total_teams = total_players = 0
+        status_counts = dict.fromkeys(PLAYER_STATUSES, 0)
+        focus = set(self.focus_teams)
+        players_by_team = {}
+        
+        for summary in self.leagues.values():
+            total_teams += len(summary['teams'])
+            for team_id, team in summary['teams'].items():
+                total_players += team['players_count']
+                if team_id in focus:
+                    for status, n in team['status_counts'].items():
+                        status_counts[status] += n
+            
+            # A focus team can appear in several league files (e.g. NCAA teams in nil)
+            for team_id, team_players in summary['players'].items():
+                players_by_team.setdefault(team_id, []).extend(team_players)
+        
+        players_by_team = {team_id: top_k(team_players, top, _player_sort_key)
+                           for team_id, team_players in players_by_team.items()}
+        
+        # Teams and players by readiness (descending)
+        teams_data = top_k(self._team_entries(), top, _team_sort_key)
+        players_data = top_k(
+            (player for team_players in players_by_team.values() for player in team_players),
+            top, _player_sort_key)
+        
+        return {
+            "generated_at": datetime.utcnow().isoformat() + 'Z',
+            "teams": teams_data,
+            "players": players_data,
+            "players_by_team": players_by_team,
+            "summary": {
+                "total_teams": total_teams,
+                "total_players": total_players,
+                "ready_players": status_counts['ready'],
+                "monitor_players": status_counts['monitor'],
+                "caution_players": status_counts['caution'],
+                "focus_teams": self.focus_teams
+            }
         }
-    }
+
+
+def generate_readiness_report(all_data: Dict[str, Any], focus_teams: List[str] = None,
+                              top: Optional[int] = None) -> Dict[str, Any]:
+    """Generate comprehensive readiness report"""
+    engine = ReadinessEngine(focus_teams, state_path=None)
+    for league_name, league_data in all_data.items():
+        engine.update_league(league_name, league_data)
+    
+    return engine.report(top)
 
 
 def save_readiness_report(report: Dict[str, Any], output_path: str) -> None:
@@ -176,10 +354,15 @@ def print_readiness_summary(report: Dict[str, Any]) -> None:
     # Focus team details
     if summary['focus_teams']:
         print(f"\nFOCUS TEAMS ({', '.join(summary['focus_teams'])}):")
-        players = report['players']
+        players_by_team = report.get('players_by_team')
+        if players_by_team is None:
+            # Reports written before players were grouped by team
+            players_by_team = {}
+            for player in report['players']:
+                players_by_team.setdefault(player['team_id'], []).append(player)
         
         for team_id in summary['focus_teams']:
-            team_players = [p for p in players if p['team_id'] == team_id]
+            team_players = players_by_team.get(team_id)
             if team_players:
                 print(f"\n  {team_id}:")
                 for player in team_players[:5]:  # Top 5 per team
@@ -201,33 +384,45 @@ def main():
     parser.add_argument('--quiet', '-q',
                        action='store_true',
                        help='Suppress console output')
+    parser.add_argument('--top',
+                       type=int,
+                       help='Keep only the top N teams, players per focus team and players overall')
+    parser.add_argument('--full',
+                       action='store_true',
+                       help='Recompute every league instead of only changed files')
     
     args = parser.parse_args()
     
     # Parse focus teams
     focus_teams = [team.strip() for team in args.focus.split(',') if team.strip()] if args.focus else None
     
-    # Load all league data
+    # Load changed league data
     if not args.quiet:
         print("Loading league data...")
     
-    all_data = load_league_data()
+    engine = ReadinessEngine(focus_teams)
+    if args.full:
+        engine.leagues = {}
+    changed = engine.refresh()
     
-    if not all_data:
+    if not engine.leagues:
         print("No league data found. Run ingestion agents first.")
         sys.exit(1)
     
     if not args.quiet:
-        print(f"Loaded {len(all_data)} leagues")
+        print(f"Loaded {len(engine.leagues)} leagues ({len(changed)} recomputed)")
     
     # Generate report
     if not args.quiet:
         print("Computing readiness metrics...")
     
-    report = generate_readiness_report(all_data, focus_teams)
+    report = engine.report(args.top)
     
-    # Save report
+    # Save report, plus the memory-mappable snapshot of the full board next to it
     save_readiness_report(report, args.output)
+    from ingestion.readiness_snapshot import write_snapshot
+    write_snapshot(os.path.splitext(args.output)[0] + '.snapshot', engine.report() if args.top else report)
+    engine.save()
     
     # Print summary
     if not args.quiet:
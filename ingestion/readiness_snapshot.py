@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Binary readiness snapshot for Blaze Intelligence
+One file written next to readiness.json that consumers memory-map instead
+of parsing the full board:
+- a fixed header with section offsets
+- fixed-width team records (sorted by readiness) and a team_id index
+- fixed-width focus player records (sorted by readiness)
+- a string table (UTF-8 blob plus int64 offsets); text fields are int32
+  codes into it, -1 when missing, and missing numbers are NaN
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from ingestion.league_writer import atomic_write
+from ingestion.readiness import PLAYER_STATUSES
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'site', 'src', 'data')
+SNAPSHOT_PATH = os.path.join(DATA_DIR, 'readiness.snapshot')
+READINESS_JSON_PATH = os.path.join(DATA_DIR, 'readiness.json')
+
+MAGIC = b'BLZRDY\x00\x01'
+FORMAT_VERSION = 1
+MISSING_CODE = -1
+NOT_FOUND = -2  # Lookup code for values absent from the snapshot; matches no record
+
+# magic, version, meta string code, then counts and byte offsets of each section
+HEADER = struct.Struct('<8sIiQQQQQQQQ')
+
+PLAYER_METRICS = ("champion_readiness", "cognitive_leverage", "nil_trust_score")
+
+TEAM_DTYPE = np.dtype([
+    ('team_id', '<i4'), ('league', '<i4'), ('players_count', '<i4'), ('last_updated', '<i4'),
+    ('avg_readiness', '<f8')
+], align=True)
+
+PLAYER_DTYPE = np.dtype([
+    ('player_id', '<i4'), ('name', '<i4'), ('team_id', '<i4'), ('league', '<i4'),
+    ('position', '<i4'), ('status', '<i4'), ('last_computed', '<i4'),
+    ('champion_readiness', '<f8'), ('cognitive_leverage', '<f8'), ('nil_trust_score', '<f8')
+], align=True)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def encode_snapshot(report: Dict[str, Any]) -> bytes:
+    """Snapshot bytes for a readiness report (see ingestion.readiness)"""
+    strings = {}
+
+    def code(value: Optional[str]) -> int:
+        return MISSING_CODE if value is None else strings.setdefault(str(value), len(strings))
+
+    def number(value: Optional[float]) -> float:
+        return np.nan if value is None else value
+
+    meta_code = code(json.dumps({'generated_at': report.get('generated_at'), 'summary': report.get('summary', {})}))
+
+    teams = sorted(report.get('teams', []), key=lambda x: x['avg_readiness'], reverse=True)
+    team_records = np.array([
+        (code(team['team_id']), code(team['league']), team['players_count'],
+         code(team.get('last_updated')), team['avg_readiness'])
+        for team in teams
+    ], dtype=TEAM_DTYPE)
+    by_id = np.array(sorted(range(len(teams)), key=lambda row: teams[row]['team_id']), dtype=np.int32)
+
+    players = sorted(report.get('players', []), key=lambda x: x['champion_readiness'] or -1, reverse=True)
+    player_records = np.array([
+        (code(player.get('player_id')), code(player.get('name')), code(player.get('team_id')),
+         code(player.get('league')), code(player.get('position')),
+         PLAYER_STATUSES.index(player.get('status', 'unknown')), code(player.get('last_computed')),
+         *(number(player.get(metric)) for metric in PLAYER_METRICS))
+        for player in players
+    ], dtype=PLAYER_DTYPE)
+
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+
+    sections = [team_records.tobytes(), player_records.tobytes(), by_id.tobytes(), offsets.tobytes(), b''.join(encoded)]
+    positions = []
+    position = HEADER.size
+    for data in sections:
+        position = _align(position)
+        positions.append(position)
+        position += len(data)
+
+    buffer = bytearray(position)
+    HEADER.pack_into(buffer, 0, MAGIC, FORMAT_VERSION, meta_code, len(teams), len(players), len(encoded), *positions)
+    for at, data in zip(positions, sections):
+        buffer[at:at + len(data)] = data
+    return bytes(buffer)
+
+
+def write_snapshot(path: str, report: Dict[str, Any]) -> int:
+    """Write a readiness report as a snapshot file; returns its size in bytes"""
+    data = encode_snapshot(report)
+    with atomic_write(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+class ReadinessSnapshot:
+    """Read-only view of a readiness snapshot (memory-mapped from path, or over buffer) with queries"""
+
+    def __init__(self, path: str = SNAPSHOT_PATH, buffer: Optional[bytes] = None):
+        self.path = path
+        if buffer is None:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = buffer
+
+        (magic, version, meta_code, n_teams, n_players, n_strings,
+         teams_at, players_at, by_id_at, offsets_at, strings_at) = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a readiness snapshot (format {FORMAT_VERSION}): {path}")
+
+        self.teams = np.frombuffer(self._buffer, TEAM_DTYPE, n_teams, teams_at)
+        self.players = np.frombuffer(self._buffer, PLAYER_DTYPE, n_players, players_at)
+        self._by_id = np.frombuffer(self._buffer, np.int32, n_teams, by_id_at)
+        self._offsets = np.frombuffer(self._buffer, np.int64, n_strings + 1, offsets_at)
+        self._strings_at = strings_at
+        self._leagues = None
+
+        meta = json.loads(self.string(meta_code))
+        self.generated_at = meta['generated_at']
+        self.summary = meta['summary']
+
+    def string(self, code: int) -> Optional[str]:
+        """String table entry for a code (None when missing)"""
+        if code == MISSING_CODE:
+            return None
+        start, end = self._offsets[code], self._offsets[code + 1]
+        return self._buffer[self._strings_at + start:self._strings_at + end].decode('utf-8')
+
+    def _team_code(self, team_id: str) -> int:
+        row = self._team_row(team_id)
+        return NOT_FOUND if row is None else int(self.teams['team_id'][row])
+
+    def _league_code(self, league: str) -> int:
+        if self._leagues is None:
+            codes = np.unique(np.concatenate([self.teams['league'], self.players['league']]))
+            self._leagues = {self.string(code): code for code in codes.tolist()}
+        return self._leagues.get(league.upper(), NOT_FOUND)
+
+    def _team_row(self, team_id: str) -> Optional[int]:
+        # Binary search over team rows ordered by team_id
+        low, high = 0, len(self._by_id)
+        while low < high:
+            mid = (low + high) // 2
+            if self.string(int(self.teams['team_id'][self._by_id[mid]])) < team_id:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self._by_id):
+            row = int(self._by_id[low])
+            if self.string(int(self.teams['team_id'][row])) == team_id:
+                return row
+        return None
+
+    def _team_dict(self, record) -> Dict[str, Any]:
+        return {
+            "team_id": self.string(int(record['team_id'])),
+            "league": self.string(int(record['league'])),
+            "players_count": int(record['players_count']),
+            "avg_readiness": float(record['avg_readiness']),
+            "last_updated": self.string(int(record['last_updated']))
+        }
+
+    def _player_dict(self, record) -> Dict[str, Any]:
+        player = {
+            "player_id": self.string(int(record['player_id'])),
+            "name": self.string(int(record['name'])),
+            "team_id": self.string(int(record['team_id'])),
+            "league": self.string(int(record['league'])),
+            "position": self.string(int(record['position']))
+        }
+        for metric in PLAYER_METRICS:
+            value = float(record[metric])
+            player[metric] = None if np.isnan(value) else value
+        player["status"] = PLAYER_STATUSES[int(record['status'])]
+        player["last_computed"] = self.string(int(record['last_computed']))
+        return player
+
+    def team(self, team_id: str) -> Optional[Dict[str, Any]]:
+        row = self._team_row(team_id)
+        return None if row is None else self._team_dict(self.teams[row])
+
+    def top_teams(self, n: Optional[int] = None, league: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Teams by readiness (descending), optionally one league"""
+        records = self.teams
+        if league:
+            records = records[records['league'] == self._league_code(league)]
+        return [self._team_dict(record) for record in records[:n]]
+
+    def top_players(self, n: Optional[int] = None, team_id: Optional[str] = None,
+                    league: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Focus players by readiness (descending), filtered by team, league and status"""
+        return [self._player_dict(record) for record in self.player_records(team_id, league, status)[:n]]
+
+    def player_records(self, team_id: Optional[str] = None, league: Optional[str] = None,
+                       status: Optional[str] = None) -> np.ndarray:
+        """Raw player records matching the filters (for vectorized checks)"""
+        mask = np.ones(len(self.players), dtype=bool)
+        if team_id:
+            mask &= self.players['team_id'] == self._team_code(team_id)
+        if league:
+            mask &= self.players['league'] == self._league_code(league)
+        if status:
+            mask &= self.players['status'] == PLAYER_STATUSES.index(status)
+        return self.players[mask]
+
+    def status_counts(self, team_id: Optional[str] = None) -> Dict[str, int]:
+        """Player counts per status"""
+        counts = np.bincount(self.player_records(team_id)['status'], minlength=len(PLAYER_STATUSES))
+        return dict(zip(PLAYER_STATUSES, counts.tolist()))
+
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+
+def _cached(path: str, build) -> ReadinessSnapshot:
+    # One shared snapshot per file, rebuilt when the file is replaced
+    stat = os.stat(path)
+    key = (stat.st_ino, stat.st_mtime_ns)
+    with _snapshots_lock:
+        cached = _snapshots.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            _snapshots[path] = cached
+        return cached[1]
+
+
+def _build_from_json(json_path: str) -> ReadinessSnapshot:
+    with open(json_path, 'r') as f:
+        return ReadinessSnapshot(path=None, buffer=encode_snapshot(json.load(f)))
+
+
+def get_readiness_snapshot(path: str = SNAPSHOT_PATH) -> ReadinessSnapshot:
+    """Shared snapshot for path, reopened when the file is replaced"""
+    path = os.path.abspath(path)
+    return _cached(path, lambda: ReadinessSnapshot(path))
+
+
+def load_readiness(snapshot_path: str = SNAPSHOT_PATH, json_path: str = READINESS_JSON_PATH) -> ReadinessSnapshot:
+    """
+    The readiness snapshot, or one built in memory from readiness.json when
+    there is no snapshot yet or the JSON was rewritten after it (other board
+    writers only update readiness.json)
+    """
+    json_path = os.path.abspath(json_path)
+    try:
+        snapshot_mtime = os.stat(snapshot_path).st_mtime_ns
+    except FileNotFoundError:
+        return _cached(json_path, lambda: _build_from_json(json_path))
+    try:
+        if os.stat(json_path).st_mtime_ns > snapshot_mtime:
+            return _cached(json_path, lambda: _build_from_json(json_path))
+    except FileNotFoundError:
+        pass
+    return get_readiness_snapshot(snapshot_path)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Precompiled player schema validation for Blaze Intelligence
+Validators are built once per schema file (and rebuilt only when it
+changes), check players one at a time so they can sit in a streaming
+pipeline, and report every error with the player's ID.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+try:
+    import jsonschema
+    from jsonschema.validators import validator_for
+except ImportError:
+    jsonschema = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # Optional fast path for valid players
+
+
+PLAYER_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'schemas', 'player.schema.json')
+
+
+class PlayerValidator:
+    """Compiled validator for one schema (or one of its definitions)"""
+
+    def __init__(self, schema: Dict[str, Any], definition: Optional[str] = None):
+        self.required = schema.get('required', [])
+        if definition:
+            # Validate against a definition while keeping its $refs resolvable
+            definitions_key = 'definitions' if 'definitions' in schema else '$defs'
+            schema = {
+                '$schema': schema.get('$schema'),
+                definitions_key: schema[definitions_key],
+                '$ref': f"#/{definitions_key}/{definition}"
+            }
+            if schema['$schema'] is None:
+                del schema['$schema']
+            self.required = schema[definitions_key][definition].get('required', [])
+        self.schema = schema
+
+        self._validator = None
+        if jsonschema is not None:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            self._validator = cls(schema)
+
+        self._fast = None
+        if fastjsonschema is not None:
+            try:
+                self._fast = fastjsonschema.compile(schema)
+            except Exception:
+                self._fast = None  # Drafts or keywords it cannot compile
+
+    def errors(self, player: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """All schema errors for one player ([] when valid)"""
+        if self._fast is not None:
+            try:
+                self._fast(player)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass  # Collect every error below
+
+        player_id = player.get('player_id') if isinstance(player, dict) else None
+        if self._validator is None:
+            # Basic validation without jsonschema
+            return [
+                {'player_id': player_id, 'path': '', 'message': f"'{field}' is a required property"}
+                for field in self.required if field not in player
+            ]
+
+        return [
+            {
+                'player_id': player_id,
+                'path': '.'.join(str(part) for part in error.absolute_path),
+                'message': error.message
+            }
+            for error in sorted(self._validator.iter_errors(player), key=lambda e: list(map(str, e.absolute_path)))
+        ]
+
+    def is_valid(self, player: Dict[str, Any]) -> bool:
+        return not self.errors(player)
+
+    def validate_iter(self, players: Iterable[Dict[str, Any]],
+                      errors: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass players through unchanged, appending any errors to errors"""
+        for player in players:
+            errors.extend(self.errors(player))
+            yield player
+
+    def validate_all(self, players: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Every error across players"""
+        errors = []
+        for _ in self.validate_iter(players, errors):
+            pass
+        return errors
+
+
+_validators = {}
+_validators_lock = threading.Lock()
+
+
+def get_player_validator(schema_path: str = PLAYER_SCHEMA_PATH,
+                         definition: Optional[str] = None) -> PlayerValidator:
+    """Cached validator for a schema file, rebuilt when the file changes"""
+    schema_path = os.path.abspath(schema_path)
+    mtime = os.stat(schema_path).st_mtime_ns
+    with _validators_lock:
+        cached = _validators.get((schema_path, definition))
+        if cached is None or cached[0] != mtime:
+            with open(schema_path, 'r') as f:
+                cached = (mtime, PlayerValidator(json.load(f), definition))
+            _validators[(schema_path, definition)] = cached
+        return cached[1]
+
+
+def format_error(error: Dict[str, Any]) -> str:
+    """One-line error description"""
+    location = f" at {error['path']}" if error['path'] else ''
+    return f"{error['player_id'] or '<no player_id>'}{location}: {error['message']}"
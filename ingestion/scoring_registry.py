@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Scoring Registry for Blaze Intelligence
+Per-sport HAV-F scoring formulas declared as weights and clamps
+
+Each sport declares:
+- performance: the sport-specific component of HAV-F champion readiness
+  (used by ingestion.havf and the batch engine)
+- metrics: champion readiness / cognitive leverage / NIL trust computed
+  directly from source stats (NBA Stats API, multi-league roster ingestion)
+- composite: optional weights blending the metrics into composite_score
+
+Formulas are compiled once into closures (and NumPy array kernels where
+possible), so scoring code never branches on sport in its hot loop.
+
+Formula spec (a number is a constant formula):
+    terms:         ordered parts summed left to right; each part is a
+                   constant, a (field, weight[, offset[, divisor]]) term
+                   evaluated as ((value - offset) / divisor) * weight,
+                   or a nested formula
+    lookup/table:  categorical value table.get(inputs[lookup], default)
+    scale:         formula multiplied into the sum
+    clamp:         (min, max) bounds, either may be None
+    round:         decimal places
+    when_present:  field that must be non-None, else `otherwise`
+    when_positive: field that must be > 0, else `otherwise`
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+Formula = Any
+Scorer = Callable[[Dict[str, Any]], Any]
+
+
+# HAV-F performance: 0-100 like every normalize_value score
+_FOOTBALL_PERFORMANCE = {
+    "terms": [("total_yards", 1, 0, 100), ("total_tds", 5)],
+    "clamp": (0, 100), "round": 1
+}
+
+# Composite weights shared by the roster ingestion scorers
+_ROSTER_COMPOSITE = {"champion_readiness": 0.4, "cognitive_leverage": 0.35, "nil_trust_score": 0.25}
+
+# NFL roster baselines by position
+_NFL_POSITION_BASELINES = {
+    'QB': {'cr': 70, 'cl': 85, 'nil': 80},
+    'RB': {'cr': 65, 'cl': 50, 'nil': 60},
+    'WR': {'cr': 60, 'cl': 55, 'nil': 70},
+    'TE': {'cr': 55, 'cl': 60, 'nil': 50},
+    'OL': {'cr': 60, 'cl': 70, 'nil': 30},
+    'DL': {'cr': 65, 'cl': 60, 'nil': 40},
+    'LB': {'cr': 65, 'cl': 70, 'nil': 50},
+    'DB': {'cr': 60, 'cl': 65, 'nil': 55}
+}
+
+
+def _nfl_baseline(key: str, default: int) -> Dict[str, Any]:
+    return {
+        "lookup": "position",
+        "table": {position: baseline[key] for position, baseline in _NFL_POSITION_BASELINES.items()},
+        "default": default
+    }
+
+
+SPORT_SCORERS = {
+    "MLB": {
+        # WAR + WPA
+        "performance": {"terms": [("war", 30), ("wpa", 200), 30], "clamp": (0, 100), "round": 1},
+        "metrics": {
+            "champion_readiness": {"terms": [
+                50.0,
+                {"terms": [("ops", 100, 0.700)], "clamp": (None, 20), "when_present": "ops"},
+                {"terms": [("era", -10, 4.0)], "clamp": (None, 20), "when_present": "era"}
+            ]},
+            "cognitive_leverage": {
+                "lookup": "position",
+                "table": {'C': 70, 'SS': 65, '2B': 60, 'CF': 55, 'P': 60, '3B': 50, '1B': 45, 'LF': 40, 'RF': 40},
+                "default": 50
+            },
+            "nil_trust_score": 30.0
+        },
+        "composite": _ROSTER_COMPOSITE
+    },
+    "NFL": {
+        # EPA-based
+        "performance": {"terms": [50, ("epa", 2)], "clamp": (0, 100), "round": 1},
+        "metrics": {
+            "champion_readiness": _nfl_baseline('cr', 50),
+            "cognitive_leverage": _nfl_baseline('cl', 50),
+            "nil_trust_score": _nfl_baseline('nil', 40)
+        },
+        "composite": _ROSTER_COMPOSITE
+    },
+    "NCAA-FB": {
+        "performance": _FOOTBALL_PERFORMANCE,
+        "metrics": {
+            # Recruiting stars, scaled by class year
+            "champion_readiness": {
+                "terms": [40.0, {"terms": [("stars", 8)], "when_present": "stars"}],
+                "scale": {
+                    "lookup": "year",
+                    "table": {'Senior': 1.2, 'Junior': 1.0, 'Sophomore': 0.8, 'Freshman': 0.6},
+                    "default": 1.0
+                }
+            },
+            "cognitive_leverage": {"terms": [45.0, {"lookup": "position", "table": {'QB': 15}, "default": 0}]},
+            "nil_trust_score": {"terms": [
+                20.0,
+                {"terms": [("stars", 10)], "when_present": "stars"},
+                {"lookup": "position", "table": {'QB': 20}, "default": 0}
+            ]}
+        },
+        "composite": _ROSTER_COMPOSITE
+    },
+    "HS-FB": {
+        "performance": _FOOTBALL_PERFORMANCE
+    },
+    "NBA": {
+        "metrics": {
+            # Performance (0-40) + availability (0-40) + experience/clutch (0-20)
+            "champion_readiness": {"terms": [
+                {"terms": [("points_per_game", 1.5), ("rebounds_per_game", 1.0),
+                           ("assists_per_game", 1.2), ("field_goal_pct", 20)], "clamp": (None, 40)},
+                {"terms": [("games_played", 40, 0, 82)], "clamp": (None, 40),
+                 "when_positive": "games_played", "otherwise": 20},
+                15
+            ], "clamp": (None, 100)},
+            # Court vision + decision making
+            "cognitive_leverage": {"terms": [
+                {"terms": [("assists_per_game", 8), ("field_goal_pct", 25)], "clamp": (None, 50)},
+                {"terms": [30, ("three_point_pct", 20)], "clamp": (None, 50)}
+            ], "clamp": (None, 100)},
+            # Performance + base NBA popularity + consistency
+            "nil_trust_score": {"terms": [
+                {"terms": [("points_per_game", 2)], "clamp": (None, 40)},
+                35,
+                {"terms": [("field_goal_pct", 25)], "clamp": (None, 25)}
+            ], "clamp": (None, 100)}
+        }
+    }
+}
+
+# Sport aliases used by agents and feeds
+SPORT_ALIASES = {
+    "basketball": "NBA",
+    "NCAA": "NCAA-FB"
+}
+
+
+def _as_formula(spec: Formula) -> Dict[str, Any]:
+    if isinstance(spec, (int, float)):
+        return {"terms": [spec]}
+    return spec
+
+
+def formula_fields(spec: Formula) -> List[str]:
+    """Input fields read by a formula, in first-use order"""
+    fields = []
+
+    def visit(node):
+        node = _as_formula(node)
+        for part in node.get("terms", []):
+            if isinstance(part, tuple):
+                fields.append(part[0])
+            elif isinstance(part, dict):
+                visit(part)
+        for key in ("lookup", "when_present", "when_positive"):
+            if key in node:
+                fields.append(node[key])
+        if "scale" in node:
+            visit(node["scale"])
+
+    visit(spec)
+    return list(dict.fromkeys(fields))
+
+
+def _compile_term(field: str, weight: float = 1, offset: float = 0, divisor: float = 1) -> Scorer:
+    """Compile one (field, weight, offset, divisor) term, skipping identity operations"""
+    if offset == 0 and divisor == 1:
+        return lambda inputs: inputs.get(field, 0) * weight
+    if divisor == 1:
+        return lambda inputs: (inputs.get(field, 0) - offset) * weight
+    if offset == 0:
+        return lambda inputs: inputs.get(field, 0) / divisor * weight
+    return lambda inputs: (inputs.get(field, 0) - offset) / divisor * weight
+
+
+def compile_formula(spec: Formula) -> Scorer:
+    """Compile a formula spec into a closure over an inputs mapping"""
+    spec = _as_formula(spec)
+
+    if "lookup" in spec:
+        field, table, default = spec["lookup"], spec["table"], spec.get("default", 0)
+        body = lambda inputs: table.get(inputs.get(field), default)
+    else:
+        parts = []
+        for part in spec.get("terms", []):
+            if isinstance(part, tuple):
+                parts.append(_compile_term(*part))
+            elif isinstance(part, dict):
+                parts.append(compile_formula(part))
+            else:
+                parts.append(lambda inputs, value=part: value)
+
+        first, rest = parts[0], tuple(parts[1:])
+
+        def body(inputs):
+            total = first(inputs)
+            for part in rest:
+                total = total + part(inputs)
+            return total
+
+    if "scale" in spec:
+        scale, unscaled = compile_formula(spec["scale"]), body
+        body = lambda inputs: unscaled(inputs) * scale(inputs)
+
+    if "clamp" in spec:
+        low, high = spec["clamp"]
+        unclamped = body
+        if low is None:
+            body = lambda inputs: min(high, unclamped(inputs))
+        elif high is None:
+            body = lambda inputs: max(low, unclamped(inputs))
+        else:
+            body = lambda inputs: max(low, min(high, unclamped(inputs)))
+
+    if "round" in spec:
+        digits, unrounded = spec["round"], body
+        body = lambda inputs: round(unrounded(inputs), digits)
+
+    if "when_present" in spec or "when_positive" in spec:
+        guarded, otherwise = body, spec.get("otherwise", 0)
+        if "when_present" in spec:
+            guard_field = spec["when_present"]
+            body = lambda inputs: guarded(inputs) if inputs.get(guard_field) is not None else otherwise
+        else:
+            guard_field = spec["when_positive"]
+            body = lambda inputs: guarded(inputs) if inputs.get(guard_field, 0) > 0 else otherwise
+
+    return body
+
+
+def round_array(values: "np.ndarray", digits: int) -> "np.ndarray":
+    """
+    Vectorized round(x, digits) matching Python's correctly-rounded builtin.
+    np.rint operates on the scaled binary value, which can disagree with
+    round() at ties, so those few entries are deferred to the builtin.
+    """
+    factor = 10 ** digits
+    scaled = values * factor
+    out = np.rint(scaled) / factor
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for i in ties:
+        out[i] = round(float(values[i]), digits)
+    return out
+
+
+def compile_kernel(spec: Formula) -> Callable[[Dict[str, "np.ndarray"]], "np.ndarray"]:
+    """
+    Compile a numeric formula spec into a NumPy kernel over float64 columns.
+    Missing fields read as 0 and guard fields use NaN for missing values.
+    Lookup formulas are categorical and have no array kernel.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for array kernels")
+
+    spec = _as_formula(spec)
+    if "lookup" in spec:
+        raise ValueError(f"Lookup on '{spec['lookup']}' cannot be compiled to an array kernel")
+
+    parts = []
+    for part in spec.get("terms", []):
+        if isinstance(part, tuple):
+            field, weight, offset, divisor = (tuple(part) + (1, 0, 1)[len(part) - 1:])[:4]
+            parts.append(lambda columns, f=field, w=weight, o=offset, d=divisor:
+                         _kernel_term(columns, f, w, o, d))
+        elif isinstance(part, dict):
+            parts.append(compile_kernel(part))
+        else:
+            parts.append(lambda columns, value=part: value)
+
+    first, rest = parts[0], tuple(parts[1:])
+
+    def body(columns):
+        total = first(columns)
+        for part in rest:
+            total = total + part(columns)
+        return total
+
+    if "scale" in spec:
+        scale, unscaled = compile_kernel(spec["scale"]), body
+        body = lambda columns: unscaled(columns) * scale(columns)
+
+    if "clamp" in spec:
+        low, high = spec["clamp"]
+        unclamped = body
+        body = lambda columns: np.clip(unclamped(columns), low, high)
+
+    if "round" in spec:
+        digits, unrounded = spec["round"], body
+        body = lambda columns: round_array(np.asarray(unrounded(columns), dtype=np.float64), digits)
+
+    if "when_present" in spec or "when_positive" in spec:
+        guarded, otherwise = body, spec.get("otherwise", 0)
+        if "when_present" in spec:
+            guard_field = spec["when_present"]
+            body = lambda columns: np.where(~np.isnan(columns[guard_field]), guarded(columns), otherwise)
+        else:
+            guard_field = spec["when_positive"]
+            body = lambda columns: np.where(columns[guard_field] > 0, guarded(columns), otherwise)
+
+    return body
+
+
+def _kernel_term(columns: Dict[str, "np.ndarray"], field: str, weight: float,
+                 offset: float, divisor: float) -> "np.ndarray":
+    values = columns[field]
+    if offset != 0:
+        values = values - offset
+    if divisor != 1:
+        values = values / divisor
+    return values * weight
+
+
+class SportScorer:
+    """Compiled scoring formulas for one sport"""
+
+    def __init__(self, sport: str, spec: Dict[str, Any]):
+        self.sport = sport
+        self.spec = spec
+
+        performance = spec.get("performance")
+        self.performance = compile_formula(performance) if performance is not None else None
+        self.performance_fields = tuple(formula_fields(performance)) if performance is not None else ()
+        self._performance_kernel = None
+
+        self.metrics = {name: compile_formula(formula) for name, formula in spec.get("metrics", {}).items()}
+        self.composite = spec.get("composite")
+        self.round_digits = spec.get("round", 1)
+
+    @property
+    def performance_kernel(self) -> Optional[Callable[[Dict[str, "np.ndarray"]], "np.ndarray"]]:
+        """Array kernel for the performance formula, compiled on first use"""
+        if self._performance_kernel is None and self.spec.get("performance") is not None:
+            self._performance_kernel = compile_kernel(self.spec["performance"])
+        return self._performance_kernel
+
+    def score(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute this sport's metrics from source inputs.
+        Metrics are rounded for output; composite_score blends the unrounded values.
+        """
+        raw = {name: metric(inputs) for name, metric in self.metrics.items()}
+        scores = {name: round(value, self.round_digits) for name, value in raw.items()}
+
+        if self.composite:
+            composite = None
+            for name, weight in self.composite.items():
+                part = raw[name] * weight
+                composite = part if composite is None else composite + part
+            scores["composite_score"] = round(composite, self.round_digits)
+
+        return scores
+
+
+class ScoringRegistry:
+    """Central registry of compiled per-sport scorers"""
+
+    def __init__(self, specs: Dict[str, Dict[str, Any]] = None, aliases: Dict[str, str] = None):
+        self.scorers = {sport: SportScorer(sport, spec) for sport, spec in (specs or SPORT_SCORERS).items()}
+        self.aliases = dict(SPORT_ALIASES if aliases is None else aliases)
+
+        # Performance formulas indexed once for the HAV-F hot loop
+        self.performance_scorers = {
+            sport: scorer.performance for sport, scorer in self.scorers.items() if scorer.performance
+        }
+        self._performance_fields = None
+
+    def get(self, sport: str) -> Optional[SportScorer]:
+        """Get the scorer for a sport or alias"""
+        return self.scorers.get(sport) or self.scorers.get(self.aliases.get(sport, ""))
+
+    def register(self, sport: str, spec: Dict[str, Any]) -> SportScorer:
+        """Compile and register a scorer for a new league"""
+        scorer = SportScorer(sport, spec)
+        self.scorers[sport] = scorer
+        if scorer.performance:
+            self.performance_scorers[sport] = scorer.performance
+        else:
+            self.performance_scorers.pop(sport, None)
+        self._performance_fields = None
+        return scorer
+
+    def performance_sports(self) -> Tuple[str, ...]:
+        """Sports with a HAV-F performance formula, in registry order"""
+        return tuple(self.performance_scorers)
+
+    def performance_fields(self) -> Tuple[str, ...]:
+        """Union of fields read by all performance formulas"""
+        if self._performance_fields is None:
+            fields = []
+            for sport in self.performance_sports():
+                fields.extend(self.scorers[sport].performance_fields)
+            self._performance_fields = tuple(dict.fromkeys(fields))
+        return self._performance_fields
+
+    def score(self, sport: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute a sport's metrics from source inputs"""
+        scorer = self.get(sport)
+        if scorer is None or not scorer.metrics:
+            raise KeyError(f"No metric scorer registered for {sport}")
+        return scorer.score(inputs)
+
+
+# Export registry instance
+registry = ScoringRegistry()
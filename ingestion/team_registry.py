@@ -4,7 +4,10 @@ Team Registry for Blaze Intelligence
 Comprehensive team data for all major leagues
 """
 
-from typing import Dict, List, Any
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
 # MLB Teams (30 teams)
 MLB_TEAMS = {
@@ -16,7 +19,7 @@ MLB_TEAMS = {
     "TOR": {"name": "Toronto Blue Jays", "division": "AL East", "market": "Toronto", "priority": 3},
     
     # American League Central
-    "CWS": {"name": "Chicago White Sox", "division": "AL Central", "market": "Chicago", "priority": 2},
+    "CWS": {"name": "Chicago White Sox", "division": "AL Central", "market": "Chicago", "aliases": ["CHW"], "priority": 2},
     "CLE": {"name": "Cleveland Guardians", "division": "AL Central", "market": "Cleveland", "priority": 2},
     "DET": {"name": "Detroit Tigers", "division": "AL Central", "market": "Detroit", "priority": 3},
     "KC": {"name": "Kansas City Royals", "division": "AL Central", "market": "Kansas City", "priority": 3},
@@ -25,7 +28,7 @@ MLB_TEAMS = {
     # American League West
     "HOU": {"name": "Houston Astros", "division": "AL West", "market": "Houston", "priority": 1},
     "LAA": {"name": "Los Angeles Angels", "division": "AL West", "market": "Los Angeles", "priority": 2},
-    "OAK": {"name": "Oakland Athletics", "division": "AL West", "market": "Oakland", "priority": 3},
+    "OAK": {"name": "Oakland Athletics", "division": "AL West", "market": "Oakland", "aliases": ["ATH", "A's"], "priority": 3},
     "SEA": {"name": "Seattle Mariners", "division": "AL West", "market": "Seattle", "priority": 2},
     "TEX": {"name": "Texas Rangers", "division": "AL West", "market": "Dallas", "priority": 2},
     
@@ -44,7 +47,7 @@ MLB_TEAMS = {
     "STL": {"name": "St. Louis Cardinals", "division": "NL Central", "market": "St. Louis", "priority": 0},  # PRIMARY FOCUS
     
     # National League West
-    "ARI": {"name": "Arizona Diamondbacks", "division": "NL West", "market": "Phoenix", "priority": 2},
+    "ARI": {"name": "Arizona Diamondbacks", "division": "NL West", "market": "Phoenix", "aliases": ["AZ"], "priority": 2},
     "COL": {"name": "Colorado Rockies", "division": "NL West", "market": "Denver", "priority": 3},
     "LAD": {"name": "Los Angeles Dodgers", "division": "NL West", "market": "Los Angeles", "priority": 1},
     "SD": {"name": "San Diego Padres", "division": "NL West", "market": "San Diego", "priority": 1},
@@ -102,49 +105,49 @@ NFL_TEAMS = {
     "SF": {"name": "San Francisco 49ers", "division": "NFC West", "market": "San Francisco", "priority": 1}
 }
 
-# NBA Teams (30 teams) - Grizzlies focus
+# NBA Teams (30 teams) - Grizzlies focus; nba_id is the NBA Stats API TeamID
 NBA_TEAMS = {
     # Eastern Conference - Atlantic
-    "BOS": {"name": "Boston Celtics", "division": "Atlantic", "conference": "Eastern", "priority": 1},
-    "BKN": {"name": "Brooklyn Nets", "division": "Atlantic", "conference": "Eastern", "priority": 2},
-    "NYK": {"name": "New York Knicks", "division": "Atlantic", "conference": "Eastern", "priority": 1},
-    "PHI": {"name": "Philadelphia 76ers", "division": "Atlantic", "conference": "Eastern", "priority": 1},
-    "TOR": {"name": "Toronto Raptors", "division": "Atlantic", "conference": "Eastern", "priority": 2},
+    "BOS": {"name": "Boston Celtics", "division": "Atlantic", "market": "Boston", "conference": "Eastern", "nba_id": "1610612738", "priority": 1},
+    "BKN": {"name": "Brooklyn Nets", "division": "Atlantic", "market": "Brooklyn", "conference": "Eastern", "nba_id": "1610612751", "priority": 2},
+    "NYK": {"name": "New York Knicks", "division": "Atlantic", "market": "New York", "conference": "Eastern", "nba_id": "1610612752", "priority": 1},
+    "PHI": {"name": "Philadelphia 76ers", "division": "Atlantic", "market": "Philadelphia", "conference": "Eastern", "nba_id": "1610612755", "priority": 1},
+    "TOR": {"name": "Toronto Raptors", "division": "Atlantic", "market": "Toronto", "conference": "Eastern", "nba_id": "1610612761", "priority": 2},
     
     # Eastern Conference - Central
-    "CHI": {"name": "Chicago Bulls", "division": "Central", "conference": "Eastern", "priority": 2},
-    "CLE": {"name": "Cleveland Cavaliers", "division": "Central", "conference": "Eastern", "priority": 2},
-    "DET": {"name": "Detroit Pistons", "division": "Central", "conference": "Eastern", "priority": 3},
-    "IND": {"name": "Indiana Pacers", "division": "Central", "conference": "Eastern", "priority": 2},
-    "MIL": {"name": "Milwaukee Bucks", "division": "Central", "conference": "Eastern", "priority": 1},
+    "CHI": {"name": "Chicago Bulls", "division": "Central", "market": "Chicago", "conference": "Eastern", "nba_id": "1610612741", "priority": 2},
+    "CLE": {"name": "Cleveland Cavaliers", "division": "Central", "market": "Cleveland", "conference": "Eastern", "nba_id": "1610612739", "priority": 2},
+    "DET": {"name": "Detroit Pistons", "division": "Central", "market": "Detroit", "conference": "Eastern", "nba_id": "1610612765", "priority": 3},
+    "IND": {"name": "Indiana Pacers", "division": "Central", "market": "Indianapolis", "conference": "Eastern", "nba_id": "1610612754", "priority": 2},
+    "MIL": {"name": "Milwaukee Bucks", "division": "Central", "market": "Milwaukee", "conference": "Eastern", "nba_id": "1610612749", "priority": 1},
     
     # Eastern Conference - Southeast
-    "ATL": {"name": "Atlanta Hawks", "division": "Southeast", "conference": "Eastern", "priority": 2},
-    "CHA": {"name": "Charlotte Hornets", "division": "Southeast", "conference": "Eastern", "priority": 3},
-    "MIA": {"name": "Miami Heat", "division": "Southeast", "conference": "Eastern", "priority": 1},
-    "ORL": {"name": "Orlando Magic", "division": "Southeast", "conference": "Eastern", "priority": 2},
-    "WAS": {"name": "Washington Wizards", "division": "Southeast", "conference": "Eastern", "priority": 3},
+    "ATL": {"name": "Atlanta Hawks", "division": "Southeast", "market": "Atlanta", "conference": "Eastern", "nba_id": "1610612737", "priority": 2},
+    "CHA": {"name": "Charlotte Hornets", "division": "Southeast", "market": "Charlotte", "conference": "Eastern", "nba_id": "1610612766", "priority": 3},
+    "MIA": {"name": "Miami Heat", "division": "Southeast", "market": "Miami", "conference": "Eastern", "nba_id": "1610612748", "priority": 1},
+    "ORL": {"name": "Orlando Magic", "division": "Southeast", "market": "Orlando", "conference": "Eastern", "nba_id": "1610612753", "priority": 2},
+    "WAS": {"name": "Washington Wizards", "division": "Southeast", "market": "Washington", "conference": "Eastern", "nba_id": "1610612764", "priority": 3},
     
     # Western Conference - Northwest
-    "DEN": {"name": "Denver Nuggets", "division": "Northwest", "conference": "Western", "priority": 1},
-    "MIN": {"name": "Minnesota Timberwolves", "division": "Northwest", "conference": "Western", "priority": 2},
-    "OKC": {"name": "Oklahoma City Thunder", "division": "Northwest", "conference": "Western", "priority": 2},
-    "POR": {"name": "Portland Trail Blazers", "division": "Northwest", "conference": "Western", "priority": 3},
-    "UTA": {"name": "Utah Jazz", "division": "Northwest", "conference": "Western", "priority": 3},
+    "DEN": {"name": "Denver Nuggets", "division": "Northwest", "market": "Denver", "conference": "Western", "nba_id": "1610612743", "priority": 1},
+    "MIN": {"name": "Minnesota Timberwolves", "division": "Northwest", "market": "Minneapolis", "conference": "Western", "nba_id": "1610612750", "priority": 2},
+    "OKC": {"name": "Oklahoma City Thunder", "division": "Northwest", "market": "Oklahoma City", "conference": "Western", "nba_id": "1610612760", "priority": 2},
+    "POR": {"name": "Portland Trail Blazers", "division": "Northwest", "market": "Portland", "conference": "Western", "nba_id": "1610612757", "priority": 3},
+    "UTA": {"name": "Utah Jazz", "division": "Northwest", "market": "Salt Lake City", "conference": "Western", "nba_id": "1610612762", "priority": 3},
     
     # Western Conference - Pacific
-    "GSW": {"name": "Golden State Warriors", "division": "Pacific", "conference": "Western", "priority": 1},
-    "LAC": {"name": "Los Angeles Clippers", "division": "Pacific", "conference": "Western", "priority": 1},
-    "LAL": {"name": "Los Angeles Lakers", "division": "Pacific", "conference": "Western", "priority": 1},
-    "PHX": {"name": "Phoenix Suns", "division": "Pacific", "conference": "Western", "priority": 1},
-    "SAC": {"name": "Sacramento Kings", "division": "Pacific", "conference": "Western", "priority": 2},
+    "GSW": {"name": "Golden State Warriors", "division": "Pacific", "market": "San Francisco", "conference": "Western", "nba_id": "1610612744", "aliases": ["GS"], "priority": 1},
+    "LAC": {"name": "Los Angeles Clippers", "division": "Pacific", "market": "Los Angeles", "conference": "Western", "nba_id": "1610612746", "priority": 1},
+    "LAL": {"name": "Los Angeles Lakers", "division": "Pacific", "market": "Los Angeles", "conference": "Western", "nba_id": "1610612747", "priority": 1},
+    "PHX": {"name": "Phoenix Suns", "division": "Pacific", "market": "Phoenix", "conference": "Western", "nba_id": "1610612756", "priority": 1},
+    "SAC": {"name": "Sacramento Kings", "division": "Pacific", "market": "Sacramento", "conference": "Western", "nba_id": "1610612758", "priority": 2},
     
     # Western Conference - Southwest  
-    "DAL": {"name": "Dallas Mavericks", "division": "Southwest", "conference": "Western", "priority": 1},
-    "HOU": {"name": "Houston Rockets", "division": "Southwest", "conference": "Western", "priority": 2},
-    "MEM": {"name": "Memphis Grizzlies", "division": "Southwest", "conference": "Western", "priority": 0},  # PRIMARY FOCUS
-    "NO": {"name": "New Orleans Pelicans", "division": "Southwest", "conference": "Western", "priority": 2},
-    "SA": {"name": "San Antonio Spurs", "division": "Southwest", "conference": "Western", "priority": 2}
+    "DAL": {"name": "Dallas Mavericks", "division": "Southwest", "market": "Dallas", "conference": "Western", "nba_id": "1610612742", "priority": 1},
+    "HOU": {"name": "Houston Rockets", "division": "Southwest", "market": "Houston", "conference": "Western", "nba_id": "1610612745", "priority": 2},
+    "MEM": {"name": "Memphis Grizzlies", "division": "Southwest", "market": "Memphis", "conference": "Western", "nba_id": "1610612763", "priority": 0},  # PRIMARY FOCUS
+    "NO": {"name": "New Orleans Pelicans", "division": "Southwest", "market": "New Orleans", "conference": "Western", "nba_id": "1610612740", "aliases": ["NOP"], "priority": 2},
+    "SA": {"name": "San Antonio Spurs", "division": "Southwest", "market": "San Antonio", "conference": "Western", "nba_id": "1610612759", "aliases": ["SAS"], "priority": 2}
 }
 
 # NCAA Teams - Focus on major programs
@@ -162,6 +165,155 @@ NCAA_TEAMS = {
 }
 
 
+# League team tables indexed below; league labels match canonical team IDs (MLB-STL)
+LEAGUE_TEAMS = {
+    "MLB": MLB_TEAMS,
+    "NFL": NFL_TEAMS,
+    "NBA": NBA_TEAMS,
+    "NCAA": NCAA_TEAMS
+}
+
+
+def alias_key(text: str) -> str:
+    """Normalized lookup key: lowercase alphanumerics only ("St. Louis" -> "stlouis")"""
+    return re.sub(r'[^0-9a-z]', '', str(text).lower())
+
+
+@dataclass(frozen=True)
+class Team:
+    """One registry team with every identifier it is known by"""
+    league: str
+    code: str
+    name: str
+    market: Optional[str]
+    division: Optional[str]
+    conference: Optional[str]
+    priority: int
+    nickname: str
+    aliases: Tuple[str, ...]
+    nba_id: Optional[str] = None
+
+    @property
+    def team_id(self) -> str:
+        """Canonical ID used in league files and unified datasets (MLB-STL)"""
+        return f"{self.league}-{self.code}"
+
+    @property
+    def slug(self) -> str:
+        """Lowercase ID used by agents and reports (mlb_stl)"""
+        return f"{self.league.lower()}_{self.code.lower()}"
+
+
+def _build_team(league: str, code: str, data: Dict[str, Any]) -> Team:
+    name = data["name"]
+    market = data.get("market")
+    if market and name.startswith(market + " "):
+        location, nickname = market, name[len(market) + 1:]
+    else:
+        location, nickname = name.rsplit(" ", 1) if " " in name else (name, name)
+
+    aliases = (code, f"{league}-{code}", f"{league.lower()}_{code.lower()}", name, nickname,
+               location, f"{location} {nickname}", *data.get("aliases", []))
+    return Team(
+        league=league, code=code, name=name, market=market,
+        division=data.get("division"), conference=data.get("conference"),
+        priority=data.get("priority", 3), nickname=nickname,
+        aliases=tuple(dict.fromkeys(aliases)), nba_id=data.get("nba_id")
+    )
+
+
+def _freeze(index: Dict[Any, List[Team]]) -> Mapping[Any, Tuple[Team, ...]]:
+    return MappingProxyType({key: tuple(teams) for key, teams in index.items()})
+
+
+class TeamIndex:
+    """
+    Immutable lookup tables over all league teams, built once at import.
+    Every lookup is a dictionary access on normalized keys.
+    """
+
+    def __init__(self, league_teams: Mapping[str, Mapping[str, Dict[str, Any]]]):
+        teams = tuple(
+            _build_team(league, code, data)
+            for league, table in league_teams.items()
+            for code, data in table.items()
+        )
+        self.teams = teams
+
+        by_code = {}
+        by_alias = {}
+        by_market = {}
+        by_division = {}
+        for team in teams:
+            by_code[(team.league, team.code)] = team
+            for alias in team.aliases:
+                by_alias.setdefault(alias_key(alias), []).append(team)
+            if team.market:
+                by_market.setdefault(alias_key(team.market), []).append(team)
+            if team.division:
+                by_division.setdefault((team.league, alias_key(team.division)), []).append(team)
+
+        self._by_code = MappingProxyType(by_code)
+        self._by_id = MappingProxyType({alias_key(team.team_id): team for team in teams})
+        self._by_alias = _freeze({key: list(dict.fromkeys(matches)) for key, matches in by_alias.items()})
+        self._by_market = _freeze(by_market)
+        self._by_division = _freeze(by_division)
+        self._by_nba_id = MappingProxyType({team.nba_id: team for team in teams if team.nba_id})
+
+    def get(self, league: str, code: str) -> Optional[Team]:
+        """Team by league and registry code or alias ("MLB", "STL" / "AZ")"""
+        team = self._by_code.get((league.upper(), code.upper()))
+        if team is None:
+            team = self.resolve(code, league)
+        return team
+
+    def require(self, league: str, code: str) -> Team:
+        team = self.get(league, code)
+        if team is None:
+            raise KeyError(f"Unknown {league} team: {code}")
+        return team
+
+    def by_id(self, team_id: str) -> Optional[Team]:
+        """Team by canonical ID ("MLB-STL") or slug ("mlb_stl")"""
+        return self._by_id.get(alias_key(team_id))
+
+    def by_nba_id(self, nba_id: str) -> Optional[Team]:
+        return self._by_nba_id.get(str(nba_id))
+
+    def matches(self, text: str, league: Optional[str] = None) -> Tuple[Team, ...]:
+        """Every team known by an alias (e.g. "Cardinals" -> MLB-STL, NFL-ARI)"""
+        teams = self._by_alias.get(alias_key(text), ())
+        if league:
+            teams = tuple(team for team in teams if team.league == league.upper())
+        return teams
+
+    def resolve(self, text: str, league: Optional[str] = None) -> Optional[Team]:
+        """The team an alias names, or None when unknown or ambiguous"""
+        teams = self.matches(text, league)
+        return teams[0] if len(teams) == 1 else None
+
+    def in_market(self, market: str, league: Optional[str] = None) -> Tuple[Team, ...]:
+        teams = self._by_market.get(alias_key(market), ())
+        if league:
+            teams = tuple(team for team in teams if team.league == league.upper())
+        return teams
+
+    def in_division(self, league: str, division: str) -> Tuple[Team, ...]:
+        return self._by_division.get((league.upper(), alias_key(division)), ())
+
+    def in_league(self, league: str) -> Tuple[Team, ...]:
+        return tuple(team for team in self.teams if team.league == league.upper())
+
+    def team_id(self, league: str, code: str) -> str:
+        """Canonical ID for a league code, aliases resolved; unregistered teams keep their code"""
+        team = self.get(league, code)
+        return team.team_id if team else f"{league.upper()}-{code}"
+
+
+# Built once at import and shared by every agent and report
+team_index = TeamIndex(LEAGUE_TEAMS)
+
+
 class TeamRegistry:
     """Central registry for all team data"""
     
@@ -170,6 +322,7 @@ class TeamRegistry:
         self.nfl_teams = NFL_TEAMS  
         self.nba_teams = NBA_TEAMS
         self.ncaa_teams = NCAA_TEAMS
+        self.index = team_index
     
     def get_teams_by_priority(self, league: str, max_priority: int = 1) -> List[str]:
         """Get teams by priority level (0=primary focus, 1=high, 2=medium, 3=low)"""
@@ -216,17 +369,16 @@ class TeamRegistry:
     
     def get_team_info(self, league: str, team_code: str) -> Dict[str, Any]:
         """Get detailed team information"""
-        teams_dict = getattr(self, f"{league.lower()}_teams", {})
-        team_data = teams_dict.get(team_code, {})
+        team = self.index.get(league, team_code)
         
         return {
             "code": team_code,
-            "name": team_data.get("name", "Unknown"),
+            "name": team.name if team else "Unknown",
             "league": league,
-            "market": team_data.get("market", "Unknown"),
-            "division": team_data.get("division", "Unknown"),
-            "priority": team_data.get("priority", 3),
-            "team_id": f"{league}-{team_code}"
+            "market": (team.market if team else None) or "Unknown",
+            "division": (team.division if team else None) or "Unknown",
+            "priority": team.priority if team else 3,
+            "team_id": self.index.team_id(league, team_code)
         }
 
 
@@ -6,6 +6,7 @@ Generates automated reports for clients with customizable templates and delivery
 
 import json
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
@@ -23,6 +24,10 @@ from jinja2 import Template
 import io
 import base64
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ingestion.team_registry import team_index
+from ingestion.readiness_snapshot import load_readiness
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -388,29 +393,29 @@ class ClientReportGenerator:
         """Collect performance data for focus teams"""
         teams_data = []
         
-        # Mock data collection - in production, this would query actual data files
-        team_mappings = {
-            'mlb_stl': {'name': 'St. Louis Cardinals', 'league': 'MLB'},
-            'nfl_ten': {'name': 'Tennessee Titans', 'league': 'NFL'},
-            'ncaa_tex': {'name': 'Texas Longhorns', 'league': 'NCAA'},
-            'nba_mem': {'name': 'Memphis Grizzlies', 'league': 'NBA'}
-        }
+        # Readiness board snapshot when available; mock metrics otherwise
+        try:
+            readiness = load_readiness()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Readiness data unavailable, using mock metrics: {e}")
+            readiness = None
         
         for team_id in focus_teams:
-            if team_id in team_mappings:
-                # Try to load actual data
-                data_files = [
-                    f"data/{team_id}_*",
-                    f"data/{team_mappings[team_id]['league'].lower()}_*"
-                ]
+            team = team_index.by_id(team_id)
+            if team:
+                team_readiness = readiness.team(team.team_id) if readiness else None
+                top_players = [
+                    {'name': player['name'], 'position': player['position'], 'readiness': player['champion_readiness']}
+                    for player in readiness.top_players(3, team_id=team.team_id)
+                ] if readiness else []
                 
-                # Mock team data with realistic metrics
+                # Mock team data with realistic metrics where the board has none
                 team_data = {
                     'id': team_id,
-                    'name': team_mappings[team_id]['name'],
-                    'league': team_mappings[team_id]['league'],
-                    'avg_readiness': round(60 + (hash(team_id) % 30), 1),
-                    'top_players': [
+                    'name': team.name,
+                    'league': team.league,
+                    'avg_readiness': team_readiness['avg_readiness'] if team_readiness else round(60 + (hash(team_id) % 30), 1),
+                    'top_players': top_players or [
                         {'name': f'Player {i}', 'position': 'POS', 'readiness': 85 + (i * 2)} 
                         for i in range(1, 4)
                     ],
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+HAV-F Benchmark for Blaze Intelligence
+Compares players/second of the scalar and NumPy batch HAV-F paths
+"""
+
+import os
+import sys
+import gc
+import copy
+import time
+import random
+import argparse
+from typing import Dict, List, Any
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.havf import compute_all
+
+
+def _maybe(value: Any, rate: float = 0.8) -> Any:
+    """Return value or None to simulate sparse sources"""
+    return value if random.random() < rate else None
+
+
+def generate_roster(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate a synthetic multi-league roster in the normalized Blaze schema"""
+    random.seed(seed)
+    sports = ['MLB', 'NFL', 'NCAA-FB', 'HS-FB', 'Baseball']
+    players = []
+
+    for i in range(count):
+        sport = random.choice(sports)
+        perfs = {
+            'war': round(random.uniform(-1, 8), 1),
+            'wpa': round(random.uniform(-1, 4), 2),
+            'epa': round(random.uniform(-20, 40), 1),
+            'total_yards': random.randint(0, 3000),
+            'total_tds': random.randint(0, 30)
+        }
+
+        biometrics = None
+        if random.random() < 0.6:
+            biometrics = {
+                'hrv_rmssd_ms': _maybe(round(random.uniform(20, 90), 1)),
+                'reaction_ms': _maybe(round(random.uniform(130, 260), 1)),
+                'gsr_microsiemens': _maybe(round(random.uniform(1, 12), 2)),
+                'sleep_hours': _maybe(round(random.uniform(5, 10), 1))
+            }
+
+        nil_profile = None
+        if random.random() < 0.4:
+            nil_profile = {
+                'engagement_rate': _maybe(round(random.uniform(0, 0.08), 3)),
+                'deals_last_90d': _maybe(random.randint(0, 15)),
+                'deal_value_90d_usd': _maybe(random.randint(0, 300000)),
+                'search_index': _maybe(round(random.uniform(0, 100), 1)),
+                'local_popularity_index': _maybe(round(random.uniform(0, 100), 1))
+            }
+
+        players.append({
+            'player_id': f"BENCH-{i:06d}",
+            'name': f"Bench Player {i}",
+            'sport': sport,
+            'team_id': f"BENCH-{i % 500:03d}",
+            'position': 'UT',
+            'bio': {'dob': f"{random.randint(1985, 2008)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"},
+            'stats': {'season': '2024', 'perfs': perfs},
+            'biometrics': biometrics,
+            'nil_profile': nil_profile,
+            'hav_f': {},
+            'meta': {}
+        })
+
+    return players
+
+
+def time_path(players: List[Dict[str, Any]], batch: bool, repeat: int) -> float:
+    """Return best-of-N seconds for one compute_all pass"""
+    best = float('inf')
+    for _ in range(repeat):
+        roster = copy.deepcopy(players)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            compute_all(roster, batch=batch)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def scores_match(players: List[Dict[str, Any]]) -> bool:
+    """Check that both paths stamp identical scores"""
+    scalar = copy.deepcopy(players)
+    batch = copy.deepcopy(players)
+    compute_all(scalar, batch=False)
+    compute_all(batch, batch=True)
+
+    metrics = ('champion_readiness', 'cognitive_leverage', 'nil_trust_score')
+    for a, b in zip(scalar, batch):
+        for metric in metrics:
+            if a['hav_f'][metric] != b['hav_f'][metric] or type(a['hav_f'][metric]) is not type(b['hav_f'][metric]):
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HAV-F scalar vs batch computation')
+    parser.add_argument('--players', type=int, default=50000, help='Synthetic roster size')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per path (best is reported)')
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy not installed - batch path unavailable")
+        sys.exit(1)
+
+    players = generate_roster(args.players)
+
+    print(f"HAV-F benchmark: {args.players:,} players, best of {args.repeat}")
+    print("-" * 50)
+
+    identical = scores_match(players)
+    print(f"Scores identical: {'✅' if identical else '❌'}")
+
+    scalar_time = time_path(players, batch=False, repeat=args.repeat)
+    batch_time = time_path(players, batch=True, repeat=args.repeat)
+
+    print(f"  Scalar: {args.players / scalar_time:>12,.0f} players/s ({scalar_time:.3f}s)")
+    print(f"  Batch:  {args.players / batch_time:>12,.0f} players/s ({batch_time:.3f}s)")
+    print(f"  Speedup: {scalar_time / batch_time:.1f}x")
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
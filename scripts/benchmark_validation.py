@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Schema validation benchmark for Blaze Intelligence
+Compares players/second of per-call jsonschema.validate and the
+precompiled streaming validator
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Dict, List, Any
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.schema_validator import get_player_validator, PLAYER_SCHEMA_PATH
+from scripts.benchmark_havf import generate_roster
+
+
+def time_per_call(players: List[Dict[str, Any]], schema: Dict[str, Any]) -> float:
+    """Seconds to validate each player with jsonschema.validate (validator rebuilt per call)"""
+    import jsonschema
+
+    start = time.perf_counter()
+    for player in players:
+        try:
+            jsonschema.validate(player, schema)
+        except jsonschema.ValidationError:
+            pass
+    return time.perf_counter() - start
+
+
+def time_precompiled(players: List[Dict[str, Any]]) -> float:
+    """Seconds to collect every error with the cached validator"""
+    start = time.perf_counter()
+    get_player_validator().validate_all(players)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark player schema validation')
+    parser.add_argument('--players', type=int, default=20000, help='Synthetic roster size')
+    parser.add_argument('--per-call-sample', type=int, default=500,
+                        help='Players timed with per-call validation (it is slow)')
+    args = parser.parse_args()
+
+    try:
+        import jsonschema  # noqa: F401
+    except ImportError:
+        print("jsonschema not installed - nothing to compare against")
+        sys.exit(1)
+
+    players = generate_roster(args.players)
+    validator = get_player_validator()
+    errors = validator.validate_all(players)
+
+    print(f"Validation benchmark: {args.players:,} players ({os.path.basename(PLAYER_SCHEMA_PATH)})")
+    print("-" * 50)
+    print(f"Errors found: {len(errors)} across {len({error['player_id'] for error in errors})} players")
+
+    sample = players[:args.per_call_sample]
+    per_call_rate = len(sample) / time_per_call(sample, validator.schema)
+    precompiled_time = time_precompiled(players)
+    precompiled_rate = args.players / precompiled_time
+
+    print(f"  Per-call:    {per_call_rate:>12,.0f} players/s ({len(sample):,} sampled)")
+    print(f"  Precompiled: {precompiled_rate:>12,.0f} players/s ({precompiled_time:.3f}s)")
+    print(f"  Speedup: {precompiled_rate / per_call_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,137 @@ import os
 import sys
 import subprocess
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Any
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Agent classes are imported once and shared by every in-process run
+from ingestion.mlb_agent import MLBAgent
+from ingestion.nfl_agent import NFLAgent
+from ingestion.ncaa_agent import NCAAAgent
+from ingestion.hs_agent import HSAgent
+from ingestion.nil_agent import NILAgent
+from ingestion.intl_agent import InternationalAgent
+
+
+AGENT_CLASSES = {
+    'mlb': MLBAgent,
+    'nfl': NFLAgent,
+    'ncaa': NCAAAgent,
+    'hs': HSAgent,
+    'nil': NILAgent,
+    'intl': InternationalAgent
+}
+
+# League-specific parameters (also passed as --key value flags with --isolate)
+LEAGUE_PARAMS = {
+    'mlb': {'team': 'STL'},
+    'nfl': {'team': 'TEN'},
+    'ncaa': {'team': 'TEX'},
+    'hs': {},
+    'nil': {},
+    'intl': {'league': 'KBO'}
+}
+
+
+class LeagueOutput:
+    """
+    Thread-aware stdout that prefixes each line with the league being run on
+    the writing thread, so concurrent agents stream readable progress live.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.local = threading.local()
+    
+    def set_league(self, league: str = None) -> None:
+        self.local.league = league
+        self.local.buffer = ''
+    
+    def write(self, text: str) -> int:
+        league = getattr(self.local, 'league', None)
+        if league is None:
+            with self.lock:
+                return self.stream.write(text)
+        
+        self.local.buffer += text
+        *lines, self.local.buffer = self.local.buffer.split('\n')
+        if lines:
+            with self.lock:
+                for line in lines:
+                    self.stream.write(f"[{league.upper()}] {line}\n")
+                self.stream.flush()
+        return len(text)
+    
+    def flush(self) -> None:
+        league = getattr(self.local, 'league', None)
+        if league is not None and self.local.buffer:
+            self.write('\n')
+        with self.lock:
+            self.stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def run_agent_inprocess(agent_name: str, params: Dict[str, str] = None) -> bool:
+    """Run a specific agent with live data in this process"""
+    agent_class = AGENT_CLASSES.get(agent_name)
+    if agent_class is None:
+        print(f"Agent {agent_name} not found")
+        return False
+    
+    # Agents check LIVE_FETCH when fetching
+    os.environ['LIVE_FETCH'] = '1'
+    
+    start = time.time()
+    try:
+        success = agent_class().run(params or {}, live=True)
+    except Exception as e:
+        print(f"❌ Error running {agent_name} agent: {e}")
+        return False
+    
+    status = "completed successfully" if success else "failed"
+    print(f"{'✅' if success else '❌'} {agent_name.upper()} agent {status} ({time.time() - start:.2f}s)")
+    return success
+
+
+def run_agents_concurrently(leagues: List[str], max_parallel: int = 0,
+                            isolate: bool = False) -> Dict[str, bool]:
+    """Run leagues concurrently, streaming each league's output as it happens"""
+    runner = run_agent if isolate else run_agent_inprocess
+    results = {}
+    
+    output = LeagueOutput(sys.stdout)
+    sys.stdout = output
+    
+    def run_league(league: str) -> bool:
+        output.set_league(league)
+        try:
+            return runner(league, LEAGUE_PARAMS[league])
+        finally:
+            output.flush()
+            output.set_league(None)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_parallel or len(leagues)) as pool:
+            futures = {pool.submit(run_league, league): league for league in leagues}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    finally:
+        sys.stdout = output.stream
+    
+    return {league: results[league] for league in leagues}
+
 
 def run_agent(agent_name: str, params: Dict[str, str] = None) -> bool:
-    """Run a specific agent with live data"""
+    """Run a specific agent with live data in an isolated subprocess"""
     agent_path = f"ingestion/{agent_name}_agent.py"
     
     if not os.path.exists(agent_path):
@@ -37,17 +159,18 @@ def run_agent(agent_name: str, params: Dict[str, str] = None) -> bool:
         env = os.environ.copy()
         env['LIVE_FETCH'] = '1'
         
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True, cwd=os.getcwd())
+        # Stream the child's output line by line as it runs
+        process = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, cwd=os.getcwd())
+        for line in process.stdout:
+            print(line.rstrip('\n'))
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✅ {agent_name.upper()} agent completed successfully")
-            if result.stdout:
-                print(result.stdout)
             return True
         else:
             print(f"❌ {agent_name.upper()} agent failed")
-            if result.stderr:
-                print(f"Error: {result.stderr}")
             return False
             
     except Exception as e:
@@ -74,7 +197,7 @@ def check_api_keys() -> Dict[str, bool]:
     return keys_status
 
 
-def run_full_pipeline(leagues: List[str] = None) -> bool:
+def run_full_pipeline(leagues: List[str] = None, max_parallel: int = 0, isolate: bool = False) -> bool:
     """Run the complete live data ingestion pipeline"""
     print("🚀 Starting Blaze Intelligence Live Data Ingestion")
     print(f"Timestamp: {datetime.utcnow().isoformat()}Z")
@@ -90,23 +213,20 @@ def run_full_pipeline(leagues: List[str] = None) -> bool:
     
     results = {}
     
-    # League-specific parameters
-    league_params = {
-        'mlb': {'team': 'STL'},
-        'nfl': {'team': 'TEN'},
-        'ncaa': {'team': 'TEX'},
-        'hs': {'region': 'TX'},
-        'nil': {'sport': 'all'},
-        'intl': {'region': 'KBO'}
-    }
-    
+    known = [league for league in leagues if league in LEAGUE_PARAMS]
     for league in leagues:
-        if league in league_params:
-            results[league] = run_agent(league, league_params[league])
-        else:
+        if league not in LEAGUE_PARAMS:
             print(f"⚠️  Unknown league: {league}")
             results[league] = False
     
+    mode = "isolated subprocesses" if isolate else "in-process"
+    print(f"Running {len(known)} leagues {mode}, up to {max_parallel or len(known)} at a time")
+    start = time.time()
+    
+    if known:
+        results.update(run_agents_concurrently(known, max_parallel=max_parallel, isolate=isolate))
+    results = {league: results[league] for league in leagues}
+    
     print("-" * 60)
     print("📊 Ingestion Summary:")
     
@@ -117,7 +237,7 @@ def run_full_pipeline(leagues: List[str] = None) -> bool:
         status = "✅ Success" if success else "❌ Failed"
         print(f"  {league.upper()}: {status}")
     
-    print(f"\nOverall: {success_count}/{total_count} leagues completed successfully")
+    print(f"\nOverall: {success_count}/{total_count} leagues completed successfully ({time.time() - start:.2f}s)")
     
     if success_count == total_count:
         print("🎉 All ingestion tasks completed successfully!")
@@ -145,6 +265,17 @@ def main():
         choices=['mlb', 'nfl', 'ncaa', 'hs', 'nil', 'intl'],
         help='Run a single agent'
     )
+    parser.add_argument(
+        '--max-parallel',
+        type=int,
+        default=0,
+        help='Maximum leagues to run at once (default: all)'
+    )
+    parser.add_argument(
+        '--isolate',
+        action='store_true',
+        help='Run each agent in its own subprocess (previous behavior)'
+    )
     
     args = parser.parse_args()
     
@@ -153,18 +284,11 @@ def main():
         return
     
     if args.agent:
-        league_params = {
-            'mlb': {'team': 'STL'},
-            'nfl': {'team': 'TEN'},
-            'ncaa': {'team': 'TEX'},
-            'hs': {'region': 'TX'},
-            'nil': {'sport': 'all'},
-            'intl': {'region': 'KBO'}
-        }
-        success = run_agent(args.agent, league_params.get(args.agent, {}))
+        runner = run_agent if args.isolate else run_agent_inprocess
+        success = runner(args.agent, LEAGUE_PARAMS.get(args.agent, {}))
         sys.exit(0 if success else 1)
     
-    success = run_full_pipeline(args.leagues)
+    success = run_full_pipeline(args.leagues, max_parallel=args.max_parallel, isolate=args.isolate)
     sys.exit(0 if success else 1)
 
 
@@ -20,11 +20,22 @@ def run_readiness_update():
     print("-" * 60)
     
     try:
-        # Run readiness calculation
-        from ingestion.readiness import ReadinessCalculator
+        # Run readiness calculation (only league files changed since the last run)
+        from ingestion.readiness import ReadinessEngine, save_readiness_report
+        from ingestion.readiness_snapshot import write_snapshot
         
-        calculator = ReadinessCalculator()
-        success = calculator.generate_readiness_board()
+        engine = ReadinessEngine(['MLB-STL', 'NFL-TEN', 'NCAA-TEX'])
+        changed = engine.refresh()
+        print(f"Recomputed leagues: {', '.join(changed) or 'none'}")
+        
+        readiness_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                      'site', 'src', 'data', 'readiness.json')
+        success = bool(engine.leagues)
+        if success:
+            report = engine.report()
+            save_readiness_report(report, readiness_path)
+            write_snapshot(os.path.splitext(readiness_path)[0] + '.snapshot', report)
+            engine.save()
         
         if success:
             print("✅ Readiness board updated successfully")
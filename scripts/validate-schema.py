@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
-import json
+import os
 import sys
-from jsonschema import validate, ValidationError
 
-# Load schema
-with open('./blaze-unified-schema.json', 'r') as f:
-    schema = json.load(f)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ingestion.schema_validator import get_player_validator, format_error
+
+# Load schema (compiled once, cached per schema file)
+validator = get_player_validator('./blaze-unified-schema.json', definition='player')
 
 # Validate test data
 test_player = {
@@ -17,11 +18,13 @@ test_player = {
     "position": "SS"
 }
 
-try:
-    # Validate player structure
-    validate(instance=test_player, schema=schema['definitions']['player'])
+# Validate player structure, reporting every error
+errors = validator.errors(test_player)
+if not errors:
     print("✓ Schema validation passed")
     sys.exit(0)
-except ValidationError as e:
-    print(f"✗ Schema validation failed: {e.message}")
-    sys.exit(1)
+
+print(f"✗ Schema validation failed ({len(errors)} errors):")
+for error in errors:
+    print(f"  {format_error(error)}")
+sys.exit(1)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Team aggregator tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add automation scripts to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '03_AUTOMATION', 'python'))
+
+from blaze_aggregator import run_aggregation, aggregate, STATE_VERSION
+
+
+class TestBlazeAggregator(unittest.TestCase):
+    """Test table-driven, incremental aggregation"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self.output = self.base / 'out.json'
+        self.write('mlb_teams.json', [{'team': 'St. Louis Cardinals'}, {'team': 'Texas Rangers'}])
+        self.write('nfl_teams.json', [{'team': 'Tennessee Titans'}])
+        self.write('fcs_teams.json', [{'team': 'Montana Grizzlies', 'conference': 'Big Sky'}])
+        self.write('fbs_power_conferences_2025.json', {'flat': [{'team': 'Texas Longhorns', 'conference': 'SEC'}]})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        with open(self.base / name, 'w') as f:
+            json.dump(data, f)
+
+    def run_quietly(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_aggregation(self.base, self.output, **kwargs)
+
+    def test_single_batch_timestamp(self):
+        """Test every team from one run shares the batch timestamp"""
+        result = self.run_quietly()
+
+        self.assertEqual(len(result['teams']), 5)
+        self.assertEqual(len({team['last_updated_iso'] for team in result['teams']}), 1)
+        self.assertEqual(result['validation']['conferences'], {'Big Sky': 1, 'SEC': 1})
+        self.assertEqual(json.loads(self.output.read_text()), result['teams'])
+
+    def test_only_changed_sources_reprocessed(self):
+        """Test unchanged and touched-only files reuse the previous run"""
+        first = self.run_quietly()
+        self.assertEqual(len(first['changed']), 4)
+
+        os.utime(self.base / 'nfl_teams.json', ns=(0, 1))  # Touched, same content
+        self.write('mlb_teams.json', [{'team': 'St. Louis Cardinals'}, {'team': 'Kansas City Royals'}])
+        second = self.run_quietly()
+
+        self.assertEqual(second['changed'], ['mlb'])
+        self.assertIn('Kansas City Royals', {team['team_name'] for team in second['teams']})
+        self.assertEqual(self.run_quietly()['changed'], [])
+        self.assertEqual(len(self.run_quietly(full=True)['changed']), 4)
+
+    def test_state_from_another_version_discarded(self):
+        """Test saved state without the current version reprocesses every source"""
+        self.run_quietly()
+        state_path = self.base / 'out.state.json'
+        state = json.loads(state_path.read_text())
+        self.assertEqual(state['version'], STATE_VERSION)
+
+        del state['version']
+        state_path.write_text(json.dumps(state))
+        self.assertEqual(len(self.run_quietly()['changed']), 4)
+        self.assertEqual(self.run_quietly()['changed'], [])
+
+    def test_registry_teams_resolved(self):
+        """Test registry teams take canonical IDs and identifiers; others fall back to hashed IDs"""
+        teams = {team['team_name']: team for team in self.run_quietly()['teams']}
+
+        cardinals = teams['St. Louis Cardinals']
+        self.assertEqual((cardinals['team_id'], cardinals['market'], cardinals['division']),
+                         ('MLB-STL', 'St. Louis', 'NL Central'))
+        self.assertIn('Cardinals', cardinals['aliases'])
+        self.assertEqual(teams['Texas Longhorns']['team_id'], 'NCAA-TEX')
+        self.assertEqual(teams['Texas Longhorns']['conference'], 'SEC')
+        self.assertEqual(teams['Tennessee Titans']['team_id'], 'NFL-TEN')
+
+        grizzlies = teams['Montana Grizzlies']
+        self.assertEqual(len(grizzlies['team_id']), 12)
+        self.assertEqual((grizzlies['market'], grizzlies['division']), ('Montana', None))
+
+    def test_duplicates_reported_once(self):
+        """Test the dedupe index keeps the first team and reports the rest"""
+        team = {'league': 'MLB', 'team_id': 'abc', 'team_name': 'A', 'level': 'Professional',
+                'last_updated_iso': '2025-01-01T00:00:00Z'}
+        teams, report = aggregate([team, dict(team), dict(team, league='NFL')])
+
+        self.assertEqual(len(teams), 2)
+        self.assertEqual(report['issues'], ['Duplicate team_id: abc'])
+        self.assertEqual(report['leagues'], {'MLB': 1, 'NFL': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Columnar unified dataset tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.columnar_store import write_columnar, ColumnarDataset, link_latest
+
+
+class TestColumnarStore(unittest.TestCase):
+    """Test columnar write, memory-mapped read and latest links"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'unified_data_1.columns')
+        self.players = [
+            {
+                'player_id': 'MLB-STL-1', 'name': 'Ann Ace', 'sport': 'MLB',
+                'bio': {'dob': '1999-01-01', 'height_cm': 188.0},
+                'hav_f': {'champion_readiness': 59.0, 'cognitive_leverage': 60},
+                'meta': {'sources': ['MLB Stats API'], 'external_ids': {'mlbam_id': '1'}}
+            },
+            {
+                'player_id': 'MLB-STL-2', 'name': 'Bo Bench', 'sport': 'MLB',
+                'bio': None,
+                'hav_f': {'champion_readiness': 41.5, 'cognitive_leverage': 55},
+                'meta': {'sources': [], 'external_ids': {'mlbam_id': '2'}}
+            }
+        ]
+        self.teams = [{'team_id': 'MLB-STL', 'roster': ['MLB-STL-1', 'MLB-STL-2']}]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test players are rebuilt from the columns (missing fields omitted)"""
+        self.assertEqual(write_columnar(self.path, self.players, self.teams), 2)
+        dataset = ColumnarDataset(self.path)
+
+        players = list(dataset.players())
+        self.assertEqual(players[0], self.players[0])
+        self.assertNotIn('bio', players[1])
+        self.assertEqual(players[1]['meta']['sources'], [])
+        self.assertEqual(dataset.teams, self.teams)
+
+    def test_columns_are_memory_mapped(self):
+        """Test numeric columns load as read-only memory maps"""
+        write_columnar(self.path, self.players, self.teams)
+        column = ColumnarDataset(self.path).column('hav_f.champion_readiness')
+
+        self.assertIsInstance(column, np.memmap)
+        self.assertEqual(column.tolist(), [59.0, 41.5])
+        self.assertEqual(ColumnarDataset(self.path).column('hav_f.cognitive_leverage').dtype, np.int64)
+
+    def test_link_latest(self):
+        """Test latest is replaced by a link to the newest dataset"""
+        latest = os.path.join(self.tmp.name, 'unified_data_latest.columns')
+        write_columnar(self.path, self.players, self.teams)
+        link_latest(self.path, latest)
+
+        newer = os.path.join(self.tmp.name, 'unified_data_2.columns')
+        write_columnar(newer, self.players[:1])
+        link_latest(newer, latest)
+
+        self.assertEqual(os.path.realpath(latest), os.path.realpath(newer))
+        self.assertEqual(len(ColumnarDataset(latest)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,9 @@ HAV-F computation tests for Blaze Intelligence
 import unittest
 import sys
 import os
+import copy
+import json
+import tempfile
 from datetime import datetime
 
 # Add parent directory to path
@@ -15,9 +18,18 @@ from ingestion.havf import (
     compute_champion_readiness,
     compute_cognitive_leverage, 
     compute_nil_trust,
-    compute_all
+    compute_trajectory_score,
+    compute_all,
+    dob_trajectory,
+    havf_fingerprint,
+    load_previous_havf
 )
 
+try:
+    from ingestion.havf_batch import compute_all_batch
+except ImportError:
+    compute_all_batch = None
+
 
 class TestHAVF(unittest.TestCase):
     """Test HAV-F computation functions"""
@@ -238,5 +250,191 @@ class TestHAVF(unittest.TestCase):
         self.assertGreater(high_score, avg_score)
 
 
+class TestHAVFIncremental(unittest.TestCase):
+    """Test fingerprint-keyed incremental recomputation"""
+    
+    def make_player(self, player_id, war):
+        return {
+            'player_id': player_id,
+            'sport': 'MLB',
+            'stats': {'season': '2024', 'perfs': {'war': war, 'wpa': 0.5}},
+            'biometrics': {'hrv_rmssd_ms': 55.0},
+            'bio': {'dob': '1996-04-02'},
+            'hav_f': {},
+            'meta': {'updated_at': 'now'}
+        }
+    
+    def test_fingerprint_ignores_unrelated_fields(self):
+        """Test fingerprint only depends on fields HAV-F reads"""
+        player = self.make_player('P1', 2.0)
+        renamed = copy.deepcopy(player)
+        renamed['name'] = 'Someone Else'
+        renamed['meta']['updated_at'] = 'later'
+        changed = self.make_player('P1', 2.1)
+        
+        self.assertEqual(havf_fingerprint(player), havf_fingerprint(renamed))
+        self.assertNotEqual(havf_fingerprint(player), havf_fingerprint(changed))
+    
+    def test_unchanged_players_keep_previous_scores(self):
+        """Test only changed players are rescored and re-timestamped"""
+        previous_run = [self.make_player('P1', 2.0), self.make_player('P2', 3.0)]
+        compute_all(previous_run)
+        for player in previous_run:
+            player['hav_f']['last_computed_at'] = '2025-01-01T00:00:00Z'
+            player['meta']['updated_at'] = '2025-01-01T00:00:00Z'
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'mlb.json')
+            with open(path, 'w') as f:
+                json.dump({'league': 'MLB', 'players': previous_run}, f)
+            previous = load_previous_havf(path)
+        
+        players = [self.make_player('P1', 2.0), self.make_player('P2', 4.0)]
+        rescored = compute_all(players, previous=previous)
+        
+        self.assertEqual(rescored, 1)
+        self.assertEqual(players[0]['hav_f'], previous_run[0]['hav_f'])
+        self.assertEqual(players[0]['meta']['updated_at'], '2025-01-01T00:00:00Z')
+        self.assertNotEqual(players[1]['hav_f']['last_computed_at'], '2025-01-01T00:00:00Z')
+        self.assertEqual(players[1]['hav_f']['input_fingerprint'], havf_fingerprint(players[1]))
+    
+    def test_load_previous_missing_file(self):
+        """Test missing previous output yields an empty index"""
+        self.assertEqual(load_previous_havf('/nonexistent/league.json'), {})
+
+
+class TestHAVFTrajectory(unittest.TestCase):
+    """Test the reference-dated, memoized trajectory score"""
+    
+    def test_reference_date_buckets(self):
+        """Test ages are taken as of the reference date"""
+        player = {'bio': {'dob': '2000-01-01'}}
+        self.assertEqual(compute_trajectory_score(player, datetime(2026, 1, 1)), 90)
+        self.assertAlmostEqual(compute_trajectory_score(player, datetime(2022, 1, 1)), 80.0, places=1)
+        self.assertEqual(compute_trajectory_score(player, datetime(2050, 1, 1)), 50)
+        self.assertEqual(compute_trajectory_score({'bio': {}}, datetime(2026, 1, 1)), 50.0)
+        self.assertEqual(compute_trajectory_score({'bio': {'dob': {'year': 2000}}}, datetime(2026, 1, 1)), 50.0)
+    
+    def test_dob_table_is_shared(self):
+        """Test repeated DOBs hit the memoized table"""
+        reference = datetime(2026, 3, 1)
+        dob_trajectory.cache_clear()
+        for sport in ['MLB', 'NFL', 'NCAA-FB']:
+            compute_trajectory_score({'sport': sport, 'bio': {'dob': '1999-05-05'}}, reference)
+        
+        info = dob_trajectory.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+    
+    def test_bad_dobs_are_reported(self):
+        """Test unparseable DOBs are counted instead of silently swallowed"""
+        players = [
+            {'player_id': 'OK', 'sport': 'MLB', 'bio': {'dob': '1998-02-03'}},
+            {'player_id': 'BAD1', 'sport': 'MLB', 'bio': {'dob': '03/02/1998'}},
+            {'player_id': 'BAD2', 'sport': 'NFL', 'bio': {'dob': 19980203}},
+            {'player_id': 'BAD3', 'sport': 'NFL', 'bio': {'dob': ['1998', '02', '03']}},
+            {'player_id': 'NONE', 'sport': 'NFL', 'bio': {'dob': None}}
+        ]
+        bad_dobs = []
+        with self.assertLogs('ingestion.havf', level='WARNING') as logs:
+            compute_all(players, bad_dobs=bad_dobs)
+        
+        self.assertEqual(bad_dobs, ['BAD1', 'BAD2', 'BAD3'])
+        self.assertIn('3 player(s)', logs.output[0])
+        self.assertEqual(players[1]['hav_f']['champion_readiness'],
+                         compute_champion_readiness({'sport': 'MLB'}))
+
+
+@unittest.skipIf(compute_all_batch is None, "NumPy not available")
+class TestHAVFBatch(unittest.TestCase):
+    """Test that the batch engine matches the scalar reference exactly"""
+    
+    def assert_matches_scalar(self, players):
+        scalar = copy.deepcopy(players)
+        batch = copy.deepcopy(players)
+        compute_all(scalar, batch=False)
+        compute_all(batch, batch=True)
+        
+        for expected, actual in zip(scalar, batch):
+            for metric in ['champion_readiness', 'cognitive_leverage', 'nil_trust_score']:
+                self.assertEqual(expected['hav_f'][metric], actual['hav_f'][metric], metric)
+                self.assertIs(type(expected['hav_f'][metric]), type(actual['hav_f'][metric]), metric)
+            self.assertIsNotNone(actual['hav_f']['last_computed_at'])
+            self.assertEqual(actual['meta']['updated_at'], actual['hav_f']['last_computed_at'])
+    
+    def test_batch_matches_scalar_mixed_roster(self):
+        """Test batch scores across sports and sparse inputs"""
+        players = [
+            {
+                'sport': 'MLB',
+                'stats': {'perfs': {'war': 2.5, 'wpa': 1.8}},
+                'biometrics': {'hrv_rmssd_ms': 60.0, 'reaction_ms': 160.0, 'sleep_hours': 8.0},
+                'bio': {'dob': '1995-06-15'}
+            },
+            {
+                'sport': 'NFL',
+                'stats': {'perfs': {'epa': 25.5}},
+                'biometrics': {'gsr_microsiemens': 2.5, 'sleep_hours': 5.5},
+                'nil_profile': {'engagement_rate': 0.045, 'deals_last_90d': 8}
+            },
+            {
+                'sport': 'NCAA-FB',
+                'stats': {'perfs': {'total_yards': 1850, 'total_tds': 21}},
+                'biometrics': {'sleep_hours': 7.5},
+                'bio': {'dob': '2003-09-01'},
+                'nil_profile': {'valuation_usd': None, 'search_index': 72.0}
+            },
+            {
+                'sport': 'HS-FB',
+                'stats': {'perfs': {}},
+                'biometrics': None,
+                'nil_profile': {}
+            },
+            {
+                'sport': 'Baseball',
+                'stats': {'perfs': {'avg': 0.312}},
+                'bio': {'dob': 'not-a-date'},
+                'nil_profile': None
+            }
+        ]
+        self.assert_matches_scalar(players)
+    
+    def test_batch_clamped_scores_keep_scalar_types(self):
+        """Test clamped scores come back as the same int bounds as the scalar path"""
+        players = [
+            {'sport': 'MLB', 'biometrics': {'reaction_ms': 20.0, 'hrv_rmssd_ms': 120.0}},
+            {'sport': 'MLB', 'biometrics': {'reaction_ms': 400.0, 'gsr_microsiemens': 30.0}},
+            {'nil_profile': {'engagement_rate': 0.2, 'deals_last_90d': 20, 'deal_value_90d_usd': 500000,
+                             'search_index': 150, 'local_popularity_index': 150}}
+        ]
+        self.assert_matches_scalar(players)
+    
+    def test_batch_rounding_ties(self):
+        """Test .x5 values round the same way as the builtin round()"""
+        players = [
+            {'sport': 'MLB', 'stats': {'perfs': {'war': war, 'wpa': 0.0}}}
+            for war in [0.15, 0.25, 0.35, 1.05, 1.15, 2.45]
+        ]
+        self.assert_matches_scalar(players)
+    
+    def test_batch_falls_back_for_unsupported_values(self):
+        """Test non-numeric and non-finite inputs go through the scalar path"""
+        players = [
+            {'sport': 'MLB', 'stats': {'perfs': {'war': 2.0}}, 'biometrics': {'reaction_ms': float('nan')}},
+            {'sport': 'NFL', 'stats': {'perfs': {'epa': float('inf')}}},
+            {'sport': 'MLB', 'stats': {'perfs': {'war': True}}},
+            {'nil_profile': {'deal_value_90d_usd': 10 ** 20}}
+        ]
+        self.assert_matches_scalar(players)
+    
+    def test_batch_raises_like_scalar(self):
+        """Test malformed players raise the same error in both paths"""
+        players = [{'sport': 'MLB', 'stats': {'perfs': {'war': 'x'}}}]
+        with self.assertRaises(TypeError):
+            compute_all(copy.deepcopy(players), batch=False)
+        with self.assertRaises(TypeError):
+            compute_all_batch(copy.deepcopy(players))
+
+
 if __name__ == '__main__':
     unittest.main()
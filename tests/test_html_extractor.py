@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+HTML extractor tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+
+# Add automation scripts to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '03_AUTOMATION', 'python'))
+
+from html_extractor import extract_document
+
+DOCUMENT = """<!DOCTYPE html>
+<html><head>
+<title>Blaze OS</title>
+<meta name="description" content="Championship analytics">
+<meta name="keywords" content="mlb,nfl">
+<link rel="preload stylesheet" href="theme.css">
+<script src="https://cdn.example.com/three.min.js"></script>
+<style>
+:root { --blaze-orange: #BF5700; }
+.grid { display: grid; transition: all 1s; }
+@keyframes pulse { from { color: rgb(0, 0, 0); } }
+@media (max-width: 600px) { .grid { display: block; } }
+</style>
+</head><body>
+<div class="hero-section" id="hero">
+  <h1>Cardinals readiness</h1>
+  <p>94.6% accuracy with <b>caching</b><br>and optimization</p>
+</div>
+<form><input type="email"><select name="team"></select></form>
+<a class="btn primary" href="https://api.blaze.com/v1" onclick="track()">  Open dashboard  </a>
+<button>Run</button>
+<canvas id="field" class="chart-canvas"></canvas>
+<script>
+const scene = new THREE.Scene();
+fetch('/api/teams').then(r => r.json()).then(data => data.filter(Boolean));
+window.addEventListener('resize', onResize);
+</script>
+<p>Unclosed paragraph
+</body></html>
+"""
+
+# Comments, declarations and multi-attribute lines, as the raw-content scans saw them
+RAW_SOURCE_DOCUMENT = """<!DOCTYPE html>
+<!-- built with React; data via api.stats.com feed.live -->
+<html><head>
+<meta name="description" content="Readiness board"><link rel="stylesheet" href="https://cdn.blaze.com/app.css">
+</head><body>
+<a href="https://api.blaze.com/v1/teams" class="btn" onclick="load()" data-source="https://api.backup.com/x">Teams</a>
+<div data-transform="true"
+     onmouseover = "hint()">Board</div>
+<![CDATA[ stream.scores ]]>
+<?xml-stylesheet aggregate?>
+<script>
+// Chart.js via database.readiness
+axios.get('/api/board');
+</script>
+</body></html>
+"""
+
+
+class TestHtmlExtractor(unittest.TestCase):
+    """Test every extractor from one traversal"""
+
+    def setUp(self):
+        self.data, self.timings = extract_document(DOCUMENT)
+
+    def test_metadata(self):
+        """Test title, meta tags, libraries and CSS variables"""
+        metadata = self.data['metadata']
+        self.assertEqual(metadata['title'], 'Blaze OS')
+        self.assertEqual(metadata['description'], 'Championship analytics')
+        self.assertEqual(metadata['keywords'], ['mlb', 'nfl'])
+        self.assertEqual(metadata['libraries'], ['theme.css', 'https://cdn.example.com/three.min.js'])
+        self.assertEqual(metadata['css_variables'], {'blaze-orange': '#BF5700'})
+
+    def test_components(self):
+        """Test sections, interactive elements and data displays"""
+        components = self.data['components']
+        self.assertEqual(components['sections'], [{
+            'classes': ['hero-section'], 'id': 'hero', 'child_count': 4,
+            'text_content_length': len('Cardinals readiness\n  94.6% accuracy with cachingand optimization')
+        }])
+        self.assertEqual([(e['tag'], e['text']) for e in components['interactive_elements']],
+                         [('button', 'Run'), ('input', ''), ('select', ''), ('a', 'Open dashboard')])
+        self.assertEqual([d['type'] for d in components['data_displays']], ['canvas', 'chart'])
+
+    def test_text_and_styles(self):
+        """Test text, style and script based extractors"""
+        self.assertEqual(self.data['analytics']['metrics_mentioned'], ['94.6% accuracy'])
+        self.assertEqual(self.data['analytics']['sports_entities'], ['cardinals'])
+        self.assertEqual(self.data['performance_metrics']['optimization_techniques'], ['caching', 'optimization'])
+        self.assertEqual(self.data['visualizations']['three_js_scenes'], ['Scene'])
+        self.assertEqual(self.data['visualizations']['color_schemes'], ['#BF5700', 'rgb(0, 0, 0)'])
+        self.assertEqual(self.data['styles']['layout_methods'], ['grid'])
+        self.assertEqual(self.data['styles']['animations'], ['pulse'])
+        self.assertEqual(len(self.data['styles']['responsive_design']), 1)
+
+    def test_source_patterns(self):
+        """Test the raw source feeds the javascript and data flow extractors"""
+        javascript = self.data['javascript']
+        self.assertEqual(javascript['apis_used'], ["fetch('/api/teams')"])
+        # Same matches as scanning the raw markup, meta content= included
+        self.assertEqual(javascript['event_handlers'],
+                         ['ontent=', 'ontent=', 'onclick=', "addEventListener('resize', onResize)"])
+        self.assertEqual(self.data['user_interactions']['input_methods'], ['email', 'select'])
+        self.assertEqual(self.data['user_interactions']['feedback_mechanisms'], ['button_interaction'])
+        self.assertEqual(self.data['data_flows']['data_sources'], ['api.blaze.com', 'cdn.example'])
+        self.assertEqual(self.data['data_flows']['processing_steps'], ['filter'])
+
+    def test_raw_source_matches_baseline(self):
+        """Test javascript and data flows match scans of the raw document, comments and markup included"""
+        for source in (RAW_SOURCE_DOCUMENT, (RAW_SOURCE_DOCUMENT[i:i + 5] for i in range(0, len(RAW_SOURCE_DOCUMENT), 5))):
+            data, _ = extract_document(source)
+            self.assertEqual(data['javascript'], {
+                'frameworks': ['React', 'Chart.js'],
+                'apis_used': ['axios.'],
+                'event_handlers': ['ontent=', 'onclick=', 'onmouseover ='],
+                'data_processing': []
+            })
+            self.assertEqual(data['data_flows'], {
+                'data_sources': [
+                    'api.stats.com',
+                    'api.blaze.com/v1/teams" class="btn" onclick="load()" data-source="https://api.backup.com',
+                    'database.readiness', 'stream.scores', 'feed.live', 'cdn.blaze'
+                ],
+                'processing_steps': ['transform', 'aggregate'],
+                'output_formats': []
+            })
+
+    def test_timings_and_chunks(self):
+        """Test per-extractor timings and chunked input give the same data"""
+        self.assertEqual(set(self.timings), set(self.data) | {'parse'})
+        self.assertTrue(all(seconds >= 0 for seconds in self.timings.values()))
+
+        chunked, _ = extract_document(DOCUMENT[i:i + 7] for i in range(0, len(DOCUMENT), 7))
+        self.assertEqual(chunked, self.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
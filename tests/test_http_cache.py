@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Conditional-request HTTP cache tests for Blaze Intelligence live fetchers
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.http_cache import HTTPCache
+from ingestion.http_transport import HTTPTransport
+from ingestion.live_fetchers import BaseLiveFetcher
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.headers.get('If-None-Match'))
+
+        if self.headers.get('If-None-Match') == server.etag:
+            self.send_response(304)
+            self.send_header('ETag', server.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = json.dumps({'teams': [{'id': 138, 'abbreviation': 'STL'}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('ETag', server.etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPCache(unittest.TestCase):
+    """Test TTL hits and ETag revalidation"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.etag = '"v1"'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/teams"
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.transport = HTTPTransport()
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _fetcher(self, ttls):
+        cache = HTTPCache(cache_dir=self.tmp.name, ttls=ttls)
+        return BaseLiveFetcher(rate_limit=0, transport=self.transport, cache=cache)
+
+    def test_fresh_entry_skips_request(self):
+        """Test a response within its TTL is served from disk"""
+        fetcher = self._fetcher({'teams': 3600})
+        first = fetcher._cached_request(self.url, 'teams')
+        second = self._fetcher({'teams': 3600})._cached_request(self.url, 'teams')
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.requests, [None])
+
+    def test_stale_entry_revalidates(self):
+        """Test an expired entry sends If-None-Match and reuses the body on 304"""
+        fetcher = self._fetcher({})
+        body = fetcher._cached_request(self.url, 'teams')
+        self.assertEqual(fetcher._cached_request(self.url, 'teams'), body)
+        self.assertEqual(self.server.requests, [None, '"v1"'])
+
+        self.server.etag = '"v2"'
+        fetcher._cached_request(self.url, 'teams')
+        meta = fetcher.cache.load(self.url)['meta']
+        self.assertEqual(meta['etag'], '"v2"')
+
+    def test_params_are_part_of_key(self):
+        """Test different query params are cached separately"""
+        cache = HTTPCache(cache_dir=self.tmp.name)
+        cache.store(self.url, {'season': '2024'}, 'a', etag='"x"')
+
+        self.assertEqual(cache.load(self.url, {'season': '2024'})['body'], 'a')
+        self.assertIsNone(cache.load(self.url, {'season': '2025'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
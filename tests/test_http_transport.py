@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+HTTP transport tests for Blaze Intelligence live fetchers
+"""
+
+import unittest
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.http_transport import HTTPTransport
+from ingestion.live_fetchers import BaseLiveFetcher
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.clients.add(self.client_address)
+        time.sleep(0.05)
+        with server.lock:
+            server.active -= 1
+
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPTransport(unittest.TestCase):
+    """Test the pooled, per-host limited transport"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.active = self.server.peak = 0
+        self.server.clients = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.transport = HTTPTransport(host_limits={'127.0.0.1': 3})
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_overlap_within_host_limit(self):
+        """Test concurrent requests overlap but never exceed the host limit"""
+        paths = [f"/player/{i}" for i in range(12)]
+        results = self.transport.map(lambda path: self.transport.get(self.base_url + path).json(), paths, 8)
+
+        self.assertEqual([result['path'] for result in results], paths)
+        self.assertGreater(self.server.peak, 1)
+        self.assertLessEqual(self.server.peak, 3)
+
+    def test_connections_are_reused(self):
+        """Test sequential requests share one keep-alive connection"""
+        for i in range(5):
+            self.transport.get(f"{self.base_url}/teams")
+        self.assertEqual(len(self.server.clients), 1)
+
+    def test_fetchers_use_transport(self):
+        """Test fetchers route requests through the given transport"""
+        fetcher = BaseLiveFetcher(rate_limit=0, transport=self.transport)
+        results = fetcher.fetch_concurrently(
+            lambda i: fetcher._retry_request(f"{self.base_url}/stats/{i}").json(), range(4), self.base_url)
+
+        self.assertEqual([result['path'] for result in results], [f"/stats/{i}" for i in range(4)])
+        self.assertLessEqual(self.server.peak, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
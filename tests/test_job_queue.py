@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Analysis job queue tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import time
+import threading
+from datetime import datetime
+from unittest import mock
+
+# Add automation scripts to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '03_AUTOMATION', 'python'))
+
+from job_queue import JobQueue, QueueFull
+
+
+def _stages(job):
+    return [event['stage'] for event in job.events if event['type'] == 'stage']
+
+
+def _wait_for_stage(job, stage):
+    for event in job.follow(0, timeout=5):
+        if event is not None and event['stage'] == stage:
+            return
+
+
+class TestJobQueue(unittest.TestCase):
+    """Test job lifecycle, progress, cancellation and bounds"""
+
+    def setUp(self):
+        self.queue = JobQueue(max_workers=1, max_pending=2, retained_jobs=3)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.queue.shutdown()
+
+    def _blocking(self, job):
+        job.progress('extract')
+        self.release.wait(5)
+        job.progress('detect')
+        return {'source': job.params['source']}
+
+    def test_job_runs_with_progress(self):
+        """Test a job reports its stages and result, and its event log can be followed"""
+        self.release.set()
+        job = self.queue.submit(self._blocking, source='a')
+        self.queue.wait(job.job_id, 5)
+
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.result, {'source': 'a'})
+        self.assertEqual(_stages(job), ['extract', 'detect'])
+        self.assertEqual([event['status'] for event in job.follow(0) if event['type'] == 'status'],
+                         ['queued', 'running', 'completed'])
+        self.assertEqual([event['seq'] for event in job.follow(2)], [2, 3, 4])
+
+    def test_followers_always_see_final_status(self):
+        """Test a follower polling while the job finishes still gets the terminal status event"""
+        class SlowClock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                time.sleep(0.05)  # Widen any gap between a status change and its event
+                return datetime.now(tz)
+
+        job = self.queue.submit(self._blocking, source='a')
+        _wait_for_stage(job, 'extract')
+        with mock.patch('job_queue.datetime', SlowClock):
+            self.release.set()
+            events = [event for event in job.follow(0, timeout=0.01) if event is not None]
+
+        self.assertEqual((events[-1]['type'], events[-1]['status']), ('status', 'completed'))
+
+    def test_cancel_running_and_queued(self):
+        """Test running jobs stop at their next stage and queued jobs never start"""
+        running = self.queue.submit(self._blocking, source='a')
+        _wait_for_stage(running, 'extract')
+        queued = self.queue.submit(self._blocking, source='b')
+
+        self.queue.cancel(queued.job_id)
+        self.queue.cancel(running.job_id)
+        self.release.set()
+        self.queue.wait(running.job_id, 5)
+        self.queue.wait(queued.job_id, 5)
+
+        self.assertEqual(running.status, 'cancelled')
+        self.assertEqual(running.stage, 'extract')
+        self.assertEqual(queued.status, 'cancelled')
+        self.assertEqual(_stages(queued), [])
+        self.assertIsNone(self.queue.cancel('missing'))
+
+    def test_failure_and_bounds(self):
+        """Test failures are recorded, waiting jobs are bounded and finished jobs pruned"""
+        def fail(job):
+            raise ValueError('bad document')
+
+        self.release.set()
+        failed = self.queue.submit(fail)
+        self.queue.wait(failed.job_id, 5)
+        self.assertEqual((failed.status, failed.error), ('failed', 'bad document'))
+
+        self.release.clear()
+        jobs = [self.queue.submit(self._blocking, source='0')]
+        _wait_for_stage(jobs[0], 'extract')
+        jobs += [self.queue.submit(self._blocking, source=str(i)) for i in range(1, 3)]
+        with self.assertRaises(QueueFull):
+            self.queue.submit(self._blocking, source='overflow')
+        self.release.set()
+        for job in jobs:
+            self.queue.wait(job.job_id, 5)
+
+        self.assertEqual(self.queue.counts()['completed'], 3)
+        self.assertIsNone(self.queue.get(failed.job_id))  # Oldest finished job pruned
+
+
+if __name__ == '__main__':
+    unittest.main()
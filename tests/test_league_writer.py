@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+League output writer tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.league_writer import write_league_file
+
+
+class TestLeagueWriter(unittest.TestCase):
+    """Test streaming, atomic league file writes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'leagues', 'mlb.json')
+        self.players = [
+            {'player_id': 'MLB-1', 'name': 'José Test', 'hav_f': {'champion_readiness': 71.5}, 'bio': {}},
+            {'player_id': 'MLB-2', 'name': 'Second', 'hav_f': {'champion_readiness': 100}, 'stats': []}
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def expected(self, players):
+        return {'league': 'MLB', 'generated_at': '2025-01-01T00:00:00Z', 'players': players}
+
+    def test_indented_matches_json_dump(self):
+        """Test indented output is identical to json.dump(indent=2)"""
+        for players in [self.players, []]:
+            count = write_league_file(self.path, 'MLB', iter(players), generated_at='2025-01-01T00:00:00Z')
+
+            self.assertEqual(count, len(players))
+            with open(self.path) as f:
+                self.assertEqual(f.read(), json.dumps(self.expected(players), indent=2))
+
+    def test_compact_mode(self):
+        """Test compact output parses to the same document without indentation"""
+        write_league_file(self.path, 'MLB', (p for p in self.players),
+                          generated_at='2025-01-01T00:00:00Z', compact=True)
+
+        with open(self.path) as f:
+            content = f.read()
+        self.assertNotIn('\n', content)
+        self.assertEqual(json.loads(content), self.expected(self.players))
+
+    def test_failed_write_keeps_previous_file(self):
+        """Test a failing generator leaves the old file intact and no temp files"""
+        write_league_file(self.path, 'MLB', self.players, generated_at='2025-01-01T00:00:00Z')
+
+        def failing():
+            yield self.players[0]
+            raise RuntimeError('source went away')
+
+        with self.assertRaises(RuntimeError):
+            write_league_file(self.path, 'MLB', failing())
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), self.expected(self.players))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['mlb.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+NBA agent tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.http_transport import HTTPTransport
+from ingestion.nba_agent import NBADataAgent
+from ingestion.rate_limiter import HostRateLimiter
+
+
+class _Response:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _FakeTransport(HTTPTransport):
+    """Answers NBA Stats endpoints in memory, tracking overlapping calls"""
+
+    def __init__(self, failing_players=()):
+        super().__init__(host_limits={'stats.nba.com': 2})
+        self.failing_players = set(failing_players)
+        self.lock = threading.Lock()
+        self.active = self.peak = self.calls = 0
+
+    def get(self, url, headers=None, params=None, timeout=30):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+
+        if url.endswith('/commonteamroster'):
+            team = params['TeamID']
+            if team == '1610612747':  # LAL roster unavailable
+                return _Response(500)
+            rows = [[f"{team[-2:]}{n}", f"Player {team[-2:]}{n}", 'G', str(n)] for n in range(3)]
+            return _Response(200, {'resultSets': [{'headers': ['PLAYER_ID', 'PLAYER', 'POSITION', 'NUM'], 'rowSet': rows}]})
+
+        if params['PlayerID'] in self.failing_players:
+            return _Response(500)
+        return _Response(200, {'resultSets': [{'headers': ['GP', 'PTS', 'MIN'], 'rowSet': [[60, 21.5, 33.0]]}]})
+
+
+class TestNBAAgent(unittest.TestCase):
+    """Test multi-team concurrent processing"""
+
+    def setUp(self):
+        self.transport = _FakeTransport(failing_players={'631'})
+        self.agent = NBADataAgent(transport=self.transport, limiter=HostRateLimiter(host_limits={}))
+
+    def test_multiple_teams_concurrently(self):
+        """Test rosters and stats for several teams overlap within the host limit"""
+        players = self.agent.process_teams(['MEM', 'BOS', 'DEN'])
+
+        self.assertEqual(len(players), 9)
+        self.assertEqual({p['team_id'] for p in players}, {'nba_mem', 'nba_bos', 'nba_den'})
+        self.assertEqual(self.transport.calls, 12)
+        self.assertEqual(self.transport.peak, 2)
+
+    def test_fallbacks(self):
+        """Test failed stats use defaults and only the Grizzlies have a fallback roster"""
+        players = {p['player_id']: p for p in self.agent.process_teams(['MEM', 'LAL'])}
+
+        self.assertEqual(players['nba_mem_631']['stats']['games_played'], 0)
+        self.assertEqual(players['nba_mem_630']['stats']['games_played'], 60)
+        self.assertFalse(any(p['team_id'] == 'nba_lal' for p in players.values()))
+
+    def test_orchestrator_team_param(self):
+        """Test the orchestrator's team param selects the team"""
+        self.agent.save_data = lambda players: 'nba.json'
+        self.assertTrue(self.agent.run({'team': 'BOS'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Pattern store tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import hashlib
+import sqlite3
+
+# Add automation scripts to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '03_AUTOMATION', 'python'))
+
+from pattern_store import PatternStore, content_id, content_digest, file_digest
+
+
+def _pattern(pattern_id, pattern_type, description, insights=()):
+    return {'pattern_id': pattern_id, 'pattern_type': pattern_type, 'confidence_score': 0.8,
+            'description': description, 'data_sources': [], 'metrics': {}, 'insights': list(insights),
+            'recommendations': [], 'timestamp': '2025-01-01T00:00:00'}
+
+
+def _insight(insight_id, category, description, recommendations=()):
+    return {'insight_id': insight_id, 'category': category, 'priority': 'high', 'impact_score': 8.0,
+            'confidence': 0.9, 'description': description, 'supporting_patterns': [],
+            'actionable_recommendations': list(recommendations), 'business_value': 'High'}
+
+
+class TestPatternStore(unittest.TestCase):
+    """Test persistence and indexed search"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'patterns.db')
+        self.store = PatternStore(self.db_path)
+        self.store.upsert_patterns([
+            _pattern('p1', 'temporal', 'Load time spikes after deploys', ['Performance regresses on Fridays']),
+            _pattern('p2', 'semantic', 'Readiness vocabulary clusters'),
+            _pattern('p3', 'anomaly', 'Performance outlier in the chart module')
+        ])
+        self.store.upsert_insights([
+            _insight('i1', 'performance', 'Bundle size drives load time', ['Split the charting bundle'])
+        ])
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_search_matches_prefixes_and_fields(self):
+        """Test words match as prefixes across type, description and insights"""
+        results = self.store.search('perf')
+        self.assertEqual({p['pattern_id'] for p in results['patterns']}, {'p1', 'p3'})
+        self.assertEqual([i['insight_id'] for i in results['insights']], ['i1'])
+        self.assertEqual(results['total_matches'], 3)
+
+        self.assertEqual([p['pattern_id'] for p in self.store.search('TEMPORAL')['patterns']], ['p1'])
+        self.assertEqual(self.store.search('charting split')['total_matches'], 1)
+        self.assertEqual(self.store.search('"; DROP')['total_matches'], 0)
+
+    def test_pagination(self):
+        """Test pages are disjoint and report whether more remain"""
+        first = self.store.search('load perf', limit=1)
+        second = self.store.search('load perf', limit=1, offset=1)
+
+        self.assertEqual(first['total_matches'], 2)
+        self.assertTrue(first['has_more'])
+        self.assertFalse(second['has_more'])
+        ids = [item.get('pattern_id') or item.get('insight_id') for item in
+               first['patterns'] + first['insights'] + second['patterns'] + second['insights']]
+        self.assertEqual(sorted(ids), ['i1', 'p1'])
+
+    def test_index_follows_updates(self):
+        """Test replacing a pattern replaces its index entry"""
+        self.store.upsert_patterns([_pattern('p2', 'cluster', 'Dense navigation usage')])
+
+        self.assertEqual(self.store.search('semantic')['total_matches'], 0)
+        self.assertEqual([p['pattern_id'] for p in self.store.search('navigation')['patterns']], ['p2'])
+
+    def test_old_index_is_rebuilt(self):
+        """Test a database indexed by kind/item_id columns is re-indexed by rowid on open"""
+        self.store.close()
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("DROP TABLE search_index")
+            conn.execute("CREATE VIRTUAL TABLE search_index USING fts5(kind UNINDEXED, item_id UNINDEXED, title, body)")
+            conn.execute("INSERT INTO search_index VALUES ('pattern', 'p2', 'semantic', 'stale entry')")
+            conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        self.store = PatternStore(self.db_path)
+        self.assertEqual(self.store.search('stale')['total_matches'], 0)
+        self.assertEqual(self.store.search('perf')['total_matches'], 3)
+        self.store.upsert_patterns([_pattern('p2', 'cluster', 'Dense navigation usage')])
+        self.assertEqual(self.store.search('semantic')['total_matches'], 0)
+
+    def test_persists_across_restarts(self):
+        """Test patterns, insights and history survive reopening the database"""
+        self.store.append_history({'status': 'completed', 'run': 1})
+        self.store.append_history({'status': 'completed', 'run': 2})
+        self.store.close()
+
+        self.store = PatternStore(self.db_path)
+        self.assertEqual(list(self.store.patterns()), ['p1', 'p2', 'p3'])
+        self.assertEqual(self.store.insight_categories(), {'performance': 1})
+        self.assertEqual([entry['run'] for entry in self.store.history(1)], [2])
+        self.assertEqual(self.store.search('readiness')['patterns'][0]['pattern_id'], 'p2')
+
+    def test_stage_cache(self):
+        """Test stage output is returned only for the input it was computed from"""
+        self.assertIsNone(self.store.get_stage('detect', 'abc'))
+
+        self.store.put_stage('detect', 'abc', [{'pattern_id': 'p1'}])
+        self.assertEqual(self.store.get_stage('detect', 'abc'), [{'pattern_id': 'p1'}])
+        self.assertIsNone(self.store.get_stage('insights', 'abc'))
+
+        self.store.put_stage('detect', 'def', [])
+        self.assertIsNone(self.store.get_stage('detect', 'abc'))  # One input kept per stage
+        self.assertEqual(self.store.get_stage('detect', 'def'), [])
+
+
+class TestContentIds(unittest.TestCase):
+    """Test content-derived hashes and IDs"""
+
+    def test_content_id_is_stable(self):
+        """Test equal content gets equal IDs regardless of key order"""
+        self.assertEqual(content_id('cluster', {'a': 1, 'b': 2}), content_id('cluster', {'b': 2, 'a': 1}))
+        self.assertNotEqual(content_id('cluster', {'a': 1}), content_id('cluster', {'a': 2}))
+        self.assertTrue(content_id('cluster', [1]).startswith('cluster_'))
+        self.assertEqual(content_digest([1, 'x']), content_digest([1, 'x']))
+
+    def test_file_digest(self):
+        """Test file hashing in chunks matches hashing the content"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'os.htm')
+            with open(path, 'wb') as f:
+                f.write(b'<html>' * 1000)
+            self.assertEqual(file_digest(path, chunk_size=7), file_digest(path))
+            self.assertEqual(file_digest(path), hashlib.sha256(b'<html>' * 1000).hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Agent pipeline tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.mlb_agent import MLBAgent
+from ingestion.pipeline import PIPELINE_STAGES
+
+
+class TestAgentPipeline(unittest.TestCase):
+    """Test the streaming fetch -> normalize -> score -> write pipeline"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.agent = MLBAgent()
+        self.agent.output_path = os.path.join(self.tmp.name, 'mlb.json')
+        self.raw = {'players': [
+            {'id': f'MLB-T-{i}', 'name': f'Player {i}', 'stats': {'war': i / 2, 'wpa': 0.1}, 'dob': '1997-05-01'}
+            for i in range(10)
+        ]}
+        self.agent.fetch_raw = lambda params, live=False: self.raw
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalize_iter_matches_list(self):
+        """Test the generator and list normalizers agree"""
+        streamed = list(self.agent.normalize_iter(self.raw))
+        listed = self.agent.normalize(self.raw)
+
+        self.assertEqual(len(streamed), 10)
+        for a, b in zip(streamed, listed):
+            a['meta'].pop('updated_at')
+            b['meta'].pop('updated_at')
+        self.assertEqual(streamed, listed)
+
+    def test_chunked_scoring(self):
+        """Test chunked scoring stamps every player like one compute_all call"""
+        self.agent.counters = {'players': 0, 'rescored': 0}
+        scored = list(self.agent.score_iter(self.agent.normalize_iter(self.raw), chunk_size=3))
+
+        self.assertEqual(self.agent.counters['rescored'], 10)
+        self.assertTrue(all(player['hav_f'].get('input_fingerprint') for player in scored))
+
+    def test_run_writes_file_and_timings(self):
+        """Test run streams the league file and records stage timings"""
+        self.assertTrue(self.agent.run({}))
+        self.assertTrue(self.agent.run({}))
+
+        with open(self.agent.output_path) as f:
+            data = json.load(f)
+        self.assertEqual(data['league'], 'MLB')
+        self.assertEqual(len(data['players']), 10)
+        self.assertEqual(self.agent.counters, {'players': 10, 'rescored': 0})
+
+        timings = self.agent.stage_timings()
+        self.assertEqual(tuple(timings), PIPELINE_STAGES)
+        self.assertTrue(all(seconds >= 0 for seconds in timings.values()))
+
+    def test_process_prefetched_raw(self):
+        """Test the CPU-bound stages run without fetching"""
+        self.agent.fetch_raw = None
+        self.assertTrue(self.agent.process(self.raw, {'compact': True}))
+
+        with open(self.agent.output_path) as f:
+            self.assertEqual(len(json.load(f)['players']), 10)
+        self.assertEqual(self.agent.timings['fetch'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Rate limiter tests for Blaze Intelligence live fetchers
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.rate_limiter import TokenBucket, HostRateLimiter, FileBucketStore
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test token bucket burst and refill behavior"""
+
+    def test_burst_then_rate_limited(self):
+        """Test a full bucket allows a burst and then spaces requests by the rate"""
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.02)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.02)
+
+    def test_unlimited(self):
+        """Test a zero rate never waits"""
+        bucket = TokenBucket(rate=0)
+        self.assertEqual(sum(bucket.acquire() for _ in range(100)), 0.0)
+
+    def test_async_acquire(self):
+        """Test async callers wait for the bucket without blocking each other"""
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        async def run():
+            return await asyncio.gather(*(bucket.acquire_async() for _ in range(4)))
+
+        start = time.perf_counter()
+        waits = asyncio.run(run())
+        self.assertEqual(waits[0], 0.0)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.13)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    """Test per-host buckets and cross-process sharing"""
+
+    def test_buckets_per_host(self):
+        """Test configured hosts use their own limits and others the caller's"""
+        limiter = HostRateLimiter(host_limits={'strict.example': (1, 1)})
+
+        self.assertIs(limiter.bucket('strict.example'), limiter.bucket('strict.example'))
+        self.assertEqual(limiter.bucket('strict.example').rate, 1)
+        self.assertEqual(limiter.bucket('other.example', rate=5, burst=2).capacity, 2)
+
+        limiter.acquire('strict.example')
+        self.assertEqual(limiter.acquire('other.example'), 0.0)
+        self.assertGreater(limiter.bucket('strict.example').reserve(), 0.5)
+
+    def test_file_store_shared(self):
+        """Test limiters in separate processes share buckets through the store file"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'buckets.json')
+            first = HostRateLimiter(host_limits={}, store=FileBucketStore(path))
+            second = HostRateLimiter(host_limits={}, store=FileBucketStore(path))
+
+            self.assertEqual(first.bucket('api.example', rate=1, burst=2).reserve(), 0.0)
+            self.assertEqual(second.bucket('api.example', rate=1, burst=2).reserve(), 0.0)
+            self.assertGreater(first.bucket('api.example').reserve(), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Readiness board tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.readiness import ReadinessEngine, generate_readiness_report, compute_team_readiness
+
+
+def _player(player_id, team_id, readiness):
+    return {'player_id': player_id, 'name': player_id, 'team_id': team_id, 'position': 'P',
+            'hav_f': {'champion_readiness': readiness}}
+
+
+class TestReadinessEngine(unittest.TestCase):
+    """Test incremental readiness board updates"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.leagues_dir = os.path.join(self.tmp.name, 'leagues')
+        self.state_path = os.path.join(self.tmp.name, 'state.json')
+        os.makedirs(self.leagues_dir)
+        self.write('mlb', [_player('a', 'MLB-STL', 85), _player('b', 'MLB-STL', 62), _player('c', 'MLB-CHC', None)])
+        self.write('nfl', [_player('d', 'NFL-TEN', 40)])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, league, players):
+        with open(os.path.join(self.leagues_dir, f'{league}.json'), 'w') as f:
+            json.dump({'league': league.upper(), 'players': players}, f)
+
+    def engine(self):
+        return ReadinessEngine(['MLB-STL', 'NFL-TEN'], leagues_dir=self.leagues_dir, state_path=self.state_path)
+
+    def test_report_from_running_sums(self):
+        """Test team means and focus status counts come from the summaries"""
+        engine = self.engine()
+        engine.refresh()
+        report = engine.report()
+
+        teams = {team['team_id']: team for team in report['teams']}
+        self.assertEqual(teams['MLB-STL']['avg_readiness'], 73.5)
+        self.assertEqual(teams['MLB-CHC']['avg_readiness'], 0.0)
+        self.assertEqual(report['summary']['total_players'], 4)
+        self.assertEqual((report['summary']['ready_players'], report['summary']['monitor_players'],
+                          report['summary']['caution_players']), (1, 1, 1))
+        self.assertEqual([p['player_id'] for p in report['players']], ['a', 'b', 'd'])
+
+    def test_averages_match_mean(self):
+        """Test cached sums round exactly like the mean of the scores, also after a state reload"""
+        rng = random.Random(7)
+        rosters = {f'MLB-T{i}': [round(rng.uniform(0, 100), 1) for _ in range(rng.randint(1, 6))] for i in range(2000)}
+        self.write('mlb', [_player(f'{team_id}-{n}', team_id, score)
+                           for team_id, scores in rosters.items() for n, score in enumerate(scores)])
+        engine = self.engine()
+        engine.refresh()
+        engine.save()
+
+        for report in (engine.report(), self.engine().report()):
+            teams = {team['team_id']: team['avg_readiness'] for team in report['teams']}
+            for team_id, scores in rosters.items():
+                expected = compute_team_readiness([{'hav_f': {'champion_readiness': score}} for score in scores])
+                self.assertEqual(teams[team_id], expected, team_id)
+
+    def test_only_changed_league_recomputed(self):
+        """Test a cached state reuses unchanged leagues"""
+        engine = self.engine()
+        self.assertEqual(sorted(engine.refresh()), ['mlb', 'nfl'])
+        engine.save()
+
+        self.write('nfl', [_player('d', 'NFL-TEN', 90.5)])
+        engine = self.engine()
+        self.assertEqual(engine.refresh(), ['nfl'])
+        self.assertEqual(engine.report()['summary']['ready_players'], 2)
+
+        os.remove(os.path.join(self.leagues_dir, 'mlb.json'))
+        self.assertEqual(engine.refresh(), ['mlb'])
+        self.assertEqual(engine.report()['summary']['total_teams'], 1)
+
+    def test_focus_change_invalidates_state(self):
+        """Test cached player rows are not reused for other focus teams"""
+        engine = self.engine()
+        engine.refresh()
+        engine.save()
+
+        other = ReadinessEngine(['MLB-CHC'], leagues_dir=self.leagues_dir, state_path=self.state_path)
+        self.assertEqual(sorted(other.refresh()), ['mlb', 'nfl'])
+
+    def test_top_k(self):
+        """Test --top keeps the top teams and players while totals cover everything"""
+        self.write('mlb', [_player(f'p{i}', f'MLB-T{i % 4}', 50 + i) for i in range(12)]
+                   + [_player(f's{i}', 'MLB-STL', i * 10) for i in range(6)])
+        engine = self.engine()
+        engine.refresh()
+        report = engine.report(top=2)
+
+        self.assertEqual([team['team_id'] for team in report['teams']], ['MLB-T3', 'MLB-T2'])
+        self.assertEqual(report['summary']['total_teams'], 6)
+        self.assertEqual(report['summary']['total_players'], 19)
+        self.assertEqual([p['player_id'] for p in report['players_by_team']['MLB-STL']], ['s5', 's4'])
+        self.assertEqual([p['player_id'] for p in report['players']], ['s5', 's4'])
+        self.assertEqual(report['teams'], engine.report()['teams'][:2])
+
+    def test_focus_team_in_several_leagues(self):
+        """Test a focus team's players are merged across league files before top-K"""
+        self.write('ncaa', [_player('n1', 'NCAA-TEX', 70), _player('n2', 'NCAA-TEX', 95)])
+        self.write('nil', [_player('x1', 'NCAA-TEX', 88)])
+        engine = ReadinessEngine(['NCAA-TEX'], leagues_dir=self.leagues_dir, state_path=self.state_path)
+        engine.refresh()
+
+        report = engine.report()
+        self.assertEqual([p['player_id'] for p in report['players_by_team']['NCAA-TEX']], ['n2', 'x1', 'n1'])
+        self.assertEqual([p['player_id'] for p in report['players']], ['n2', 'x1', 'n1'])
+        self.assertEqual([p['player_id'] for p in engine.report(top=2)['players_by_team']['NCAA-TEX']], ['n2', 'x1'])
+
+    def test_generate_readiness_report(self):
+        """Test the one-shot report matches the engine"""
+        with open(os.path.join(self.leagues_dir, 'mlb.json')) as f:
+            report = generate_readiness_report({'mlb': json.load(f)}, ['MLB-STL'])
+
+        self.assertEqual(report['summary']['total_teams'], 2)
+        self.assertEqual(report['teams'][0]['team_id'], 'MLB-STL')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Readiness snapshot tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.readiness import generate_readiness_report
+from ingestion.readiness_snapshot import write_snapshot, get_readiness_snapshot, load_readiness
+
+
+def _player(player_id, team_id, readiness, nil=50):
+    return {'player_id': player_id, 'name': f"Player {player_id}", 'team_id': team_id, 'position': 'P',
+            'hav_f': {'champion_readiness': readiness, 'cognitive_leverage': 60, 'nil_trust_score': nil}}
+
+
+class TestReadinessSnapshot(unittest.TestCase):
+    """Test binary snapshot round trip and queries"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'readiness.snapshot')
+        self.report = generate_readiness_report({
+            'mlb': {'players': [_player('a', 'MLB-STL', 85), _player('b', 'MLB-STL', 62),
+                                _player('c', 'MLB-CHC', 30), _player('é', 'MLB-STL', None, nil=120)]},
+            'nfl': {'players': [_player('d', 'NFL-TEN', 90)]}
+        }, ['MLB-STL', 'NFL-TEN'])
+        write_snapshot(self.path, self.report)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test teams, players and summary read back as in the JSON report"""
+        snapshot = get_readiness_snapshot(self.path)
+
+        self.assertEqual(snapshot.top_teams(), self.report['teams'])
+        self.assertEqual(snapshot.top_players(), self.report['players'])
+        self.assertEqual(snapshot.summary, self.report['summary'])
+        self.assertIsInstance(snapshot.players, np.ndarray)
+
+    def test_queries(self):
+        """Test lookups by team, league, status and top-N"""
+        snapshot = get_readiness_snapshot(self.path)
+
+        self.assertEqual(snapshot.team('MLB-CHC')['avg_readiness'], 30.0)
+        self.assertIsNone(snapshot.team('MLB-XXX'))
+        self.assertEqual([t['team_id'] for t in snapshot.top_teams(league='mlb')], ['MLB-STL', 'MLB-CHC'])
+        self.assertEqual([p['player_id'] for p in snapshot.top_players(1, team_id='MLB-STL')], ['a'])
+        self.assertEqual([p['player_id'] for p in snapshot.top_players(status='ready')], ['d', 'a'])
+        self.assertEqual(snapshot.top_players(team_id='MLB-XXX'), [])
+        self.assertEqual(snapshot.status_counts('MLB-STL'), {'ready': 1, 'monitor': 1, 'caution': 0, 'unknown': 1})
+        self.assertEqual(int((snapshot.players['nil_trust_score'] > 100).sum()), 1)  # Vectorized bounds check
+
+    def test_cached_until_replaced(self):
+        """Test the shared snapshot is reopened only when the file is rewritten"""
+        first = get_readiness_snapshot(self.path)
+        self.assertIs(get_readiness_snapshot(self.path), first)
+
+        write_snapshot(self.path, dict(self.report, teams=self.report['teams'][:1]))
+        self.assertEqual(len(get_readiness_snapshot(self.path).teams), 1)
+
+    def test_json_fallback(self):
+        """Test load_readiness builds a snapshot from readiness.json when none exists"""
+        json_path = os.path.join(self.tmp.name, 'readiness.json')
+        with open(json_path, 'w') as f:
+            json.dump(self.report, f)
+
+        snapshot = load_readiness(os.path.join(self.tmp.name, 'missing.snapshot'), json_path)
+        self.assertEqual(snapshot.top_players(), self.report['players'])
+
+
+    def test_newer_json_wins(self):
+        """Test load_readiness rebuilds from readiness.json when it was written after the snapshot"""
+        json_path = os.path.join(self.tmp.name, 'readiness.json')
+        with open(json_path, 'w') as f:
+            json.dump(dict(self.report, teams=self.report['teams'][:1]), f)
+        snapshot_mtime = os.stat(self.path).st_mtime_ns
+
+        os.utime(json_path, ns=(snapshot_mtime - 10**9, snapshot_mtime - 10**9))
+        self.assertEqual(len(load_readiness(self.path, json_path).teams), len(self.report['teams']))
+
+        os.utime(json_path, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+        self.assertEqual(load_readiness(self.path, json_path).top_teams(), self.report['teams'][:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
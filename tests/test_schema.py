@@ -7,7 +7,7 @@ import json
 import os
 import sys
 import unittest
-from typing import Dict, Any
+from typing import Dict, List, Any
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,6 +18,8 @@ except ImportError:
     print("jsonschema not available, using basic validation")
     jsonschema = None
 
+from ingestion.schema_validator import get_player_validator, format_error
+
 
 class TestSchemaValidation(unittest.TestCase):
     """Test that all generated players conform to schema"""
@@ -55,14 +57,11 @@ class TestSchemaValidation(unittest.TestCase):
             if 'maximum' in hav_f_props[metric]:
                 self.assertEqual(hav_f_props[metric]['maximum'], 100)
     
-    def validate_player(self, player: Dict[str, Any]) -> bool:
-        """Validate a single player against schema"""
+    def player_errors(self, player: Dict[str, Any]) -> List[str]:
+        """All schema errors for a single player"""
         if jsonschema is None:
             # Basic validation without jsonschema
-            required_fields = self.schema['required']
-            for field in required_fields:
-                if field not in player:
-                    return False
+            errors = [f"missing required field '{field}'" for field in self.schema['required'] if field not in player]
             
             # Check HAV-F bounds
             if 'hav_f' in player and player['hav_f']:
@@ -70,14 +69,15 @@ class TestSchemaValidation(unittest.TestCase):
                     value = player['hav_f'].get(metric)
                     if value is not None:
                         if not (0 <= value <= 100):
-                            return False
-            return True
+                            errors.append(f"hav_f.{metric} out of bounds: {value}")
+            return errors
         else:
-            try:
-                jsonschema.validate(player, self.schema)
-                return True
-            except jsonschema.ValidationError:
-                return False
+            # Precompiled validator, cached per schema file
+            return [format_error(error) for error in get_player_validator(self.schema_path).errors(player)]
+    
+    def validate_player(self, player: Dict[str, Any]) -> bool:
+        """Validate a single player against schema"""
+        return not self.player_errors(player)
     
     def test_league_files_exist(self):
         """Test that league files can be found"""
@@ -109,9 +109,12 @@ class TestSchemaValidation(unittest.TestCase):
                 
                 for i, player in enumerate(players):
                     total_players += 1
-                    if not self.validate_player(player):
+                    errors = self.player_errors(player)
+                    if errors:
                         invalid_players += 1
                         print(f"Invalid player in {filename}: {player.get('name', f'index_{i}')}")
+                        for error in errors:
+                            print(f"  {error}")
                         
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 self.fail(f"Could not load {filename}: {e}")
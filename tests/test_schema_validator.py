@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Precompiled schema validator tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.schema_validator import get_player_validator, jsonschema
+
+
+class TestSchemaValidator(unittest.TestCase):
+    """Test cached, streaming, all-errors validation"""
+
+    def setUp(self):
+        self.valid = {'player_id': 'MLB-STL-0001', 'name': 'Valid', 'sport': 'MLB',
+                      'team_id': 'MLB-STL', 'position': 'SS', 'hav_f': {'champion_readiness': 70}}
+        self.invalid = {'player_id': 'MLB-STL-0002', 'name': 7, 'sport': 'MLB',
+                        'hav_f': {'champion_readiness': 140}}
+
+    def test_validator_is_cached(self):
+        """Test the validator is built once per schema file"""
+        self.assertIs(get_player_validator(), get_player_validator())
+
+    def test_all_errors_with_player_ids(self):
+        """Test every error is reported with the player's ID"""
+        if jsonschema is None:
+            self.skipTest("jsonschema not available")
+
+        errors = get_player_validator().validate_all([self.valid, self.invalid])
+        self.assertEqual({error['player_id'] for error in errors}, {'MLB-STL-0002'})
+        self.assertEqual({error['path'] for error in errors}, {'', 'name', 'hav_f.champion_readiness'})
+        self.assertEqual(len(errors), 4)  # team_id, position, name, champion_readiness
+
+    def test_streaming_passes_players_through(self):
+        """Test validate_iter yields players unchanged while collecting errors"""
+        errors = []
+        players = list(get_player_validator().validate_iter(iter([self.valid, self.invalid]), errors))
+
+        self.assertEqual(players, [self.valid, self.invalid])
+        self.assertTrue(errors)
+
+    def test_definition_and_rebuild(self):
+        """Test validating against a schema definition, rebuilt when the file changes"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'unified.json')
+            schema = {'definitions': {'player': {'type': 'object', 'required': ['player_id']}}}
+            with open(path, 'w') as f:
+                json.dump(schema, f)
+
+            validator = get_player_validator(path, definition='player')
+            self.assertEqual(validator.errors({'player_id': 'X'}), [])
+            self.assertEqual(len(validator.errors({})), 1)
+
+            schema['definitions']['player']['required'].append('name')
+            with open(path, 'w') as f:
+                json.dump(schema, f)
+            os.utime(path, ns=(0, 1))
+
+            rebuilt = get_player_validator(path, definition='player')
+            self.assertIsNot(rebuilt, validator)
+            self.assertEqual(len(rebuilt.errors({})), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
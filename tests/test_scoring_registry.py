@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Scoring registry tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.scoring_registry import ScoringRegistry, compile_formula, formula_fields, registry
+
+try:
+    import numpy as np
+    from ingestion.scoring_registry import compile_kernel
+except ImportError:
+    np = None
+
+
+class TestScoringRegistry(unittest.TestCase):
+    """Test per-sport scoring formulas"""
+
+    def test_compile_formula(self):
+        """Test terms, offsets, clamps and rounding"""
+        formula = compile_formula({
+            "terms": [10, ("a", 2), ("b", 100, 0.5, 10)],
+            "clamp": (0, 50), "round": 1
+        })
+        self.assertEqual(formula({"a": 3, "b": 0.75}), 18.5)
+        self.assertEqual(formula({"a": 100}), 50)
+        self.assertEqual(formula({}), 5.0)
+
+    def test_guards_and_lookups(self):
+        """Test conditional terms and categorical lookups"""
+        formula = compile_formula({"terms": [
+            {"terms": [("stars", 10)], "when_present": "stars"},
+            {"lookup": "position", "table": {"QB": 20}, "default": 0}
+        ]})
+        self.assertEqual(formula({"stars": None, "position": "QB"}), 20)
+        self.assertEqual(formula({"stars": 3, "position": "WR"}), 30)
+
+        availability = compile_formula({"terms": [("games", 40, 0, 82)], "clamp": (None, 40),
+                                        "when_positive": "games", "otherwise": 20})
+        self.assertEqual(availability({"games": 0}), 20)
+        self.assertEqual(availability({"games": 82}), 40.0)
+
+    def test_performance_fields(self):
+        """Test HAV-F performance fields are collected from every sport"""
+        self.assertEqual(registry.performance_fields(), ("war", "wpa", "epa", "total_yards", "total_tds"))
+        self.assertEqual(formula_fields(registry.get("NCAA").spec["metrics"]["nil_trust_score"]),
+                         ["stars", "position"])
+
+    def test_roster_scores(self):
+        """Test metric scores with a composite"""
+        scores = registry.score("NFL", {"position": "QB"})
+        self.assertEqual(scores["champion_readiness"], 70)
+        self.assertEqual(scores["composite_score"], round(70 * 0.4 + 85 * 0.35 + 80 * 0.25, 1))
+
+        nba = registry.score("NBA", {"points_per_game": 20, "games_played": 82, "field_goal_pct": 0.5})
+        self.assertEqual(nba["champion_readiness"], 95.0)
+        self.assertNotIn("composite_score", nba)
+
+        with self.assertRaises(KeyError):
+            registry.score("HS-FB", {})
+
+    def test_register_sport(self):
+        """Test new leagues plug in without touching scoring code"""
+        custom = ScoringRegistry()
+        custom.register("NHL", {"performance": {"terms": [50, ("plus_minus", 2)], "clamp": (0, 100), "round": 1}})
+        self.assertIn("NHL", custom.performance_sports())
+        self.assertEqual(custom.performance_scorers["NHL"]({"plus_minus": 10}), 70)
+        self.assertNotIn("NHL", registry.performance_sports())
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_kernel_matches_closure(self):
+        """Test array kernels match the scalar closures"""
+        for sport in registry.performance_sports():
+            scorer = registry.get(sport)
+            columns = {field: np.linspace(-50, 3000, 257) for field in scorer.performance_fields}
+            expected = [scorer.performance({field: float(columns[field][i]) for field in columns})
+                        for i in range(257)]
+            self.assertEqual(scorer.performance_kernel(columns).tolist(), expected)
+
+        with self.assertRaises(ValueError):
+            compile_kernel(registry.get("NFL").spec["metrics"]["champion_readiness"])
+
+
+if __name__ == '__main__':
+    unittest.main()
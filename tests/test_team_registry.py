@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Team registry index tests for Blaze Intelligence
+"""
+
+import unittest
+import sys
+import os
+import dataclasses
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.team_registry import team_index, TeamRegistry, LEAGUE_TEAMS
+
+
+class TestTeamIndex(unittest.TestCase):
+    """Test alias, ID and cross-league lookups"""
+
+    def test_every_team_indexed(self):
+        """Test each league table entry has a canonical ID"""
+        self.assertEqual(len(team_index.teams), sum(len(table) for table in LEAGUE_TEAMS.values()))
+        for team in team_index.teams:
+            self.assertIs(team_index.by_id(team.team_id), team)
+            self.assertIs(team_index.by_id(team.slug), team)
+
+    def test_aliases(self):
+        """Test codes, abbreviations and names resolve to one team"""
+        self.assertEqual(team_index.get('MLB', 'AZ').team_id, 'MLB-ARI')
+        self.assertEqual(team_index.get('nba', 'SAS').team_id, 'NBA-SA')
+        self.assertEqual(team_index.resolve('St. Louis Cardinals').team_id, 'MLB-STL')
+        self.assertEqual(team_index.resolve('longhorns').slug, 'ncaa_tex')
+        self.assertEqual(team_index.by_nba_id('1610612763').code, 'MEM')
+        self.assertEqual(team_index.team_id('NFL', 'XYZ'), 'NFL-XYZ')
+
+    def test_ambiguous_alias(self):
+        """Test an alias shared across leagues only resolves with a league"""
+        self.assertEqual({team.team_id for team in team_index.matches('Cardinals')}, {'MLB-STL', 'NFL-ARI'})
+        self.assertIsNone(team_index.resolve('Cardinals'))
+        self.assertEqual(team_index.resolve('Cardinals', 'NFL').team_id, 'NFL-ARI')
+
+    def test_market_and_division(self):
+        """Test cross-league market and division lookups"""
+        memphis = {team.team_id for team in team_index.in_market('Memphis')}
+        self.assertIn('NBA-MEM', memphis)
+        self.assertEqual(len(team_index.in_division('NFL', 'AFC South')), 4)
+        self.assertEqual(len(team_index.in_league('NBA')), 30)
+
+    def test_immutable(self):
+        """Test teams and lookup tables cannot be modified"""
+        team = team_index.get('MLB', 'STL')
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            team.name = 'Renamed'
+        with self.assertRaises(TypeError):
+            team_index._by_alias['stl'] = ()
+
+    def test_registry_uses_index(self):
+        """Test TeamRegistry lookups go through the shared index"""
+        self.assertEqual(TeamRegistry().get_team_info('NBA', 'NOP')['name'], 'New Orleans Pelicans')
+
+
+if __name__ == '__main__':
+    unittest.main()